@@ -1,5 +1,5 @@
 from pathlib import Path
-from decouple import config
+from decouple import Csv, config
 
 BASE_DIR = Path(__file__).resolve().parent.parent
 
@@ -93,6 +93,60 @@ REST_FRAMEWORK = {
     "EXCEPTION_HANDLER": "utils.exceptions.custom_exception_handler",
 }
 
+# REDIS_URL 이 있으면 워커 간 공유 캐시, 없으면 워커별 로컬 메모리 캐시
+REDIS_URL = config("REDIS_URL", default="")
+
+if REDIS_URL:
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.redis.RedisCache",
+            "LOCATION": REDIS_URL,
+        }
+    }
+else:
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        }
+    }
+
+# 실시간 알림 브로커. 워커가 여러 개면 redis 여야 다른 워커의 연결에도 전달된다
+NOTIFICATION_BROKER = config(
+    "NOTIFICATION_BROKER", default="redis" if REDIS_URL else "local"
+)
+NOTIFICATION_BROKER_URL = config("NOTIFICATION_BROKER_URL", default=REDIS_URL)
+NOTIFICATION_STREAM_KEEPALIVE = config(
+    "NOTIFICATION_STREAM_KEEPALIVE", default=15, cast=int
+)
+# 스트림 연결용 1회용 티켓 유효 시간 (초). 워커가 여러 개면 REDIS_URL 캐시가 있어야 한다
+NOTIFICATION_STREAM_TICKET_TTL = config(
+    "NOTIFICATION_STREAM_TICKET_TTL", default=30, cast=int
+)
+# 읽은 알림 보존 정책 (prune_notifications 커맨드)
+# 읽은 지 이 기간이 지난 알림을 알림 테이블에서 뺀다. 0 이면 끈다
+NOTIFICATION_RETENTION_DAYS = config(
+    "NOTIFICATION_RETENTION_DAYS", default=90, cast=int
+)
+# archive: NotificationArchive 로 옮김, delete: 바로 삭제
+NOTIFICATION_RETENTION_MODE = config(
+    "NOTIFICATION_RETENTION_MODE", default="archive"
+)
+NOTIFICATION_RETENTION_BATCH_SIZE = config(
+    "NOTIFICATION_RETENTION_BATCH_SIZE", default=1000, cast=int
+)
+# 새 게시글 카테고리 구독 알림(notifications/fanout.py)을 한 번에 넣는 개수
+NOTIFICATION_FANOUT_BATCH_SIZE = config(
+    "NOTIFICATION_FANOUT_BATCH_SIZE", default=1000, cast=int
+)
+
+# 게시글 목록/상세 응답 캐시 (버전 키로 무효화하므로 TTL 은 메모리 회수용)
+# 버전 키가 워커/관리 커맨드 사이에 공유돼야 하므로 기본값은 REDIS_URL 이 있을 때만 켠다
+POST_CACHE_ENABLED = config(
+    "POST_CACHE_ENABLED", default=bool(REDIS_URL), cast=bool
+)
+POST_CACHE_ALIAS = config("POST_CACHE_ALIAS", default="default")
+POST_CACHE_TIMEOUT = config("POST_CACHE_TIMEOUT", default=600, cast=int)
+
 EMAIL_BACKEND = "django.core.mail.backends.smtp.EmailBackend"
 EMAIL_HOST = "smtp.gmail.com"
 EMAIL_PORT = 587
@@ -107,6 +161,68 @@ AWS_SECRET_ACCESS_KEY = config("AWS_SECRET_ACCESS_KEY")
 AWS_STORAGE_BUCKET_NAME = config("AWS_STORAGE_BUCKET_NAME")
 AWS_S3_REGION_NAME = config("AWS_S3_REGION_NAME", default="ap-northeast-2")
 AWS_S3_IMAGE_FOLDER = config("AWS_S3_IMAGE_FOLDER", default="uploads/")
+# MinIO 같은 로컬 S3 호환 서버를 쓸 때만 지정
+AWS_S3_ENDPOINT_URL = config("AWS_S3_ENDPOINT_URL", default=None)
+# utils/storage.py 공유 S3 클라이언트 커넥션 풀 크기 / 느린 작업 경고 기준
+AWS_S3_MAX_POOL_CONNECTIONS = config(
+    "AWS_S3_MAX_POOL_CONNECTIONS", default=20, cast=int
+)
+STORAGE_SLOW_OPERATION_MS = config("STORAGE_SLOW_OPERATION_MS", default=500, cast=int)
+
+# 일괄 업로드: 이 크기(byte)를 넘는 파일은 멀티파트로 올린다 (S3 part 최소 5MB)
+S3_MULTIPART_THRESHOLD = config(
+    "S3_MULTIPART_THRESHOLD", default=8 * 1024 * 1024, cast=int
+)
+S3_MULTIPART_PART_SIZE = config(
+    "S3_MULTIPART_PART_SIZE", default=8 * 1024 * 1024, cast=int
+)
+MAX_UPLOAD_BATCH_SIZE = config("MAX_UPLOAD_BATCH_SIZE", default=20, cast=int)
+# 업로드 이미지 정책. presigned POST 조건과 업로드 후 비동기 검증에 같이 쓴다
+ALLOWED_IMAGE_CONTENT_TYPES = config(
+    "ALLOWED_IMAGE_CONTENT_TYPES", default="image/jpeg,image/png", cast=Csv()
+)
+PROFILE_IMAGE_MAX_SIZE = config(
+    "PROFILE_IMAGE_MAX_SIZE", default=5 * 1024 * 1024, cast=int
+)
+POST_IMAGE_MAX_SIZE = config("POST_IMAGE_MAX_SIZE", default=50 * 1024 * 1024, cast=int)
+S3_QUARANTINE_PREFIX = config("S3_QUARANTINE_PREFIX", default="quarantine/")
+
+# utils/tasks.py 백그라운드 작업 (이미지 변환 등)
+BACKGROUND_TASKS_ASYNC = config("BACKGROUND_TASKS_ASYNC", default=True, cast=bool)
+BACKGROUND_TASK_WORKERS = config("BACKGROUND_TASK_WORKERS", default=4, cast=int)
+# 테스트에서는 백그라운드 작업을 동기로 실행한다
+TEST_RUNNER = "backend.test_runner.TestRunner"
+
+# 주소 → 좌표 변환 (테스트/로컬에서는 utils.geocoding.OfflineGeocoder)
+GEOCODER_BACKEND = config("GEOCODER_BACKEND", default="utils.geocoding.KakaoGeocoder")
+KAKAO_REST_API_KEY = config("KAKAO_REST_API_KEY", default="")
+
+# 제휴 매칭 인덱스를 DB 에서 다시 읽는 주기 (초)
+MATCHING_INDEX_TTL = config("MATCHING_INDEX_TTL", default=300, cast=int)
+
+# 게시글 수명 주기 (expire_posts / archive_posts 커맨드)
+# 이 기간 동안 수정되지 않은 활성 게시글을 비활성화한다. 0 이면 끈다
+POST_EXPIRY_DAYS = config("POST_EXPIRY_DAYS", default=90, cast=int)
+# 비활성 게시글을 보관 테이블로 옮기기까지의 기간
+POST_ARCHIVE_AFTER_DAYS = config("POST_ARCHIVE_AFTER_DAYS", default=180, cast=int)
+POST_LIFECYCLE_BATCH_SIZE = config("POST_LIFECYCLE_BATCH_SIZE", default=500, cast=int)
+
+# 마이페이지 스냅샷(stores/dashboard.py)을 놓친 갱신에 대비해 통째로 다시 만드는 주기 (초)
+DASHBOARD_SNAPSHOT_MAX_AGE = config(
+    "DASHBOARD_SNAPSHOT_MAX_AGE", default=3600, cast=int
+)
+
+# 게시글 조회수 write-behind 카운터 (posts/popularity.py)
+# 이 주기(초)마다, 또는 쌓인 조회가 임계치를 넘으면 DB 에 모아서 반영한다
+POST_VIEW_FLUSH_INTERVAL = config("POST_VIEW_FLUSH_INTERVAL", default=5, cast=float)
+POST_VIEW_FLUSH_THRESHOLD = config("POST_VIEW_FLUSH_THRESHOLD", default=1000, cast=int)
+# 인기 점수에서 조회 한 번의 가중치가 절반이 되는 시간 (초)
+POST_POPULARITY_HALF_LIFE = config(
+    "POST_POPULARITY_HALF_LIFE", default=2 * 24 * 60 * 60, cast=int
+)
+
+# 카테고리 id 레지스트리(posts/categories.py)를 DB 에서 다시 읽는 주기 (초)
+CATEGORY_REGISTRY_TTL = config("CATEGORY_REGISTRY_TTL", default=60, cast=int)
 
 CORS_ALLOW_ALL_ORIGINS = False
 CORS_ALLOWED_ORIGINS = [
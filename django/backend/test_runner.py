@@ -0,0 +1,13 @@
+from django.conf import settings
+from django.test.runner import DiscoverRunner
+
+
+class TestRunner(DiscoverRunner):
+    """
+    on_commit 뒤 백그라운드 작업(지오코딩, fan-out, 이미지 처리)을 그 자리에서 실행한다.
+    스레드 풀은 자기 DB 커넥션을 써서 TestCase 트랜잭션 안의 행을 보지 못한다.
+    """
+
+    def setup_test_environment(self, **kwargs):
+        super().setup_test_environment(**kwargs)
+        settings.BACKGROUND_TASKS_ASYNC = False
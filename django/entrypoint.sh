@@ -6,5 +6,5 @@ python manage.py migrate --noinput
 echo "🧹 Collecting static files..."
 python manage.py collectstatic --noinput
 
-echo "🚀 Starting Gunicorn server..."
-exec gunicorn backend.wsgi:application --bind 0.0.0.0:8000
\ No newline at end of file
+echo "🚀 Starting Gunicorn server (ASGI)..."
+exec gunicorn backend.asgi:application -k uvicorn.workers.UvicornWorker --bind 0.0.0.0:8000
\ No newline at end of file
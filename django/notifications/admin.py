@@ -1,5 +1,5 @@
 from django.contrib import admin
-from .models import PartnerRequest, Notification
+from .models import PartnerRequest, Notification, NotificationCounter
 
 
 @admin.register(PartnerRequest)
@@ -14,3 +14,9 @@ class NotificationAdmin(admin.ModelAdmin):
     list_display = ("id", "user", "sender", "post", "is_read", "created_at")
     search_fields = ("user__username", "sender__username", "message")
     list_filter = ("is_read", "created_at")
+
+
+@admin.register(NotificationCounter)
+class NotificationCounterAdmin(admin.ModelAdmin):
+    list_display = ("user", "unread_count")
+    search_fields = ("user__username",)
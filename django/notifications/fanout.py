@@ -0,0 +1,91 @@
+import logging
+from functools import partial
+
+from django.conf import settings
+from django.db import transaction
+
+from .models import Notification
+from .realtime import publish
+from .serializers import NotificationSerializer
+from .unread import get_unread_counts, increment_unread_counts
+from posts.models import Post
+from stores.models import Store
+
+logger = logging.getLogger(__name__)
+
+
+def category_match_message(post):
+    return f"관심 카테고리에 새 제휴 게시글이 올라왔습니다: {post.title}"[:255]
+
+
+def matching_store_owners(post):
+    """
+    게시글의 partnership_categories 중 하나라도 가게 카테고리로 가진 가게 주인들.
+    Store.category_ids 의 GIN 인덱스로 겹침(&&) 조건을 찾는다.
+    """
+    return (
+        Store.objects.filter(category_ids__overlap=post.partnership_category_ids)
+        .exclude(owner_id=post.author_id)
+        .order_by("pk")
+    )
+
+
+def push_notifications(notifications):
+    unread_counts = get_unread_counts([n.user_id for n in notifications])
+    for notification, data in zip(
+        notifications, NotificationSerializer(notifications, many=True).data
+    ):
+        publish(notification.user_id, "notification", data)
+        publish(
+            notification.user_id,
+            "unread_count",
+            {"unread_count": unread_counts.get(notification.user_id, 0)},
+        )
+
+
+def fan_out_post(post_id, batch_size=None):
+    """
+    새 게시글을 관심 카테고리가 겹치는 가게 주인들에게 알린다.
+    가게를 pk 순서로 batch_size 만큼 끊어 읽고, 배치마다 짧은 트랜잭션에서
+    bulk_create 와 카운터 UPDATE 를 한다. 반환값은 만든 알림 수.
+    """
+    batch_size = batch_size or settings.NOTIFICATION_FANOUT_BATCH_SIZE
+    post = (
+        Post.objects.select_related("author")
+        .only("id", "title", "author", "partnership_category_ids", "is_active")
+        .filter(pk=post_id)
+        .first()
+    )
+    if post is None or not post.is_active or not post.partnership_category_ids:
+        return 0
+
+    stores = matching_store_owners(post)
+    message = category_match_message(post)
+
+    created = 0
+    last_id = 0
+    while True:
+        rows = list(
+            stores.filter(pk__gt=last_id).values_list("pk", "owner_id")[:batch_size]
+        )
+        if not rows:
+            break
+        last_id = rows[-1][0]
+
+        with transaction.atomic():
+            notifications = Notification.objects.bulk_create(
+                Notification(
+                    user_id=owner_id,
+                    sender=post.author,
+                    post=post,
+                    kind="category_match",
+                    message=message,
+                )
+                for _, owner_id in rows
+            )
+            increment_unread_counts(owner_id for _, owner_id in rows)
+            transaction.on_commit(partial(push_notifications, notifications))
+        created += len(notifications)
+
+    logger.info("게시글 %s 카테고리 알림 %s건 생성", post_id, created)
+    return created
@@ -0,0 +1,81 @@
+import time
+import uuid
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+from django.test.utils import CaptureQueriesContext
+
+from notifications.fanout import fan_out_post
+from posts.models import PartnershipCategory, Post
+from stores.models import Store
+
+User = get_user_model()
+
+
+class Command(BaseCommand):
+    help = "가게 수/배치 크기별 카테고리 알림 fan-out 처리량을 측정합니다. (모든 변경은 롤백)"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--stores", type=int, default=5000)
+        parser.add_argument(
+            "--batch-sizes", type=int, nargs="+", default=[100, 500, 1000, 2000]
+        )
+
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            suffix = uuid.uuid4().hex[:8]
+            category = PartnershipCategory.objects.create(name=f"bench_{suffix}")
+            author = User.objects.create_user(
+                f"bench_{suffix}", "bench", f"bench_{suffix}@example.com", "000"
+            )
+            owners = User.objects.bulk_create(
+                User(
+                    username=f"bench_{suffix}_{i}",
+                    name="bench",
+                    email=f"bench_{suffix}_{i}@example.com",
+                    phone_number="000",
+                )
+                for i in range(options["stores"])
+            )
+            Store.objects.bulk_create(
+                (
+                    Store(
+                        owner=owner,
+                        name="bench",
+                        address="bench",
+                        phone_number="000",
+                        available_time="00:00-24:00",
+                        category_ids=[category.pk],
+                    )
+                    for owner in owners
+                ),
+                batch_size=1000,
+            )
+
+            for batch_size in options["batch_sizes"]:
+                post = Post.objects.create(
+                    author=author,
+                    title="benchmark",
+                    store_name="benchmark",
+                    description="benchmark",
+                    address="benchmark",
+                    phone_number="000",
+                    available_time="00:00-24:00",
+                    partnership_category_ids=[category.pk],
+                )
+
+                started = time.perf_counter()
+                with CaptureQueriesContext(connection) as queries:
+                    created = fan_out_post(post.pk, batch_size=batch_size)
+                elapsed = time.perf_counter() - started
+
+                self.stdout.write(
+                    f"batch_size={batch_size:>5}  "
+                    f"notifications={created:>6}  "
+                    f"queries={len(queries):>4}  "
+                    f"ms={elapsed * 1000:.1f}  "
+                    f"per_sec={created / elapsed:.0f}"
+                )
+
+            transaction.set_rollback(True)
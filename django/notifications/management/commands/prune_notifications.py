@@ -0,0 +1,115 @@
+import time
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.utils import timezone
+
+from notifications.models import Notification, NotificationArchive
+
+ARCHIVED_NOTIFICATION_FIELDS = [
+    "user_id",
+    "sender_id",
+    "post_id",
+    "partner_request_id",
+    "kind",
+    "message",
+    "created_at",
+]
+
+
+class Command(BaseCommand):
+    help = (
+        "NOTIFICATION_RETENTION_DAYS 가 지난 읽은 알림을 배치로 보관 테이블에 옮기거나 "
+        "삭제합니다. 안읽은 알림은 건드리지 않습니다."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--days", type=int, default=settings.NOTIFICATION_RETENTION_DAYS
+        )
+        parser.add_argument(
+            "--mode",
+            choices=["archive", "delete"],
+            default=settings.NOTIFICATION_RETENTION_MODE,
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=settings.NOTIFICATION_RETENTION_BATCH_SIZE,
+        )
+        parser.add_argument(
+            "--sleep",
+            type=float,
+            default=0,
+            help="배치 사이에 쉬는 시간 (초). 운영 중 부하를 더 낮추고 싶을 때",
+        )
+        parser.add_argument(
+            "--dry-run", action="store_true", help="정리할 알림 수만 셉니다"
+        )
+
+    def handle(self, *args, **options):
+        if options["days"] <= 0:
+            self.stdout.write("알림 보존 정책이 꺼져 있습니다.")
+            return
+        if options["batch_size"] <= 0:
+            raise CommandError("--batch-size 는 1 이상이어야 합니다.")
+
+        cutoff = timezone.now() - timedelta(days=options["days"])
+        expired = Notification.objects.filter(is_read=True, created_at__lt=cutoff)
+
+        pruned = 0
+        last_id = 0
+        while True:
+            # id 는 created_at 과 같은 순서로 늘어나므로 pk 인덱스로 오래된 것부터 끊어 읽는다
+            notification_ids = list(
+                expired.filter(pk__gt=last_id)
+                .order_by("id")
+                .values_list("id", flat=True)[: options["batch_size"]]
+            )
+            if not notification_ids:
+                break
+            last_id = notification_ids[-1]
+
+            if options["dry_run"]:
+                pruned += len(notification_ids)
+                continue
+
+            pruned += self.prune(expired, notification_ids, options["mode"])
+            if options["sleep"]:
+                time.sleep(options["sleep"])
+
+        verb = "정리 대상" if options["dry_run"] else f"정리 완료 ({options['mode']})"
+        self.stdout.write(self.style.SUCCESS(f"{pruned}개 알림 {verb}"))
+
+    @transaction.atomic
+    def prune(self, expired, notification_ids, mode):
+        # 배치만큼만 짧게 잠근다. 그 사이 안읽음으로 바뀐 알림은 조건에서 걸러지고,
+        # 다른 트랜잭션이 잡고 있는 행은 기다리지 않고 다음 실행으로 넘긴다
+        notifications = list(
+            expired.filter(pk__in=notification_ids).select_for_update(skip_locked=True)
+        )
+        if not notifications:
+            return 0
+
+        if mode == "archive":
+            NotificationArchive.objects.bulk_create(
+                (
+                    NotificationArchive(
+                        id=notification.pk,
+                        **{
+                            field: getattr(notification, field)
+                            for field in ARCHIVED_NOTIFICATION_FIELDS
+                        },
+                    )
+                    for notification in notifications
+                ),
+                ignore_conflicts=True,
+            )
+
+        # 읽은 알림만 지우므로 안읽은 알림 카운터는 바뀌지 않는다
+        Notification.objects.filter(
+            pk__in=[notification.pk for notification in notifications]
+        ).delete()
+        return len(notifications)
@@ -0,0 +1,71 @@
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import Count
+
+from notifications.models import Notification, NotificationCounter
+
+
+class Command(BaseCommand):
+    help = (
+        "안읽은 알림 카운터를 실제 Notification 개수와 비교해 어긋난 값을 바로잡습니다."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=1000)
+        parser.add_argument(
+            "--dry-run", action="store_true", help="고치지 않고 어긋난 수만 셉니다."
+        )
+
+    def handle(self, *args, **options):
+        users = get_user_model().objects.order_by("pk")
+
+        fixed = 0
+        last_id = 0
+        while True:
+            user_ids = list(
+                users.filter(pk__gt=last_id).values_list("pk", flat=True)[
+                    : options["batch_size"]
+                ]
+            )
+            if not user_ids:
+                break
+            last_id = user_ids[-1]
+
+            with transaction.atomic():
+                # 카운터 행을 먼저 잠그고 센다. 그 사이 들어온 알림의 +1 은 잠금이 풀린 뒤에
+                # 반영되므로 여기서 덮어쓴 값 위에 정확히 더해진다.
+                stored = dict(
+                    NotificationCounter.objects.select_for_update()
+                    .filter(pk__in=user_ids)
+                    .values_list("user_id", "unread_count")
+                )
+                actual = dict(
+                    Notification.objects.filter(user_id__in=user_ids, is_read=False)
+                    .order_by()
+                    .values("user_id")
+                    .annotate(unread_count=Count("id"))
+                    .values_list("user_id", "unread_count")
+                )
+                drifted = [
+                    NotificationCounter(
+                        user_id=user_id, unread_count=actual.get(user_id, 0)
+                    )
+                    for user_id in user_ids
+                    if stored.get(user_id, 0) != actual.get(user_id, 0)
+                ]
+                fixed += len(drifted)
+                if drifted and not options["dry_run"]:
+                    NotificationCounter.objects.bulk_create(
+                        drifted,
+                        update_conflicts=True,
+                        unique_fields=["user"],
+                        update_fields=["unread_count"],
+                    )
+
+        if options["dry_run"]:
+            self.stdout.write(f"카운터가 어긋난 사용자 {fixed}명 (dry-run)")
+        else:
+            self.stdout.write(
+                self.style.SUCCESS(f"{fixed}명의 안읽은 알림 카운터를 바로잡았습니다.")
+            )
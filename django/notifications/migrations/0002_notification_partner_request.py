@@ -0,0 +1,51 @@
+# Generated by Django 5.2.1 on 2025-07-03 11:05
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import OuterRef, Subquery
+
+
+def link_partner_requests(apps, schema_editor):
+    Notification = apps.get_model("notifications", "Notification")
+    PartnerRequest = apps.get_model("notifications", "PartnerRequest")
+
+    # (sender, post) 는 PartnerRequest 에서 unique 이므로 알림 하나에 요청은 최대 하나
+    Notification.objects.filter(partner_request__isnull=True).update(
+        partner_request=Subquery(
+            PartnerRequest.objects.filter(
+                sender=OuterRef("sender"), post=OuterRef("post")
+            ).values("pk")[:1]
+        )
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("notifications", "0001_initial"),
+        ("posts", "0012_posttrend"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="notification",
+            name="partner_request",
+            field=models.ForeignKey(
+                blank=True,
+                null=True,
+                on_delete=django.db.models.deletion.SET_NULL,
+                related_name="notifications",
+                to="notifications.partnerrequest",
+            ),
+        ),
+        migrations.RunPython(link_partner_requests, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name="notification",
+            index=models.Index(
+                fields=["user", "-created_at", "-id"],
+                name="notification_user_created_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,54 @@
+# Generated by Django 5.2.1 on 2025-07-03 15:40
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Count
+
+
+def backfill_unread_counters(apps, schema_editor):
+    Notification = apps.get_model("notifications", "Notification")
+    NotificationCounter = apps.get_model("notifications", "NotificationCounter")
+
+    rows = (
+        Notification.objects.filter(is_read=False)
+        .order_by()
+        .values("user_id")
+        .annotate(unread_count=Count("id"))
+        .values_list("user_id", "unread_count")
+    )
+    NotificationCounter.objects.bulk_create(
+        (
+            NotificationCounter(user_id=user_id, unread_count=unread_count)
+            for user_id, unread_count in rows.iterator(chunk_size=2000)
+        ),
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("notifications", "0002_notification_partner_request"),
+        ("users", "0004_userimage_status"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="NotificationCounter",
+            fields=[
+                (
+                    "user",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="notification_counter",
+                        serialize=False,
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+                ("unread_count", models.PositiveIntegerField(default=0)),
+            ],
+        ),
+        migrations.RunPython(backfill_unread_counters, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,24 @@
+# Generated by Django 5.2.1 on 2025-07-04 10:22
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("notifications", "0003_notificationcounter"),
+        ("posts", "0012_posttrend"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="notification",
+            index=models.Index(
+                condition=models.Q(("is_read", False)),
+                fields=["user"],
+                name="notification_user_unread_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,25 @@
+# Generated by Django 5.2.1 on 2025-07-05 14:03
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("notifications", "0004_notification_user_unread_idx"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="notification",
+            name="kind",
+            field=models.CharField(
+                choices=[
+                    ("partner_request", "제휴 요청"),
+                    ("category_match", "관심 카테고리 새 게시글"),
+                ],
+                default="partner_request",
+                max_length=20,
+            ),
+        ),
+    ]
@@ -16,6 +16,11 @@ class PartnerRequest(models.Model):
 
 
 class Notification(models.Model):
+    KIND_CHOICES = (
+        ("partner_request", "제휴 요청"),
+        ("category_match", "관심 카테고리 새 게시글"),
+    )
+
     user = models.ForeignKey(
         settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name="notifications"
     )
@@ -27,9 +32,82 @@ class Notification(models.Model):
         related_name="sent_notifications",
     )
     post = models.ForeignKey("posts.Post", on_delete=models.CASCADE)
+    partner_request = models.ForeignKey(
+        PartnerRequest,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="notifications",
+    )
+    kind = models.CharField(
+        max_length=20, choices=KIND_CHOICES, default="partner_request"
+    )
     message = models.CharField(max_length=255)
     is_read = models.BooleanField(default=False)
     created_at = models.DateTimeField(auto_now_add=True)
 
+    class Meta:
+        indexes = [
+            # 알림 목록 cursor 페이지네이션 (user 별 최신순)
+            models.Index(
+                fields=["user", "-created_at", "-id"],
+                name="notification_user_created_idx",
+            ),
+            # 안읽은 알림만 담는 작은 인덱스 (모두 읽음 처리, 카운터 재계산)
+            models.Index(
+                fields=["user"],
+                name="notification_user_unread_idx",
+                condition=models.Q(is_read=False),
+            ),
+        ]
+
     def __str__(self):
         return f"To {self.user} - {self.message[:20]}"
+
+
+class NotificationCounter(models.Model):
+    """
+    사용자별 안읽은 알림 수. Notification 을 만들거나 읽음/삭제할 때 같은 트랜잭션 안에서
+    함께 갱신해서, 안읽은 수 조회가 COUNT 대신 pk 한 번 읽기로 끝나게 한다.
+    """
+
+    user = models.OneToOneField(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name="notification_counter",
+    )
+    unread_count = models.PositiveIntegerField(default=0)
+
+    def __str__(self):
+        return f"{self.user} - 안읽은 알림 {self.unread_count}"
+
+
+class NotificationArchive(models.Model):
+    """
+    보존 기간이 지난 읽은 알림 보관 테이블 (prune_notifications 커맨드).
+    원래 Notification id 를 그대로 쓰고, 게시글/요청은 나중에 지워질 수 있어 id 로만 남긴다.
+    """
+
+    id = models.BigIntegerField(primary_key=True)
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name="+"
+    )
+    sender_id = models.BigIntegerField(null=True, blank=True)
+    post_id = models.BigIntegerField()
+    partner_request_id = models.BigIntegerField(null=True, blank=True)
+    kind = models.CharField(max_length=20, choices=Notification.KIND_CHOICES)
+    message = models.CharField(max_length=255)
+    created_at = models.DateTimeField()
+    archived_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        indexes = [
+            models.Index(
+                fields=["user", "-created_at"],
+                name="notif_archive_user_created_idx",
+            ),
+        ]
+
+    def __str__(self):
+        return f"Archived to {self.user_id} - {self.message[:20]}"
@@ -0,0 +1,146 @@
+import asyncio
+import json
+import logging
+import threading
+import time
+from collections import defaultdict
+
+from django.conf import settings
+from django.utils.module_loading import import_string
+
+logger = logging.getLogger(__name__)
+
+SUBSCRIBER_QUEUE_SIZE = 100
+
+
+class Subscription:
+    """
+    연결 하나가 받는 이벤트 큐. publish 는 다른 스레드(요청 스레드, on_commit 콜백)에서
+    불리므로 구독한 이벤트 루프로 넘겨서 넣는다.
+    """
+
+    def __init__(self, user_id):
+        self.user_id = user_id
+        self._loop = asyncio.get_running_loop()
+        self._queue = asyncio.Queue(maxsize=SUBSCRIBER_QUEUE_SIZE)
+
+    def put(self, event):
+        self._loop.call_soon_threadsafe(self._offer, event)
+
+    def _offer(self, event):
+        # 못 따라오는 연결은 오래된 이벤트부터 버린다 (unread_count 는 최신 값만 의미가 있음)
+        if self._queue.full():
+            self._queue.get_nowait()
+        self._queue.put_nowait(event)
+
+    async def get(self, timeout):
+        return await asyncio.wait_for(self._queue.get(), timeout)
+
+
+class LocalBroker:
+    """프로세스 안에서만 전달하는 브로커. 워커가 하나일 때 (개발, 테스트) 쓴다."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._subscriptions = defaultdict(set)
+
+    def subscribe(self, user_id):
+        subscription = Subscription(user_id)
+        with self._lock:
+            self._subscriptions[user_id].add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription):
+        with self._lock:
+            subscriptions = self._subscriptions.get(subscription.user_id)
+            if subscriptions is None:
+                return
+            subscriptions.discard(subscription)
+            if not subscriptions:
+                del self._subscriptions[subscription.user_id]
+
+    def publish(self, user_id, event):
+        self.deliver(user_id, event)
+
+    def deliver(self, user_id, event):
+        with self._lock:
+            subscriptions = list(self._subscriptions.get(user_id, ()))
+        for subscription in subscriptions:
+            subscription.put(event)
+
+
+class RedisBroker(LocalBroker):
+    """
+    Redis pub/sub 로 워커 간에 이벤트를 돌리는 브로커.
+    publish 는 Redis 로 보내고, 워커마다 리스너 스레드 하나가 패턴 구독으로 받아
+    이 워커에 붙어 있는 연결에만 나눠 준다. 연결 수와 상관없이 Redis 연결은 워커당 두 개.
+    """
+
+    channel_prefix = "notifications:user:"
+
+    def __init__(self, url):
+        super().__init__()
+        import redis
+
+        self._redis = redis.Redis.from_url(url)
+        self._listener = None
+        self._listener_lock = threading.Lock()
+
+    def subscribe(self, user_id):
+        self._ensure_listener()
+        return super().subscribe(user_id)
+
+    def publish(self, user_id, event):
+        self._redis.publish(f"{self.channel_prefix}{user_id}", json.dumps(event))
+
+    def _ensure_listener(self):
+        with self._listener_lock:
+            if self._listener is None or not self._listener.is_alive():
+                self._listener = threading.Thread(
+                    target=self._listen, name="notification-broker", daemon=True
+                )
+                self._listener.start()
+
+    def _listen(self):
+        while True:
+            try:
+                pubsub = self._redis.pubsub(ignore_subscribe_messages=True)
+                pubsub.psubscribe(f"{self.channel_prefix}*")
+                for message in pubsub.listen():
+                    channel = message["channel"].decode()
+                    user_id = int(channel[len(self.channel_prefix) :])
+                    self.deliver(user_id, json.loads(message["data"]))
+            except Exception:
+                logger.exception("알림 브로커 구독이 끊겼습니다. 다시 연결합니다.")
+                time.sleep(1)
+
+
+_broker = None
+_broker_lock = threading.Lock()
+
+
+def get_broker():
+    """
+    NOTIFICATION_BROKER 설정으로 브로커를 만든다.
+    "local", "redis" 또는 url 하나를 받는 브로커 클래스의 dotted path.
+    """
+    global _broker
+    if _broker is None:
+        with _broker_lock:
+            if _broker is None:
+                backend = settings.NOTIFICATION_BROKER
+                if backend == "local":
+                    _broker = LocalBroker()
+                elif backend == "redis":
+                    _broker = RedisBroker(settings.NOTIFICATION_BROKER_URL)
+                else:
+                    _broker = import_string(backend)(settings.NOTIFICATION_BROKER_URL)
+    return _broker
+
+
+def publish(user_id, event_type, data):
+    try:
+        get_broker().publish(user_id, {"type": event_type, "data": data})
+    except Exception:
+        # 실시간 전달이 실패해도 알림 자체는 저장되어 있으므로 요청은 실패시키지 않는다
+        logger.exception("알림 이벤트 전송 실패: user %s", user_id)
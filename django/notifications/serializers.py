@@ -1,5 +1,12 @@
+from django.db import transaction
 from rest_framework import serializers
 from notifications.models import PartnerRequest, Notification
+from posts.trending import record_partner_request
+from utils.pagination import InvalidCursor, cursor_fields, decode_cursor
+
+MAX_MARK_READ_IDS = 500
+# 알림 목록 정렬. 목록 cursor 와 cursor 일괄 읽음 처리가 같은 키를 쓴다
+NOTIFICATION_ORDERING = ("-created_at", "-id")
 
 
 class PartnerRequestSerializer(serializers.ModelSerializer):
@@ -22,13 +29,20 @@ class PartnerRequestSerializer(serializers.ModelSerializer):
         post = validated_data["post"]
         message = validated_data["message"]
 
-        partner_request = PartnerRequest.objects.create(
-            sender=request.user, **validated_data
-        )
-
-        Notification.objects.create(
-            user=post.author, sender=request.user, post=post, message=message
-        )
+        # 알림과 안읽은 알림 카운터가 한 트랜잭션에서 같이 반영되도록 묶는다
+        with transaction.atomic():
+            partner_request = PartnerRequest.objects.create(
+                sender=request.user, **validated_data
+            )
+            record_partner_request(post.pk)
+
+            Notification.objects.create(
+                user=post.author,
+                sender=request.user,
+                post=post,
+                partner_request=partner_request,
+                message=message,
+            )
 
         return partner_request
 
@@ -42,6 +56,7 @@ class NotificationSerializer(serializers.ModelSerializer):
         fields = [
             "id",
             "sender_username",
+            "kind",
             "message",
             "post",
             "request_message",
@@ -50,13 +65,10 @@ class NotificationSerializer(serializers.ModelSerializer):
         ]
 
     def get_request_message(self, obj):
-        try:
-            partner_request = PartnerRequest.objects.get(
-                sender=obj.sender, post=obj.post
-            )
-            return partner_request.message
-        except PartnerRequest.DoesNotExist:
+        # partner_request 는 목록에서 select_related 로 함께 가져온다
+        if obj.partner_request is None:
             return None
+        return obj.partner_request.message
 
 
 class SentPartnerRequestSerializer(serializers.ModelSerializer):
@@ -68,8 +80,36 @@ class SentPartnerRequestSerializer(serializers.ModelSerializer):
         fields = ["id", "post", "post_title", "post_thumbnail", "message", "created_at"]
 
     def get_post_thumbnail(self, obj):
-        thumbnail = obj.post.images.filter(is_thumbnail=True).first()
-        if thumbnail:
-            return thumbnail.image_url
-        fallback = obj.post.images.first()
-        return fallback.image_url if fallback else None
+        return obj.post.thumbnail_url or None
+
+
+class NotificationMarkReadSerializer(serializers.Serializer):
+    """ids, cursor, all 중 하나만 받는다. cursor 는 알림 목록의 next 값."""
+
+    ids = serializers.ListField(
+        child=serializers.IntegerField(min_value=1),
+        required=False,
+        allow_empty=False,
+        max_length=MAX_MARK_READ_IDS,
+    )
+    cursor = serializers.CharField(required=False)
+    all = serializers.BooleanField(required=False)
+
+    def validate_cursor(self, value):
+        try:
+            return decode_cursor(
+                value,
+                cursor_fields(Notification.objects.all(), NOTIFICATION_ORDERING),
+            )
+        except InvalidCursor:
+            raise serializers.ValidationError("유효하지 않은 cursor 값입니다.")
+
+    def validate(self, attrs):
+        modes = [key for key in ("ids", "cursor") if key in attrs]
+        if attrs.get("all"):
+            modes.append("all")
+        if len(modes) != 1:
+            raise serializers.ValidationError(
+                {"message": "ids, cursor, all 중 하나만 보내주세요."}
+            )
+        return attrs
@@ -0,0 +1,67 @@
+from functools import partial
+
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+
+from .fanout import fan_out_post
+from .models import Notification
+from .realtime import publish
+from .serializers import NotificationSerializer
+from .unread import adjust_unread_count, push_unread_count
+from posts.events import row_signals_muted
+from posts.models import Post
+from utils.tasks import run_on_commit
+
+
+def push_notification(notification):
+    publish(
+        notification.user_id,
+        "notification",
+        NotificationSerializer(notification).data,
+    )
+    push_unread_count(notification.user_id)
+
+
+@receiver(pre_save, sender=Notification)
+def track_read_state(sender, instance, update_fields=None, **kwargs):
+    instance._unread_delta = 0
+    if instance._state.adding:
+        instance._unread_delta = 0 if instance.is_read else 1
+        return
+    if update_fields is not None and "is_read" not in update_fields:
+        return
+
+    was_read = (
+        sender.objects.filter(pk=instance.pk).values_list("is_read", flat=True).first()
+    )
+    if was_read is not None and was_read != instance.is_read:
+        instance._unread_delta = -1 if instance.is_read else 1
+
+
+@receiver(post_save, sender=Notification)
+def notification_saved(sender, instance, created, **kwargs):
+    delta = getattr(instance, "_unread_delta", 0)
+    adjust_unread_count(instance.user_id, delta)
+
+    if created:
+        transaction.on_commit(partial(push_notification, instance))
+    elif delta:
+        transaction.on_commit(partial(push_unread_count, instance.user_id))
+
+
+@receiver(post_delete, sender=Notification)
+def notification_deleted(sender, instance, **kwargs):
+    # 여러 알림을 한꺼번에 지우는 쪽이 recount_unread_counts 로 카운터를 맞춘다
+    if row_signals_muted():
+        return
+    if not instance.is_read:
+        adjust_unread_count(instance.user_id, -1)
+        transaction.on_commit(partial(push_unread_count, instance.user_id))
+
+
+@receiver(post_save, sender=Post)
+def fan_out_new_post(sender, instance, created, **kwargs):
+    # 관심 카테고리 알림은 수천 건이 될 수 있어 요청 밖에서 만든다
+    if created:
+        run_on_commit(fan_out_post, instance.pk)
@@ -1 +1,276 @@
-# Create your tests here.
+import asyncio
+import json
+from datetime import timedelta
+from io import StringIO
+
+from asgiref.sync import sync_to_async
+from django.core.cache import cache
+from django.core.management import call_command
+from django.db import connection
+from django.test import AsyncClient, TestCase
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from notifications.models import (
+    Notification,
+    NotificationArchive,
+    NotificationCounter,
+    PartnerRequest,
+)
+from notifications.unread import count_unread, increment_unread_counts
+from posts.testing import make_post, make_user, raw_cursor
+
+
+class NotificationBulkReadTests(TestCase):
+    def setUp(self):
+        self.user = make_user("owner")
+        self.post = make_post(self.user)
+        self.notifications = [
+            Notification.objects.create(
+                user=self.user, post=self.post, message=f"알림 {i}"
+            )
+            for i in range(5)
+        ]
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def mark_read(self, data):
+        return self.client.post("/api/v1/notifications/mark-read/", data, format="json")
+
+    def test_tampered_cursor_returns_400(self):
+        now = timezone.now().isoformat()
+        for cursor in (
+            raw_cursor(["abc", 1]),
+            raw_cursor([now, "x"]),
+            raw_cursor([1, 2]),
+            raw_cursor([now, None]),
+            "%%%",
+        ):
+            response = self.mark_read({"cursor": cursor})
+            self.assertEqual(response.status_code, 400, cursor)
+        self.assertFalse(Notification.objects.filter(is_read=True).exists())
+
+    def test_cursor_marks_up_to_list_position(self):
+        page = self.client.get("/api/v1/notifications/", {"page_size": 2}).json()
+        response = self.mark_read({"cursor": page["data"]["next"]})
+
+        self.assertEqual(
+            response.json()["data"], {"marked_count": 2, "unread_count": 3}
+        )
+        self.assertEqual(
+            set(Notification.objects.filter(is_read=True).values_list("id", flat=True)),
+            {item["id"] for item in page["data"]["results"]},
+        )
+
+
+class NotificationListTests(TestCase):
+    def setUp(self):
+        self.owner = make_user("owner")
+        self.post = make_post(self.owner)
+        self.sender_count = 0
+        self.client = APIClient()
+        self.client.force_authenticate(self.owner)
+
+    def add_partner_requests(self, count):
+        for _ in range(count):
+            self.sender_count += 1
+            sender = make_user(f"sender{self.sender_count}")
+            partner_request = PartnerRequest.objects.create(
+                sender=sender, post=self.post, message=f"제휴 요청 {self.sender_count}"
+            )
+            Notification.objects.create(
+                user=self.owner,
+                sender=sender,
+                post=self.post,
+                partner_request=partner_request,
+                kind="partner_request",
+                message="제휴 요청이 왔습니다.",
+            )
+
+    def list_notifications(self):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get("/api/v1/notifications/")
+        self.assertEqual(response.status_code, 200)
+        return response.json()["data"]["results"], len(queries)
+
+    def test_query_count_does_not_grow_with_page_length(self):
+        self.add_partner_requests(2)
+        results, few = self.list_notifications()
+        self.assertEqual(len(results), 2)
+
+        self.add_partner_requests(30)
+        results, many = self.list_notifications()
+        self.assertEqual(len(results), 20)
+
+        self.assertEqual(few, many)
+        self.assertEqual(results[0]["request_message"], "제휴 요청 32")
+        self.assertEqual(results[0]["sender_username"], "sender32")
+
+
+class UnreadCounterTests(TestCase):
+    def setUp(self):
+        self.sender = make_user("sender")
+        self.post = make_post(self.sender)
+
+    def unread_count(self, user):
+        return NotificationCounter.objects.get(pk=user.pk).unread_count
+
+    def test_counter_follows_create_read_and_delete(self):
+        user = make_user("owner")
+        notifications = [
+            Notification.objects.create(user=user, post=self.post, message=f"알림 {i}")
+            for i in range(3)
+        ]
+        self.assertEqual(self.unread_count(user), 3)
+
+        notifications[0].is_read = True
+        notifications[0].save()
+        notifications[1].delete()
+        # 읽은 알림을 지워도 안읽은 수는 그대로
+        notifications[0].delete()
+
+        self.assertEqual(self.unread_count(user), 1)
+        self.assertEqual(self.unread_count(user), count_unread(user.pk))
+
+    def test_increment_bumps_existing_and_seeds_missing_counters(self):
+        counted = make_user("counted")
+        uncounted = make_user("uncounted")
+        Notification.objects.create(user=counted, post=self.post, message="알림")
+        # bulk_create 는 signals 를 타지 않아 카운터가 없다
+        Notification.objects.bulk_create(
+            Notification(user=uncounted, post=self.post, message="알림")
+            for _ in range(2)
+        )
+        self.assertFalse(NotificationCounter.objects.filter(pk=uncounted.pk).exists())
+
+        Notification.objects.bulk_create(
+            Notification(user=user, post=self.post, message="새 알림")
+            for user in (counted, uncounted)
+        )
+        with self.assertNumQueries(1):
+            increment_unread_counts([counted.pk, uncounted.pk, counted.pk])
+
+        for user in (counted, uncounted):
+            self.assertEqual(self.unread_count(user), count_unread(user.pk))
+        self.assertEqual(self.unread_count(counted), 2)
+        self.assertEqual(self.unread_count(uncounted), 3)
+
+
+class PruneNotificationsTests(TestCase):
+    def setUp(self):
+        self.user = make_user("owner")
+        self.post = make_post(self.user)
+
+    def make_notifications(self, count, is_read, days_ago):
+        notifications = [
+            Notification.objects.create(
+                user=self.user, post=self.post, message="알림", is_read=is_read
+            )
+            for _ in range(count)
+        ]
+        Notification.objects.filter(pk__in=[n.pk for n in notifications]).update(
+            created_at=timezone.now() - timedelta(days=days_ago)
+        )
+        return notifications
+
+    def prune(self, mode):
+        call_command(
+            "prune_notifications",
+            days=90,
+            mode=mode,
+            batch_size=2,
+            stdout=StringIO(),
+        )
+
+    def test_archives_only_old_read_notifications_in_batches(self):
+        old_read = self.make_notifications(5, is_read=True, days_ago=120)
+        old_unread = self.make_notifications(1, is_read=False, days_ago=120)
+        recent_read = self.make_notifications(1, is_read=True, days_ago=1)
+
+        self.prune("archive")
+
+        self.assertEqual(
+            set(NotificationArchive.objects.values_list("id", flat=True)),
+            {n.pk for n in old_read},
+        )
+        self.assertEqual(
+            set(Notification.objects.values_list("id", flat=True)),
+            {n.pk for n in old_unread + recent_read},
+        )
+        self.assertEqual(
+            NotificationCounter.objects.get(pk=self.user.pk).unread_count, 1
+        )
+
+    def test_delete_mode_does_not_archive(self):
+        self.make_notifications(3, is_read=True, days_ago=120)
+
+        self.prune("delete")
+
+        self.assertFalse(Notification.objects.exists())
+        self.assertFalse(NotificationArchive.objects.exists())
+
+
+class NotificationStreamTests(TestCase):
+    url = "/api/v1/notifications/stream/"
+
+    def setUp(self):
+        cache.clear()
+        self.user = make_user("owner")
+        self.token = str(RefreshToken.for_user(self.user).access_token)
+
+    def issue_ticket(self):
+        client = APIClient()
+        client.credentials(HTTP_AUTHORIZATION=f"Bearer {self.token}")
+        response = client.post("/api/v1/notifications/stream-ticket/")
+        self.assertEqual(response.status_code, 200)
+        return response.json()["data"]["ticket"]
+
+    async def read_initial_events(self, response):
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response["Content-Type"], "text/event-stream")
+        chunks = response.streaming_content.__aiter__()
+        retry = await asyncio.wait_for(chunks.__anext__(), 3)
+        unread = await asyncio.wait_for(chunks.__anext__(), 3)
+
+        # 다음 이벤트를 기다리는 중에 끊어야 구독이 정리된다
+        pending = asyncio.ensure_future(chunks.__anext__())
+        await asyncio.sleep(0.05)
+        pending.cancel()
+        try:
+            await pending
+        except asyncio.CancelledError:
+            pass
+        return retry, unread
+
+    def test_ticket_requires_authentication(self):
+        response = APIClient().post("/api/v1/notifications/stream-ticket/")
+        self.assertEqual(response.status_code, 401)
+
+    async def test_rejects_missing_credentials_and_query_token(self):
+        client = AsyncClient()
+        for params in ({}, {"token": self.token}, {"ticket": "forged"}):
+            response = await client.get(self.url, params)
+            self.assertEqual(response.status_code, 401, params)
+            self.assertFalse(json.loads(response.content)["success"])
+
+    async def test_ticket_streams_initial_events_once(self):
+        ticket = await sync_to_async(self.issue_ticket)()
+        client = AsyncClient()
+
+        response = await client.get(self.url, {"ticket": ticket})
+        retry, unread = await self.read_initial_events(response)
+        self.assertTrue(retry.startswith(b"retry: "))
+        self.assertEqual(unread, b'event: unread_count\ndata: {"unread_count": 0}\n\n')
+
+        # 같은 티켓으로는 다시 연결할 수 없다
+        response = await client.get(self.url, {"ticket": ticket})
+        self.assertEqual(response.status_code, 401)
+
+    async def test_authorization_header_still_works(self):
+        response = await AsyncClient().get(
+            self.url, headers={"Authorization": f"Bearer {self.token}"}
+        )
+        retry, unread = await self.read_initial_events(response)
+        self.assertIn(b'"unread_count": 0', unread)
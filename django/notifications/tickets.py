@@ -0,0 +1,31 @@
+import secrets
+
+from django.conf import settings
+from django.core.cache import cache
+
+TICKET_KEY = "notifications:stream-ticket:{}"
+
+
+def issue_stream_ticket(user_id, expires_at):
+    """
+    알림 스트림 연결용 1회용 티켓을 만든다.
+    EventSource 는 헤더를 붙일 수 없어서, access token 대신 접근 로그에 남아도
+    곧 쓸모 없어지는 티켓을 쿼리로 넘긴다.
+    """
+    ticket = secrets.token_urlsafe(32)
+    cache.set(
+        TICKET_KEY.format(ticket),
+        {"user_id": user_id, "expires_at": expires_at},
+        settings.NOTIFICATION_STREAM_TICKET_TTL,
+    )
+    return ticket
+
+
+def redeem_stream_ticket(ticket):
+    """티켓을 쓰고 지운다. (user_id, 스트림 만료 시각) 또는 None."""
+    key = TICKET_KEY.format(ticket)
+    data = cache.get(key)
+    # 동시에 같은 티켓으로 들어와도 delete 에 성공한 한 쪽만 연결한다
+    if data is None or not cache.delete(key):
+        return None
+    return data["user_id"], data["expires_at"]
@@ -0,0 +1,119 @@
+from functools import partial
+
+from django.db import connection, transaction
+from django.db.models import Count, F, OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce, Greatest
+
+from .models import Notification, NotificationCounter
+from .realtime import publish
+
+
+def count_unread(user_id):
+    return Notification.objects.filter(user_id=user_id, is_read=False).count()
+
+
+def get_unread_count(user_id):
+    unread_count = (
+        NotificationCounter.objects.filter(pk=user_id)
+        .values_list("unread_count", flat=True)
+        .first()
+    )
+    return unread_count or 0
+
+
+def get_unread_counts(user_ids):
+    return dict(
+        NotificationCounter.objects.filter(pk__in=list(user_ids)).values_list(
+            "pk", "unread_count"
+        )
+    )
+
+
+def push_unread_count(user_id):
+    publish(user_id, "unread_count", {"unread_count": get_unread_count(user_id)})
+
+
+def push_unread_counts(user_ids):
+    for user_id, unread_count in get_unread_counts(user_ids).items():
+        publish(user_id, "unread_count", {"unread_count": unread_count})
+
+
+def adjust_unread_count(user_id, delta):
+    """호출한 쪽의 트랜잭션 안에서 카운터를 delta 만큼 옮긴다."""
+    if not delta:
+        return
+    updated = NotificationCounter.objects.filter(pk=user_id).update(
+        unread_count=Greatest(F("unread_count") + delta, Value(0))
+    )
+    if not updated:
+        # 카운터가 아직 없으면 실제 개수로 만든다 (이번 변경은 이미 반영되어 있음)
+        NotificationCounter.objects.bulk_create(
+            [NotificationCounter(user_id=user_id, unread_count=count_unread(user_id))],
+            update_conflicts=True,
+            unique_fields=["user"],
+            update_fields=["unread_count"],
+        )
+
+
+def increment_unread_counts(user_ids):
+    """
+    bulk_create 로 사용자마다 안읽은 알림을 하나씩 넣은 뒤 호출한다.
+    signals 를 타지 않는 대신 INSERT ... ON CONFLICT 한 문장으로 카운터를 올린다.
+    카운터가 있던 사용자는 1 올리고, 없던 사용자는 실제 안읽은 수(이번 알림 포함)로 만든다.
+    존재 확인과 쓰기가 한 문장이라 그 사이에 다른 쪽이 카운터를 만들어도 증가분을 잃지 않는다.
+    """
+    # 같은 순서로 잠가서 동시에 도는 fan-out 끼리 교착되지 않게 한다
+    user_ids = sorted(set(user_ids))
+    if not user_ids:
+        return
+
+    qn = connection.ops.quote_name
+    counter_table = qn(NotificationCounter._meta.db_table)
+    notification_table = qn(Notification._meta.db_table)
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"""
+            INSERT INTO {counter_table} (user_id, unread_count)
+            SELECT u.id, (
+                SELECT COUNT(*) FROM {notification_table} n
+                WHERE n.user_id = u.id AND NOT n.is_read
+            )
+            FROM unnest(%s::bigint[]) AS u(id)
+            ON CONFLICT (user_id)
+            DO UPDATE SET unread_count = {counter_table}.unread_count + 1
+            """,
+            [user_ids],
+        )
+
+
+def recount_unread_counts(user_ids):
+    """
+    signals 없이 알림을 지운 뒤 (게시글 보관 등) 호출한다.
+    사용자들의 카운터를 실제 안읽은 알림 수로 UPDATE 한 번에 맞춘다.
+    """
+    unread = (
+        Notification.objects.filter(user_id=OuterRef("pk"), is_read=False)
+        .order_by()
+        .values("user_id")
+        .annotate(unread_count=Count("id"))
+        .values("unread_count")
+    )
+    NotificationCounter.objects.filter(pk__in=list(user_ids)).update(
+        unread_count=Coalesce(Subquery(unread), 0)
+    )
+
+
+def mark_notifications_read(user_id, notifications):
+    """
+    notifications 중 안읽은 것만 읽음 처리하고 그만큼 카운터를 줄인다.
+    queryset.update() 는 signals 를 타지 않으므로 카운터와 실시간 푸시를 여기서 직접 처리한다.
+    반환값은 실제로 읽음 처리된 개수.
+    """
+    with transaction.atomic():
+        marked = notifications.filter(user_id=user_id, is_read=False).update(
+            is_read=True
+        )
+        adjust_unread_count(user_id, -marked)
+    if marked:
+        transaction.on_commit(partial(push_unread_count, user_id))
+    return marked
@@ -3,8 +3,10 @@ from .views import (
     PartnerRequestCreateView,
     NotificationListView,
     NotificationReadView,
+    NotificationBulkReadView,
     NotificationUnreadCountView,
-    MyPageView,
+    NotificationStreamView,
+    NotificationStreamTicketView,
 )
 
 urlpatterns = [
@@ -15,10 +17,18 @@ urlpatterns = [
     ),
     path("", NotificationListView.as_view(), name="notification-list"),
     path("<int:pk>/read/", NotificationReadView.as_view(), name="notification-read"),
+    path(
+        "mark-read/", NotificationBulkReadView.as_view(), name="notification-mark-read"
+    ),
     path(
         "unread-count/",
         NotificationUnreadCountView.as_view(),
         name="notification-unread-count",
     ),
-    path("mypage/", MyPageView.as_view(), name="my-page"),
+    path(
+        "stream-ticket/",
+        NotificationStreamTicketView.as_view(),
+        name="notification-stream-ticket",
+    ),
+    path("stream/", NotificationStreamView.as_view(), name="notification-stream"),
 ]
@@ -1,18 +1,32 @@
+import asyncio
+import json
+import time
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.http import JsonResponse, StreamingHttpResponse
+from django.views import View
 from rest_framework import generics
+from rest_framework.exceptions import AuthenticationFailed
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import InvalidToken
 from rest_framework.permissions import IsAuthenticated
 from .models import PartnerRequest, Notification
-from stores.models import Store
-from posts.models import Post
 from .serializers import (
     PartnerRequestSerializer,
     NotificationSerializer,
-    SentPartnerRequestSerializer,
+    NotificationMarkReadSerializer,
+    NOTIFICATION_ORDERING,
 )
 from rest_framework import views
 from django.shortcuts import get_object_or_404
+from utils.pagination import paginate_by_cursor, keyset_filter, InvalidCursor
 from utils.response import success_response, error_response
-from stores.serializers import StoreSerializer
-from posts.serializers import PostSerializer
+from .realtime import get_broker
+from .tickets import issue_stream_ticket, redeem_stream_ticket
+from .unread import get_unread_count, mark_notifications_read
+
+STREAM_RETRY_MS = 5000
 
 
 class PartnerRequestCreateView(generics.CreateAPIView):
@@ -25,53 +39,171 @@ class NotificationListView(views.APIView):
     permission_classes = [IsAuthenticated]
 
     def get(self, request):
-        notifications = Notification.objects.filter(user=request.user).order_by(
-            "-created_at"
+        notifications = Notification.objects.filter(user=request.user).select_related(
+            "sender", "partner_request"
+        )
+        try:
+            page, next_cursor = paginate_by_cursor(
+                notifications, request, NOTIFICATION_ORDERING
+            )
+        except InvalidCursor:
+            return error_response("유효하지 않은 cursor 값입니다.")
+
+        return success_response(
+            "알림 목록을 불러왔습니다.",
+            {
+                "results": NotificationSerializer(page, many=True).data,
+                "next": next_cursor,
+            },
         )
-        serializer = NotificationSerializer(notifications, many=True)
-        return success_response("알림 목록을 불러왔습니다.", serializer.data)
 
 
 class NotificationReadView(views.APIView):
     permission_classes = [IsAuthenticated]
 
     def patch(self, request, pk):
-        notification = get_object_or_404(Notification, pk=pk, user=request.user)
-        notification.is_read = True
-        notification.save()
+        marked = mark_notifications_read(
+            request.user.pk, Notification.objects.filter(pk=pk)
+        )
+        if not marked:
+            # 이미 읽었거나 남의 알림인 경우만 한 번 더 확인한다
+            get_object_or_404(Notification, pk=pk, user=request.user)
         return success_response("알림을 읽음 처리했습니다.")
 
 
-class NotificationUnreadCountView(views.APIView):
+class NotificationBulkReadView(views.APIView):
+    """
+    여러 알림을 UPDATE 한 번으로 읽음 처리한다.
+    - ids: 지정한 알림들
+    - cursor: 목록에서 받은 cursor 위치까지 (그보다 최신 알림 포함)
+    - all: 전부
+    """
+
     permission_classes = [IsAuthenticated]
 
-    def get(self, request):
-        count = Notification.objects.filter(user=request.user, is_read=False).count()
+    def post(self, request):
+        serializer = NotificationMarkReadSerializer(data=request.data)
+        if not serializer.is_valid():
+            return error_response("입력값 오류", serializer.errors)
+
+        data = serializer.validated_data
+        notifications = Notification.objects.all()
+        if "ids" in data:
+            notifications = notifications.filter(pk__in=data["ids"])
+        elif "cursor" in data:
+            # keyset_filter 는 cursor "다음" 행이므로 그 나머지가 cursor 까지의 알림
+            notifications = notifications.exclude(
+                keyset_filter(NOTIFICATION_ORDERING, data["cursor"])
+            )
+
+        marked = mark_notifications_read(request.user.pk, notifications)
         return success_response(
-            "안읽은 알림 수를 불러왔습니다.", {"unread_count": count}
+            "알림을 읽음 처리했습니다.",
+            {
+                "marked_count": marked,
+                "unread_count": get_unread_count(request.user.pk),
+            },
         )
 
 
-class MyPageView(views.APIView):
+class NotificationUnreadCountView(views.APIView):
     permission_classes = [IsAuthenticated]
 
     def get(self, request):
-        try:
-            store = Store.objects.get(owner=request.user)
-        except Store.DoesNotExist:
-            return error_response("가게 정보가 없습니다.", status=404)
+        return success_response(
+            "안읽은 알림 수를 불러왔습니다.",
+            {"unread_count": get_unread_count(request.user.pk)},
+        )
 
-        posts = Post.objects.filter(author=request.user)
-        post_data = PostSerializer(posts, many=True).data
 
-        sent_requests = PartnerRequest.objects.filter(sender=request.user)
-        sent_data = SentPartnerRequestSerializer(sent_requests, many=True).data
+def format_event(event_type, data):
+    return f"event: {event_type}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
+
+
+async def notification_events(user_id, expires_at):
+    broker = get_broker()
+    subscription = broker.subscribe(user_id)
+    try:
+        # 구독부터 한 뒤 개수를 세야 그 사이에 생긴 알림을 놓치지 않는다
+        unread_count = await sync_to_async(get_unread_count)(user_id)
+        yield f"retry: {STREAM_RETRY_MS}\n\n"
+        yield format_event("unread_count", {"unread_count": unread_count})
+
+        while True:
+            remaining = expires_at - time.time()
+            if remaining <= 0:
+                # 토큰이 만료되면 끊는다. 클라이언트는 토큰을 갱신해서 다시 연결한다
+                break
+            timeout = min(settings.NOTIFICATION_STREAM_KEEPALIVE, remaining)
+            try:
+                event = await subscription.get(timeout)
+            except asyncio.TimeoutError:
+                yield ": keepalive\n\n"
+                continue
+            yield format_event(event["type"], event["data"])
+    finally:
+        broker.unsubscribe(subscription)
+
+
+class NotificationStreamTicketView(views.APIView):
+    permission_classes = [IsAuthenticated]
 
+    def post(self, request):
+        # 스트림은 access token 이 만료될 때 끊기도록 토큰 만료 시각을 같이 넘긴다
+        ticket = issue_stream_ticket(request.user.pk, request.auth["exp"])
         return success_response(
-            "마이페이지 정보를 불러왔습니다.",
+            "스트림 티켓 발급 성공",
             {
-                "store": StoreSerializer(store).data,
-                "posts": post_data,
-                "sent_requests": sent_data,
+                "ticket": ticket,
+                "expires_in": settings.NOTIFICATION_STREAM_TICKET_TTL,
             },
         )
+
+
+class NotificationStreamView(View):
+    """
+    새 알림과 안읽은 알림 수를 Server-Sent Events 로 밀어준다.
+    EventSource 는 헤더를 붙일 수 없으므로 stream-ticket/ 에서 받은 1회용 티켓을
+    ?ticket= 으로 받는다. access token 을 쿼리에 넣으면 접근 로그에 남아서 받지 않는다.
+    ASGI 서버에서 돌아야 연결 하나가 워커를 붙잡지 않는다.
+    """
+
+    async def get(self, request):
+        try:
+            user_id, expires_at = await self.authenticate(request)
+        except (InvalidToken, AuthenticationFailed):
+            return JsonResponse(
+                {
+                    "success": False,
+                    "message": "유효한 티켓이나 토큰이 필요합니다.",
+                    "data": {},
+                },
+                status=401,
+            )
+
+        response = StreamingHttpResponse(
+            notification_events(user_id, expires_at),
+            content_type="text/event-stream",
+        )
+        response["Cache-Control"] = "no-cache"
+        # nginx 가 응답을 모았다가 보내지 않도록
+        response["X-Accel-Buffering"] = "no"
+        return response
+
+    async def authenticate(self, request):
+        ticket = request.GET.get("ticket")
+        if ticket:
+            redeemed = await sync_to_async(redeem_stream_ticket)(ticket)
+            if redeemed is None:
+                raise InvalidToken()
+            return redeemed
+
+        # 헤더를 붙일 수 있는 클라이언트는 Authorization: Bearer 로 바로 연결한다
+        authentication = JWTAuthentication()
+        header = authentication.get_header(request)
+        raw_token = header and authentication.get_raw_token(header)
+        if not raw_token:
+            raise InvalidToken()
+        token = authentication.get_validated_token(raw_token)
+        user = await sync_to_async(authentication.get_user)(token)
+        return user.pk, token["exp"]
@@ -0,0 +1,81 @@
+import hashlib
+import time
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db import transaction
+
+VERSION_KEY = "posts:content-version"
+# 조회수 반영(flush_post_views)은 인기순 목록만 바꾸므로 버전을 따로 둔다
+POPULARITY_VERSION_KEY = "posts:popularity-version"
+
+
+def _cache():
+    return caches[settings.POST_CACHE_ALIAS]
+
+
+def _get_version(key):
+    cache = _cache()
+    version = cache.get(key)
+    if version is None:
+        # 버전 키가 밀려났을 때 예전 번호를 재사용하지 않도록 시각으로 시작한다
+        cache.add(key, time.time_ns(), timeout=None)
+        version = cache.get(key)
+    return version
+
+
+def _bump_version(key):
+    if not settings.POST_CACHE_ENABLED:
+        return
+    cache = _cache()
+    try:
+        cache.incr(key)
+    except ValueError:
+        cache.add(key, time.time_ns(), timeout=None)
+
+
+def get_content_version():
+    return _get_version(VERSION_KEY)
+
+
+def bump_content_version():
+    _bump_version(VERSION_KEY)
+
+
+def bump_popularity_version():
+    _bump_version(POPULARITY_VERSION_KEY)
+
+
+def schedule_content_version_bump():
+    """트랜잭션이 커밋된 뒤에 버전을 올려야 커밋 전 데이터가 새 버전으로 캐시되지 않는다."""
+    transaction.on_commit(bump_content_version)
+
+
+def response_cache_key(request, popular=False):
+    """
+    응답 캐시 키. 캐시가 꺼져 있으면 None 을 돌려주고, get/set 은 None 키를 무시한다.
+    popular=True 면 조회수 반영 때마다 바뀌는 인기순 버전도 키에 넣는다.
+    """
+    if not settings.POST_CACHE_ENABLED:
+        return None
+    query = "&".join(
+        f"{key}={value}"
+        for key, values in sorted(request.query_params.lists())
+        for value in values
+    )
+    digest = hashlib.md5(f"{request.path}?{query}".encode()).hexdigest()
+    version = get_content_version()
+    if popular:
+        version = f"{version}.{_get_version(POPULARITY_VERSION_KEY)}"
+    return f"posts:v{version}:{digest}"
+
+
+def get_cached_response(key):
+    if key is None:
+        return None
+    return _cache().get(key)
+
+
+def set_cached_response(key, data):
+    if key is not None:
+        _cache().set(key, data, settings.POST_CACHE_TIMEOUT)
@@ -0,0 +1,55 @@
+from rest_framework import serializers
+
+from .categories import category_registry
+
+# 피드 카드에 필요한 컬럼만 .values() 로 읽는다
+CARD_FIELDS = (
+    "id",
+    "title",
+    "store_name",
+    "created_at",
+    "thumbnail_url",
+    "store_category_ids",
+    "partnership_category_ids",
+)
+
+_datetime_field = serializers.DateTimeField()
+
+
+def card_queryset(queryset, *extra_fields):
+    """PostDetailSerializer 대신 피드 카드용 dict 행을 만드는 쿼리."""
+    return queryset.values(*CARD_FIELDS, *extra_fields)
+
+
+def build_cards(rows):
+    rows = list(rows)
+    category_ids = {
+        category_id
+        for row in rows
+        for field in ("store_category_ids", "partnership_category_ids")
+        for category_id in row[field]
+    }
+    category_names = {
+        pk: category.name
+        for pk, category in category_registry.get_many(category_ids).items()
+    }
+    return [
+        {
+            "id": row["id"],
+            "title": row["title"],
+            "store_name": row["store_name"],
+            "thumbnail_url": row["thumbnail_url"] or None,
+            "store_categories": [
+                category_names[i]
+                for i in row["store_category_ids"]
+                if i in category_names
+            ],
+            "partnership_categories": [
+                category_names[i]
+                for i in row["partnership_category_ids"]
+                if i in category_names
+            ],
+            "created_at": _datetime_field.to_representation(row["created_at"]),
+        }
+        for row in rows
+    ]
@@ -0,0 +1,59 @@
+import threading
+import time
+
+from django.conf import settings
+
+from .models import PartnershipCategory
+
+
+class CategoryRegistry:
+    """
+    PartnershipCategory 전체를 프로세스 메모리에 들고 있는 id → 인스턴스 레지스트리.
+    카테고리는 수가 적고 거의 바뀌지 않아 통째로 읽는다.
+
+    같은 프로세스의 변경은 signals 에서 커밋 후 바로 비우고,
+    다른 워커의 변경은 CATEGORY_REGISTRY_TTL 초 안에 반영된다.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._categories = None
+        self._loaded_at = None
+
+    def _load(self):
+        categories = {
+            category.pk: category for category in PartnershipCategory.objects.all()
+        }
+        with self._lock:
+            self._categories = categories
+            self._loaded_at = time.monotonic()
+        return categories
+
+    def invalidate(self):
+        with self._lock:
+            self._categories = None
+            self._loaded_at = None
+
+    def get_many(self, ids):
+        """
+        ids 중 존재하는 카테고리를 {id: 인스턴스} 로 돌려준다.
+        없는 id 가 있으면 다른 워커에서 막 추가됐을 수 있어 한 번만 다시 읽는다.
+        """
+        with self._lock:
+            categories, loaded_at = self._categories, self._loaded_at
+
+        reloaded = False
+        if (
+            categories is None
+            or time.monotonic() - loaded_at > settings.CATEGORY_REGISTRY_TTL
+        ):
+            categories = self._load()
+            reloaded = True
+
+        if not reloaded and any(pk not in categories for pk in ids):
+            categories = self._load()
+
+        return {pk: categories[pk] for pk in ids if pk in categories}
+
+
+category_registry = CategoryRegistry()
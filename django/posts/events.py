@@ -0,0 +1,26 @@
+import threading
+from contextlib import contextmanager
+
+from django.dispatch import Signal
+
+# queryset.update() 처럼 post_save 없이 게시글 행이 바뀌었을 때 보낸다. (post_ids=...)
+posts_bulk_updated = Signal()
+
+_row_signals = threading.local()
+
+
+@contextmanager
+def muting_row_signals():
+    """
+    배치 작업이 queryset.delete() 로 여러 행을 지우는 동안 행마다 도는 후처리
+    (썸네일, 캐시 버전, 대시보드 갱신)를 끈다. 후처리는 호출한 쪽이 배치마다 한 번 한다.
+    """
+    _row_signals.muted = True
+    try:
+        yield
+    finally:
+        _row_signals.muted = False
+
+
+def row_signals_muted():
+    return getattr(_row_signals, "muted", False)
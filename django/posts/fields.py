@@ -0,0 +1,53 @@
+from rest_framework import serializers
+from rest_framework.relations import MANY_RELATION_KWARGS, ManyRelatedField
+
+from .categories import category_registry
+from .models import PartnershipCategory
+
+
+class CategoryPrimaryKeyField(serializers.PrimaryKeyRelatedField):
+    """
+    PrimaryKeyRelatedField 와 입출력은 같지만 id 를 category_registry 에서 찾는다.
+    many=True 면 id 목록 전체를 한 번에 확인해서 id 수와 상관없이 쿼리가 0~1번이다.
+    """
+
+    def __init__(self, **kwargs):
+        kwargs.setdefault("queryset", PartnershipCategory.objects.all())
+        super().__init__(**kwargs)
+
+    @classmethod
+    def many_init(cls, *args, **kwargs):
+        list_kwargs = {"child_relation": cls(*args, **kwargs)}
+        for key in kwargs:
+            if key in MANY_RELATION_KWARGS:
+                list_kwargs[key] = kwargs[key]
+        return CategoryManyRelatedField(**list_kwargs)
+
+    def to_internal_value(self, data):
+        return self.resolve_many([data])[0]
+
+    def resolve_many(self, data):
+        ids = []
+        for item in data:
+            try:
+                if isinstance(item, bool):
+                    raise TypeError
+                ids.append(int(item))
+            except (TypeError, ValueError):
+                self.fail("incorrect_type", data_type=type(item).__name__)
+
+        categories = category_registry.get_many(ids)
+        for pk in ids:
+            if pk not in categories:
+                self.fail("does_not_exist", pk_value=pk)
+        return [categories[pk] for pk in ids]
+
+
+class CategoryManyRelatedField(ManyRelatedField):
+    def to_internal_value(self, data):
+        if isinstance(data, str) or not hasattr(data, "__iter__"):
+            self.fail("not_a_list", input_type=type(data).__name__)
+        if not self.allow_empty and len(data) == 0:
+            self.fail("empty")
+
+        return self.child_relation.resolve_many(data)
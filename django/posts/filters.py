@@ -0,0 +1,72 @@
+from django.db.models import F, Q
+from django.db.models.functions import ASin, Cos, Power, Radians, Sin, Sqrt
+
+from utils import geohash
+
+EARTH_RADIUS_METERS = 6_371_000
+METERS_PER_DEGREE = 111_320
+
+CATEGORY_FILTERS = {
+    "store_category": "store_category_ids",
+    "partnership_category": "partnership_category_ids",
+}
+
+# any: 하나라도 포함(OR), all: 모두 포함(AND)
+CATEGORY_MATCH_LOOKUPS = {"any": "overlap", "all": "contains"}
+
+
+# 카테고리 pk 는 PostgreSQL integer 라 범위를 넘는 값은 쿼리에서 DataError 가 난다
+MAX_CATEGORY_ID = 2**31 - 1
+
+
+def _parse_ids(query_params, param):
+    ids = []
+    for value in query_params.getlist(param):
+        for v in value.split(","):
+            if not v.strip():
+                continue
+            category_id = int(v)
+            if not 1 <= category_id <= MAX_CATEGORY_ID:
+                raise ValueError(v)
+            ids.append(category_id)
+    return ids
+
+
+def filter_posts_by_categories(queryset, query_params):
+    """
+    ?store_category=1,2&partnership_category=3&category_match=all
+    잘못된 값이면 ValueError 를 던진다.
+    """
+    match = query_params.get("category_match", "any")
+    if match not in CATEGORY_MATCH_LOOKUPS:
+        raise ValueError(match)
+    lookup = CATEGORY_MATCH_LOOKUPS[match]
+
+    for param, array_field in CATEGORY_FILTERS.items():
+        ids = _parse_ids(query_params, param)
+        if ids:
+            queryset = queryset.filter(**{f"{array_field}__{lookup}": ids})
+    return queryset
+
+
+def filter_posts_near(queryset, latitude, longitude, radius):
+    """
+    (latitude, longitude) 에서 radius(m) 이내 게시글.
+    geohash prefix 인덱스로 주변 3x3 셀만 고른 뒤 haversine 거리로 정확히 거른다.
+    """
+    precision = geohash.precision_for_radius(radius, latitude)
+    cells = Q()
+    for cell in geohash.neighbors(latitude, longitude, precision):
+        cells |= Q(geohash__startswith=cell)
+
+    lat1, lng1 = Radians(F("latitude")), Radians(F("longitude"))
+    lat2, lng2 = Radians(latitude), Radians(longitude)
+    haversine = Power(Sin((lat1 - lat2) / 2), 2) + Cos(lat1) * Cos(lat2) * Power(
+        Sin((lng1 - lng2) / 2), 2
+    )
+
+    return (
+        queryset.filter(cells)
+        .annotate(distance=2 * EARTH_RADIUS_METERS * ASin(Sqrt(haversine)))
+        .filter(distance__lte=radius)
+    )
@@ -0,0 +1,138 @@
+from datetime import timedelta
+from functools import partial
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import Exists, OuterRef
+from django.utils import timezone
+
+from notifications.models import Notification, PartnerRequest
+from notifications.unread import push_unread_counts, recount_unread_counts
+from posts.cache import schedule_content_version_bump
+from posts.events import muting_row_signals
+from posts.models import ArchivedPost, ArchivedPostImage, Post, PostImage
+from stores.dashboard import schedule_dashboard_refresh
+
+ARCHIVED_POST_FIELDS = [
+    "title",
+    "store_name",
+    "description",
+    "address",
+    "phone_number",
+    "available_time",
+    "latitude",
+    "longitude",
+    "store_category_ids",
+    "partnership_category_ids",
+    "extra_message",
+    "thumbnail_url",
+    "author_id",
+    "created_at",
+    "updated_at",
+]
+ARCHIVED_IMAGE_FIELDS = [
+    "post_id",
+    "image_url",
+    "is_thumbnail",
+    "variants",
+    "status",
+    "created_at",
+]
+
+
+class Command(BaseCommand):
+    help = (
+        "비활성화된 뒤 POST_ARCHIVE_AFTER_DAYS 가 지난 게시글을 이미지, 카테고리와 함께 "
+        "보관 테이블로 옮깁니다. 제휴 요청이 달린 게시글은 남겨 두고, "
+        "관심 카테고리 알림은 게시글과 함께 지웁니다."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--days", type=int, default=settings.POST_ARCHIVE_AFTER_DAYS
+        )
+        parser.add_argument(
+            "--batch-size", type=int, default=settings.POST_LIFECYCLE_BATCH_SIZE
+        )
+        parser.add_argument(
+            "--dry-run", action="store_true", help="옮길 게시글 수만 셉니다"
+        )
+
+    def handle(self, *args, **options):
+        cutoff = timezone.now() - timedelta(days=options["days"])
+        # Post 를 지우면 CASCADE 로 같이 지워지는 제휴 요청과 그 알림이 있는 게시글은 제외.
+        # 관심 카테고리 알림(category_match)만 달린 게시글은 알림과 함께 보관한다
+        candidates = (
+            Post.objects.filter(is_active=False, updated_at__lt=cutoff)
+            .exclude(Exists(PartnerRequest.objects.filter(post=OuterRef("pk"))))
+            .exclude(
+                Exists(
+                    Notification.objects.filter(
+                        post=OuterRef("pk"), kind="partner_request"
+                    )
+                )
+            )
+        )
+
+        archived = 0
+        last_id = 0
+        while True:
+            post_ids = list(
+                candidates.filter(pk__gt=last_id)
+                .order_by("id")
+                .values_list("id", flat=True)[: options["batch_size"]]
+            )
+            if not post_ids:
+                break
+            last_id = post_ids[-1]
+            if options["dry_run"]:
+                archived += len(post_ids)
+            else:
+                archived += self.archive(candidates, post_ids)
+
+        verb = "보관 대상" if options["dry_run"] else "보관 완료"
+        self.stdout.write(self.style.SUCCESS(f"{archived}개 게시글 {verb}"))
+
+    @transaction.atomic
+    def archive(self, candidates, post_ids):
+        # 그 사이 다시 활성화됐거나 제휴 요청이 달린 게시글은 잠그면서 걸러낸다
+        posts = list(candidates.filter(pk__in=post_ids).select_for_update())
+        if not posts:
+            return 0
+        post_ids = [post.pk for post in posts]
+
+        ArchivedPost.objects.bulk_create(
+            ArchivedPost(
+                id=post.pk,
+                **{field: getattr(post, field) for field in ARCHIVED_POST_FIELDS},
+            )
+            for post in posts
+        )
+        ArchivedPostImage.objects.bulk_create(
+            ArchivedPostImage(
+                id=image.pk,
+                **{field: getattr(image, field) for field in ARCHIVED_IMAGE_FIELDS},
+            )
+            for image in PostImage.objects.filter(post_id__in=post_ids)
+        )
+
+        notified = set(
+            Notification.objects.filter(post_id__in=post_ids, is_read=False)
+            .order_by()
+            .values_list("user_id", flat=True)
+            .distinct()
+        )
+
+        # 행마다 도는 썸네일/캐시/대시보드/알림 카운터 갱신은 끄고 배치가 끝난 뒤 한 번만 한다.
+        # 이미지, 추이, 카테고리 연결, 관심 카테고리 알림은 CASCADE 로 같이 지워진다
+        with muting_row_signals():
+            Post.objects.filter(pk__in=post_ids).delete()
+
+        if notified:
+            recount_unread_counts(notified)
+            transaction.on_commit(partial(push_unread_counts, notified))
+
+        schedule_content_version_bump()
+        schedule_dashboard_refresh({post.author_id for post in posts}, ["my_posts"])
+        return len(posts)
@@ -0,0 +1,28 @@
+from django.core.management.base import BaseCommand
+
+from posts.models import Post
+from posts.thumbnails import refresh_thumbnail_urls
+
+
+class Command(BaseCommand):
+    help = "Post.thumbnail_url 을 PostImage 기준으로 다시 채웁니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=1000)
+        parser.add_argument(
+            "--all", action="store_true", help="이미 값이 있는 게시글도 다시 계산"
+        )
+
+    def handle(self, *args, **options):
+        queryset = Post.objects.order_by("id")
+        if not options["all"]:
+            queryset = queryset.filter(thumbnail_url="")
+
+        post_ids = list(queryset.values_list("id", flat=True))
+        batch_size = options["batch_size"]
+        for start in range(0, len(post_ids), batch_size):
+            refresh_thumbnail_urls(post_ids[start : start + batch_size])
+
+        self.stdout.write(
+            self.style.SUCCESS(f"{len(post_ids)}개 게시글 썸네일 갱신 완료")
+        )
@@ -0,0 +1,72 @@
+import time
+import uuid
+from types import SimpleNamespace
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+from django.test.utils import CaptureQueriesContext
+
+from posts.models import PartnershipCategory
+from posts.serializers import PostSerializer
+
+User = get_user_model()
+
+
+class Command(BaseCommand):
+    help = "이미지 수에 따른 게시글 생성 쿼리 수/시간을 측정합니다. (모든 변경은 롤백)"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--image-counts", type=int, nargs="+", default=[1, 5, 10, 20, 50]
+        )
+        parser.add_argument("--categories", type=int, default=4)
+
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            suffix = uuid.uuid4().hex[:8]
+            user = User.objects.create_user(
+                f"bench_{suffix}", "bench", f"bench_{suffix}@example.com", "000"
+            )
+            category_ids = [
+                PartnershipCategory.objects.create(name=f"bench_{suffix}_{i}").pk
+                for i in range(options["categories"])
+            ]
+            request = SimpleNamespace(user=user)
+
+            for image_count in options["image_counts"]:
+                data = {
+                    "title": "benchmark",
+                    "store_name": "benchmark",
+                    "description": "benchmark",
+                    "address": "benchmark",
+                    "phone_number": "000",
+                    "available_time": "00:00-24:00",
+                    "store_categories": category_ids,
+                    "partnership_categories": category_ids,
+                    "images": [
+                        {
+                            "image_url": f"https://example.com/{i}.jpg",
+                            "is_thumbnail": i == 0,
+                        }
+                        for i in range(image_count)
+                    ],
+                }
+
+                serializer = PostSerializer(data=data, context={"request": request})
+                with CaptureQueriesContext(connection) as validate_queries:
+                    serializer.is_valid(raise_exception=True)
+
+                started = time.perf_counter()
+                with CaptureQueriesContext(connection) as create_queries:
+                    serializer.save()
+                elapsed = (time.perf_counter() - started) * 1000
+
+                self.stdout.write(
+                    f"images={image_count:>3}  "
+                    f"validate_queries={len(validate_queries):>3}  "
+                    f"create_queries={len(create_queries):>3}  "
+                    f"create_ms={elapsed:.1f}"
+                )
+
+            transaction.set_rollback(True)
@@ -0,0 +1,51 @@
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db.models.functions import Now
+from django.utils import timezone
+
+from posts.cache import bump_content_version
+from posts.events import posts_bulk_updated
+from posts.models import Post
+
+
+class Command(BaseCommand):
+    help = "POST_EXPIRY_DAYS 동안 수정되지 않은 활성 게시글을 배치로 비활성화합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--days", type=int, default=settings.POST_EXPIRY_DAYS)
+        parser.add_argument(
+            "--batch-size", type=int, default=settings.POST_LIFECYCLE_BATCH_SIZE
+        )
+
+    def handle(self, *args, **options):
+        if options["days"] <= 0:
+            self.stdout.write("게시글 자동 만료가 꺼져 있습니다.")
+            return
+
+        cutoff = timezone.now() - timedelta(days=options["days"])
+        stale = Post.objects.filter(is_active=True, updated_at__lt=cutoff)
+
+        expired = 0
+        last_id = 0
+        while True:
+            # id 순서로 끊어 읽고 배치마다 짧은 UPDATE 로 처리해 피드 쿼리와 오래 경합하지 않는다
+            post_ids = list(
+                stale.filter(pk__gt=last_id)
+                .order_by("id")
+                .values_list("id", flat=True)[: options["batch_size"]]
+            )
+            if not post_ids:
+                break
+            last_id = post_ids[-1]
+            expired += stale.filter(pk__in=post_ids).update(
+                is_active=False, updated_at=Now()
+            )
+            posts_bulk_updated.send(sender=Post, post_ids=post_ids)
+
+        if expired:
+            # queryset.update() 는 signals 를 타지 않아 캐시 버전을 직접 올린다
+            bump_content_version()
+
+        self.stdout.write(self.style.SUCCESS(f"{expired}개 게시글 만료 처리 완료"))
@@ -0,0 +1,32 @@
+from django.core.management.base import BaseCommand
+
+from posts.models import PostImage
+from posts.tasks import process_post_images
+from users.models import UserImage
+from users.tasks import process_user_images
+
+
+class Command(BaseCommand):
+    help = "크기별 변형이 없는 게시글/프로필 이미지를 변환합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=50)
+
+    def handle(self, *args, **options):
+        batch_size = options["batch_size"]
+
+        for model, process in (
+            (PostImage, process_post_images),
+            (UserImage, process_user_images),
+        ):
+            image_ids = list(
+                model.objects.filter(variants={})
+                .order_by("id")
+                .values_list("id", flat=True)
+            )
+            for start in range(0, len(image_ids), batch_size):
+                process(image_ids[start : start + batch_size])
+
+            self.stdout.write(
+                self.style.SUCCESS(f"{model.__name__}: {len(image_ids)}개 변환 시도")
+            )
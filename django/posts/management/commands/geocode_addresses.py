@@ -0,0 +1,34 @@
+from django.core.management.base import BaseCommand
+
+from posts.models import Post
+from stores.models import Store
+from utils.geocoding import apply_location
+
+
+class Command(BaseCommand):
+    help = "좌표가 없는 게시글/가게 주소를 geocoder 로 변환합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--all", action="store_true", help="이미 좌표가 있는 행도 다시 변환"
+        )
+
+    def handle(self, *args, **options):
+        for model in (Post, Store):
+            queryset = model.objects.only("id", "address").order_by("id")
+            if not options["all"]:
+                queryset = queryset.filter(latitude__isnull=True)
+
+            located = 0
+            for instance in queryset.iterator(chunk_size=200):
+                apply_location(instance)
+                model.objects.filter(pk=instance.pk).update(
+                    latitude=instance.latitude,
+                    longitude=instance.longitude,
+                    geohash=instance.geohash,
+                )
+                located += instance.latitude is not None
+
+            self.stdout.write(
+                self.style.SUCCESS(f"{model.__name__}: {located}개 좌표 변환 완료")
+            )
@@ -0,0 +1,20 @@
+from django.core.management.base import BaseCommand
+
+from posts.models import Post
+from posts.search import update_search_vector, SEARCH_WEIGHTS
+
+
+class Command(BaseCommand):
+    help = "게시글 검색용 tsvector 를 다시 계산합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=500)
+
+    def handle(self, *args, **options):
+        posts = Post.objects.only("id", *SEARCH_WEIGHTS).order_by("id")
+        count = 0
+        for post in posts.iterator(chunk_size=options["batch_size"]):
+            update_search_vector(post)
+            count += 1
+
+        self.stdout.write(self.style.SUCCESS(f"{count}개 게시글 검색 인덱스 갱신 완료"))
@@ -0,0 +1,154 @@
+import heapq
+import threading
+import time
+
+from django.conf import settings
+
+from .models import Post
+
+
+def to_mask(category_ids):
+    """카테고리 id 목록을 비트셋(int)으로 바꾼다. id 가 비트 위치가 된다."""
+    mask = 0
+    for category_id in category_ids:
+        mask |= 1 << category_id
+    return mask
+
+
+def from_mask(mask):
+    """to_mask 의 반대. 켜진 비트 위치(카테고리 id)를 차례로 돌려준다."""
+    while mask:
+        low = mask & -mask
+        yield low.bit_length() - 1
+        mask ^= low
+
+
+class MatchingIndex:
+    """
+    활성 게시글의 카테고리 비트셋을 프로세스 메모리에 들고 있는 제휴 매칭 인덱스.
+    찾는 카테고리 → 게시글, 작성자 → 게시글 역색인을 같이 들고 있어서
+    추천은 전체 게시글이 아니라 내 가게 카테고리를 찾는 게시글만 본다.
+
+    같은 프로세스의 쓰기는 signals 에서 커밋 뒤에 반영하고,
+    다른 워커의 쓰기는 MATCHING_INDEX_TTL 초마다 전체를 다시 읽어 맞춘다.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._posts = {}  # post_id → (author_id, store_mask, partner_mask)
+        self._by_partner_category = {}  # category_id → {post_id}
+        self._by_author = {}  # author_id → {post_id}
+        self._built_at = None
+
+    def _row_to_entry(self, author_id, store_category_ids, partnership_category_ids):
+        return (
+            author_id,
+            to_mask(store_category_ids),
+            to_mask(partnership_category_ids),
+        )
+
+    def _load(self, queryset):
+        return queryset.values_list(
+            "id",
+            "author_id",
+            "is_active",
+            "store_category_ids",
+            "partnership_category_ids",
+        )
+
+    def _add(self, post_id, entry):
+        author_id, _, partner_mask = entry
+        self._posts[post_id] = entry
+        self._by_author.setdefault(author_id, set()).add(post_id)
+        for category_id in from_mask(partner_mask):
+            self._by_partner_category.setdefault(category_id, set()).add(post_id)
+
+    def _discard(self, post_id):
+        entry = self._posts.pop(post_id, None)
+        if entry is None:
+            return
+        author_id, _, partner_mask = entry
+        self._discard_from(self._by_author, author_id, post_id)
+        for category_id in from_mask(partner_mask):
+            self._discard_from(self._by_partner_category, category_id, post_id)
+
+    def _discard_from(self, index, key, post_id):
+        post_ids = index.get(key)
+        if post_ids is not None:
+            post_ids.discard(post_id)
+            if not post_ids:
+                del index[key]
+
+    def rebuild(self):
+        rebuilt = MatchingIndex()
+        for post_id, author_id, _, store_ids, partner_ids in self._load(
+            Post.objects.filter(is_active=True)
+        ).iterator(chunk_size=2000):
+            rebuilt._add(post_id, self._row_to_entry(author_id, store_ids, partner_ids))
+
+        with self._lock:
+            self._posts = rebuilt._posts
+            self._by_partner_category = rebuilt._by_partner_category
+            self._by_author = rebuilt._by_author
+            self._built_at = time.monotonic()
+
+    def ensure_fresh(self):
+        if (
+            self._built_at is None
+            or time.monotonic() - self._built_at > settings.MATCHING_INDEX_TTL
+        ):
+            self.rebuild()
+
+    def refresh_posts(self, post_ids):
+        if self._built_at is None:
+            return
+
+        rows = list(self._load(Post.objects.filter(pk__in=list(post_ids))))
+        with self._lock:
+            for post_id in post_ids:
+                self._discard(post_id)
+            for post_id, author_id, is_active, store_ids, partner_ids in rows:
+                if is_active:
+                    self._add(
+                        post_id,
+                        self._row_to_entry(author_id, store_ids, partner_ids),
+                    )
+
+    def remove_post(self, post_id):
+        with self._lock:
+            self._discard(post_id)
+
+    def recommend(self, user_id, store_category_ids, k):
+        """
+        내 가게 카테고리가 게시글의 partnership_categories 에 있는 게시글만 후보로 삼고,
+        (겹치는 내 카테고리 수 + 내 게시글이 찾는 업종과 게시글 업종이 겹치는 수) 로 점수를 매긴다.
+        반환값은 점수 내림차순 [(post_id, score), ...].
+        """
+        self.ensure_fresh()
+        with self._lock:
+            candidate_ids = set()
+            for category_id in store_category_ids:
+                candidate_ids |= self._by_partner_category.get(category_id, set())
+            candidates = [(post_id, self._posts[post_id]) for post_id in candidate_ids]
+            my_posts = [
+                self._posts[post_id] for post_id in self._by_author.get(user_id, ())
+            ]
+
+        my_mask = to_mask(store_category_ids)
+        wanted_mask = 0
+        for _, _, partner_mask in my_posts:
+            wanted_mask |= partner_mask
+
+        scored = []
+        for post_id, (author_id, store_mask, partner_mask) in candidates:
+            if author_id == user_id:
+                continue
+            offered = (my_mask & partner_mask).bit_count()
+            wanted = (wanted_mask & store_mask).bit_count()
+            scored.append((offered + wanted, post_id))
+
+        top = heapq.nlargest(k, scored)
+        return [(post_id, score) for score, post_id in top]
+
+
+matching_index = MatchingIndex()
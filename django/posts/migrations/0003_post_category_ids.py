@@ -0,0 +1,63 @@
+# Generated by Django 5.2.1 on 2025-06-12 14:05
+
+import django.contrib.postgres.fields
+import django.contrib.postgres.indexes
+from django.conf import settings
+from django.db import migrations, models
+
+
+def backfill_category_ids(apps, schema_editor):
+    Post = apps.get_model("posts", "Post")
+
+    for m2m_field, array_field in (
+        ("store_categories", "store_category_ids"),
+        ("partnership_categories", "partnership_category_ids"),
+    ):
+        through = getattr(Post, m2m_field).through
+        category_ids = {}
+        rows = through.objects.order_by("partnershipcategory_id").values_list(
+            "post_id", "partnershipcategory_id"
+        )
+        for post_id, category_id in rows.iterator():
+            category_ids.setdefault(post_id, []).append(category_id)
+
+        for post_id, ids in category_ids.items():
+            Post.objects.filter(pk=post_id).update(**{array_field: ids})
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("posts", "0002_post_created_id_idx"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="post",
+            name="partnership_category_ids",
+            field=django.contrib.postgres.fields.ArrayField(
+                base_field=models.BigIntegerField(), blank=True, default=list, size=None
+            ),
+        ),
+        migrations.AddField(
+            model_name="post",
+            name="store_category_ids",
+            field=django.contrib.postgres.fields.ArrayField(
+                base_field=models.BigIntegerField(), blank=True, default=list, size=None
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="post",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["store_category_ids"], name="post_store_cat_ids_gin"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="post",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["partnership_category_ids"], name="post_partner_cat_ids_gin"
+            ),
+        ),
+        migrations.RunPython(backfill_category_ids, migrations.RunPython.noop),
+    ]
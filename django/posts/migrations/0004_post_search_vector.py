@@ -0,0 +1,76 @@
+# Generated by Django 5.2.1 on 2025-06-13 11:20
+
+import re
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.conf import settings
+from django.contrib.postgres.search import SearchVector
+from django.db import migrations
+from django.db.models import Value
+
+# posts/search.py 가 바뀌어도 이 마이그레이션 결과는 그대로여야 해서 작성 당시 규칙을 복사해 둔다
+SEARCH_CONFIG = "simple"
+NGRAM_SIZE = 2
+SEARCH_WEIGHTS = {
+    "title": "A",
+    "store_name": "A",
+    "address": "B",
+    "description": "C",
+    "extra_message": "D",
+}
+_WORD_RE = re.compile(r"\w+")
+
+
+def tokenize(text):
+    tokens = []
+    for word in _WORD_RE.findall(text.lower()):
+        if len(word) <= NGRAM_SIZE:
+            tokens.append(word)
+        else:
+            tokens.extend(
+                word[i : i + NGRAM_SIZE] for i in range(len(word) - NGRAM_SIZE + 1)
+            )
+    return tokens
+
+
+def build_search_vector(post):
+    vector = None
+    for field, weight in SEARCH_WEIGHTS.items():
+        document = " ".join(tokenize(getattr(post, field) or ""))
+        field_vector = SearchVector(
+            Value(document), config=SEARCH_CONFIG, weight=weight
+        )
+        vector = field_vector if vector is None else vector + field_vector
+    return vector
+
+
+def backfill_search_vector(apps, schema_editor):
+    Post = apps.get_model("posts", "Post")
+    for post in Post.objects.order_by("id").iterator(chunk_size=500):
+        Post.objects.filter(pk=post.pk).update(search_vector=build_search_vector(post))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("posts", "0003_post_category_ids"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="post",
+            name="search_vector",
+            field=django.contrib.postgres.search.SearchVectorField(
+                editable=False, null=True
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="post",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["search_vector"], name="post_search_vector_gin"
+            ),
+        ),
+        migrations.RunPython(backfill_search_vector, migrations.RunPython.noop),
+    ]
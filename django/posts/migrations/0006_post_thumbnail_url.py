@@ -0,0 +1,18 @@
+# Generated by Django 5.2.1 on 2025-06-24 16:30
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("posts", "0005_post_geohash_post_latitude_post_longitude"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="post",
+            name="thumbnail_url",
+            field=models.URLField(blank=True),
+        ),
+    ]
@@ -0,0 +1,40 @@
+# Generated by Django 5.2.1 on 2025-06-28 11:02
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("posts", "0007_postimage_variants"),
+    ]
+
+    operations = [
+        # 기존 이미지는 지금처럼 노출되도록 verified 로 둔다
+        migrations.AddField(
+            model_name="postimage",
+            name="status",
+            field=models.CharField(
+                choices=[
+                    ("pending", "Pending"),
+                    ("verified", "Verified"),
+                    ("quarantined", "Quarantined"),
+                ],
+                default="verified",
+                max_length=20,
+            ),
+        ),
+        migrations.AlterField(
+            model_name="postimage",
+            name="status",
+            field=models.CharField(
+                choices=[
+                    ("pending", "Pending"),
+                    ("verified", "Verified"),
+                    ("quarantined", "Quarantined"),
+                ],
+                default="pending",
+                max_length=20,
+            ),
+        ),
+    ]
@@ -0,0 +1,85 @@
+# Generated by Django 5.2.1 on 2025-07-02 16:12
+
+import math
+from datetime import datetime, timezone
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+# posts/trending.py, utils/decay.py 와 같은 값이지만 앱 코드가 바뀌어도 이 마이그레이션은
+# 작성 당시대로 돌아야 해서 복사해 둔다
+DECAY_EPOCH = datetime(2025, 1, 1, tzinfo=timezone.utc)
+TREND_WINDOWS = {
+    "1h": ("score_1h", 60 * 60),
+    "24h": ("score_24h", 24 * 60 * 60),
+    "7d": ("score_7d", 7 * 24 * 60 * 60),
+}
+
+
+def log_weight(amount, at, half_life):
+    rate = math.log(2) / half_life
+    return math.log(amount) + rate * (at - DECAY_EPOCH).total_seconds()
+
+
+def backfill_post_trends(apps, schema_editor):
+    PartnerRequest = apps.get_model("notifications", "PartnerRequest")
+    PostTrend = apps.get_model("posts", "PostTrend")
+
+    # 기존 제휴 요청을 게시글별로 로그 영역 합 ln(Σ e^w) 으로 모은다
+    scores = {}
+    for post_id, created_at in (
+        PartnerRequest.objects.order_by("id")
+        .values_list("post_id", "created_at")
+        .iterator(chunk_size=2000)
+    ):
+        current = scores.setdefault(post_id, {})
+        for field, half_life in TREND_WINDOWS.values():
+            weight = log_weight(1, created_at, half_life)
+            if field not in current:
+                current[field] = weight
+            else:
+                high, low = max(current[field], weight), min(current[field], weight)
+                current[field] = high + math.log1p(math.exp(low - high))
+
+    PostTrend.objects.bulk_create(
+        (PostTrend(post_id=post_id, **fields) for post_id, fields in scores.items()),
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("posts", "0011_post_popularity"),
+        ("notifications", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="PostTrend",
+            fields=[
+                (
+                    "post",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="trend",
+                        serialize=False,
+                        to="posts.post",
+                    ),
+                ),
+                ("score_1h", models.FloatField()),
+                ("score_24h", models.FloatField()),
+                ("score_7d", models.FloatField()),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                "indexes": [
+                    models.Index(fields=["-score_1h"], name="post_trend_1h_idx"),
+                    models.Index(fields=["-score_24h"], name="post_trend_24h_idx"),
+                    models.Index(fields=["-score_7d"], name="post_trend_7d_idx"),
+                ],
+            },
+        ),
+        migrations.RunPython(backfill_post_trends, migrations.RunPython.noop),
+    ]
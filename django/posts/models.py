@@ -1,9 +1,13 @@
 from django.db import models
 from django.conf import settings
+from django.contrib.postgres.fields import ArrayField
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVectorField
 
 
 class PartnershipCategory(models.Model):
     name = models.CharField(max_length=50, unique=True)
+    updated_at = models.DateTimeField(auto_now=True)
 
     def __str__(self):
         return self.name
@@ -17,6 +21,11 @@ class Post(models.Model):
     phone_number = models.CharField(max_length=20)
     available_time = models.CharField(max_length=100)
 
+    # address 를 geocoder 로 변환한 좌표 (utils/geocoding.py)
+    latitude = models.FloatField(null=True, blank=True)
+    longitude = models.FloatField(null=True, blank=True)
+    geohash = models.CharField(max_length=12, blank=True, db_index=True)
+
     store_categories = models.ManyToManyField(
         PartnershipCategory, related_name="store_posts"
     )
@@ -24,21 +33,142 @@ class Post(models.Model):
         PartnershipCategory, related_name="partner_posts"
     )
 
+    # M2M 을 매번 조인하지 않도록 카테고리 id 를 배열로 들고 있는다 (signals 에서 동기화)
+    store_category_ids = ArrayField(models.BigIntegerField(), default=list, blank=True)
+    partnership_category_ids = ArrayField(
+        models.BigIntegerField(), default=list, blank=True
+    )
+
     extra_message = models.TextField(blank=True)
 
+    # 대표 이미지 URL 비정규화 (PostImage 가 바뀔 때 signals 에서 동기화)
+    thumbnail_url = models.URLField(blank=True)
+
     author = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE)
     created_at = models.DateTimeField(auto_now_add=True)
+    # 상세 응답 ETag 용 행 버전. 이미지/카테고리 변경처럼 queryset.update() 로 바뀌는 경우도
+    # signals / thumbnails 에서 같이 갱신한다
+    updated_at = models.DateTimeField(auto_now=True)
     is_active = models.BooleanField(default=True)
 
+    # 조회수와 감쇠 인기 점수 (posts/popularity.py 에서 모아서 갱신)
+    view_count = models.PositiveBigIntegerField(default=0)
+    popularity_score = models.FloatField(default=0)
+
+    # 검색용 bigram tsvector (posts/search.py 에서 갱신)
+    search_vector = SearchVectorField(null=True, editable=False)
+
+    class Meta:
+        indexes = [
+            # 피드는 항상 활성 게시글만 보므로 비활성 게시글은 인덱스에서 뺀다
+            models.Index(
+                fields=["-created_at", "-id"],
+                name="post_active_created_id_idx",
+                condition=models.Q(is_active=True),
+            ),
+            models.Index(
+                fields=["-popularity_score", "-id"],
+                name="post_active_popular_id_idx",
+                condition=models.Q(is_active=True),
+            ),
+            GinIndex(fields=["store_category_ids"], name="post_store_cat_ids_gin"),
+            GinIndex(
+                fields=["partnership_category_ids"], name="post_partner_cat_ids_gin"
+            ),
+            GinIndex(fields=["search_vector"], name="post_search_vector_gin"),
+        ]
+
     def __str__(self):
         return self.title
 
 
 class PostImage(models.Model):
+    STATUS_CHOICES = (
+        ("pending", "Pending"),
+        ("verified", "Verified"),
+        ("quarantined", "Quarantined"),
+    )
+
     post = models.ForeignKey(Post, on_delete=models.CASCADE, related_name="images")
     image_url = models.URLField()
     is_thumbnail = models.BooleanField(default=False)
+    # 크기별 변형 URL {"card": ..., "detail": ..., "original": ...} (posts/tasks.py)
+    variants = models.JSONField(default=dict, blank=True)
+    # 업로드 후 비동기 검증 결과 (tasks.py). quarantined 는 응답에서 제외한다
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default="pending")
     created_at = models.DateTimeField(auto_now_add=True)
 
     def __str__(self):
         return f"Image for {self.post.title}"
+
+
+class ArchivedPost(models.Model):
+    """
+    비활성화된 뒤 오래 지난 게시글 보관 테이블 (archive_posts 커맨드).
+    원래 Post id 를 그대로 쓰고, 카테고리 M2M 은 id 배열로만 남긴다.
+    """
+
+    id = models.BigIntegerField(primary_key=True)
+    title = models.CharField(max_length=100)
+    store_name = models.CharField(max_length=100)
+    description = models.TextField()
+    address = models.CharField(max_length=255)
+    phone_number = models.CharField(max_length=20)
+    available_time = models.CharField(max_length=100)
+    latitude = models.FloatField(null=True, blank=True)
+    longitude = models.FloatField(null=True, blank=True)
+    store_category_ids = ArrayField(models.BigIntegerField(), default=list, blank=True)
+    partnership_category_ids = ArrayField(
+        models.BigIntegerField(), default=list, blank=True
+    )
+    extra_message = models.TextField(blank=True)
+    thumbnail_url = models.URLField(blank=True)
+    author = models.ForeignKey(
+        settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name="+"
+    )
+    created_at = models.DateTimeField()
+    updated_at = models.DateTimeField()
+    archived_at = models.DateTimeField(auto_now_add=True)
+
+    def __str__(self):
+        return self.title
+
+
+class ArchivedPostImage(models.Model):
+    id = models.BigIntegerField(primary_key=True)
+    post = models.ForeignKey(
+        ArchivedPost, on_delete=models.CASCADE, related_name="images"
+    )
+    image_url = models.URLField()
+    is_thumbnail = models.BooleanField(default=False)
+    variants = models.JSONField(default=dict, blank=True)
+    status = models.CharField(max_length=20)
+    created_at = models.DateTimeField()
+
+    def __str__(self):
+        return f"Archived image for {self.post.title}"
+
+
+class PostTrend(models.Model):
+    """
+    게시글별 제휴 요청 증가 속도 (posts/trending.py).
+    구간별로 반감기가 다른 감쇠 합을 로그 영역으로 들고 있어 요청이 올 때 UPDATE 한 번으로 갱신된다.
+    """
+
+    post = models.OneToOneField(
+        Post, on_delete=models.CASCADE, primary_key=True, related_name="trend"
+    )
+    score_1h = models.FloatField()
+    score_24h = models.FloatField()
+    score_7d = models.FloatField()
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["-score_1h"], name="post_trend_1h_idx"),
+            models.Index(fields=["-score_24h"], name="post_trend_24h_idx"),
+            models.Index(fields=["-score_7d"], name="post_trend_7d_idx"),
+        ]
+
+    def __str__(self):
+        return f"Trend of post {self.post_id}"
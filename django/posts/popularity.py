@@ -0,0 +1,51 @@
+from django.conf import settings
+from django.db import transaction
+from django.db.models import BigIntegerField, Case, F, FloatField, Value, When
+from django.utils import timezone
+
+from .cache import bump_popularity_version
+from .models import Post
+from utils.counters import BufferedCounter
+from utils.decay import log_add, log_weight
+
+# UPDATE 한 번에 넣을 게시글 수
+FLUSH_CHUNK_SIZE = 500
+
+
+def flush_post_views(counts):
+    """
+    {post_id: 조회 수} 를 게시글 view_count 와 popularity_score 에 반영한다.
+    묶음마다 UPDATE 한 번이고, id 순서로 잠가서 워커끼리 데드락이 나지 않는다.
+    updated_at 과 목록/상세 캐시 버전은 건드리지 않고 인기순 캐시 버전만 올린다.
+    """
+    now = timezone.now()
+    half_life = settings.POST_POPULARITY_HALF_LIFE
+    post_ids = sorted(counts)
+
+    for start in range(0, len(post_ids), FLUSH_CHUNK_SIZE):
+        chunk = post_ids[start : start + FLUSH_CHUNK_SIZE]
+        views = Case(
+            *[When(pk=pk, then=Value(counts[pk])) for pk in chunk],
+            output_field=BigIntegerField(),
+        )
+        weights = Case(
+            *[
+                When(pk=pk, then=Value(log_weight(counts[pk], now, half_life)))
+                for pk in chunk
+            ],
+            output_field=FloatField(),
+        )
+        Post.objects.filter(pk__in=chunk).update(
+            view_count=F("view_count") + views,
+            popularity_score=log_add("popularity_score", weights),
+        )
+
+    if post_ids:
+        transaction.on_commit(bump_popularity_version)
+
+
+post_view_counter = BufferedCounter(
+    flush_post_views,
+    flush_interval=settings.POST_VIEW_FLUSH_INTERVAL,
+    flush_threshold=settings.POST_VIEW_FLUSH_THRESHOLD,
+)
@@ -0,0 +1,76 @@
+import re
+
+from django.contrib.postgres.search import SearchQuery, SearchRank, SearchVector
+from django.db.models import F, FloatField, Value
+from django.db.models.functions import Cast
+
+SEARCH_CONFIG = "simple"
+NGRAM_SIZE = 2
+MAX_QUERY_TOKENS = 32
+
+# 검색 대상 필드 → tsvector 가중치
+SEARCH_WEIGHTS = {
+    "title": "A",
+    "store_name": "A",
+    "address": "B",
+    "description": "C",
+    "extra_message": "D",
+}
+
+_WORD_RE = re.compile(r"\w+")
+
+
+def tokenize(text):
+    """
+    형태소 분석기 없이 한국어를 검색하기 위해 단어를 bigram 으로 쪼갠다.
+    "카페라떼" → ["카페", "페라", "라떼"], 한 글자 단어는 그대로 둔다.
+    """
+    tokens = []
+    for word in _WORD_RE.findall(text.lower()):
+        if len(word) <= NGRAM_SIZE:
+            tokens.append(word)
+        else:
+            tokens.extend(
+                word[i : i + NGRAM_SIZE] for i in range(len(word) - NGRAM_SIZE + 1)
+            )
+    return tokens
+
+
+def build_search_vector(post):
+    vector = None
+    for field, weight in SEARCH_WEIGHTS.items():
+        document = " ".join(tokenize(getattr(post, field) or ""))
+        field_vector = SearchVector(
+            Value(document), config=SEARCH_CONFIG, weight=weight
+        )
+        vector = field_vector if vector is None else vector + field_vector
+    return vector
+
+
+def update_search_vector(post):
+    type(post).objects.filter(pk=post.pk).update(
+        search_vector=build_search_vector(post)
+    )
+
+
+def build_search_query(q):
+    tokens = list(dict.fromkeys(tokenize(q)))[:MAX_QUERY_TOKENS]
+    if not tokens:
+        return None
+
+    # 한 글자 검색어는 그 글자로 시작하는 bigram 과 prefix 매칭
+    terms = [
+        f"'{token}':*" if len(token) < NGRAM_SIZE else f"'{token}'" for token in tokens
+    ]
+    return SearchQuery(" & ".join(terms), search_type="raw", config=SEARCH_CONFIG)
+
+
+def search_posts(queryset, q):
+    query = build_search_query(q)
+    if query is None:
+        return queryset.none()
+
+    # ts_rank 는 real 이라 cursor 로 왕복할 때 값이 어긋나지 않도록 double 로 맞춘다
+    return queryset.filter(search_vector=query).annotate(
+        rank=Cast(SearchRank(F("search_vector"), query), FloatField())
+    )
@@ -1,5 +1,14 @@
+from django.db import transaction
 from rest_framework import serializers
+from django.conf import settings
+
+from .fields import CategoryPrimaryKeyField
 from .models import Post, PostImage, PartnershipCategory
+from .tasks import process_post_images
+from .thumbnails import pick_thumbnail_url
+from .uploads import POST_IMAGE_PREFIX, S3_MAX_PARTS, part_count
+from utils.images import is_upload_url
+from utils.tasks import run_on_commit
 
 
 class PartnershipCategorySerializer(serializers.ModelSerializer):
@@ -9,19 +18,26 @@ class PartnershipCategorySerializer(serializers.ModelSerializer):
 
 
 class PostImageSerializer(serializers.ModelSerializer):
+    detail_url = serializers.SerializerMethodField()
+
     class Meta:
         model = PostImage
-        fields = ["id", "image_url", "is_thumbnail", "created_at"]
+        fields = ["id", "image_url", "detail_url", "is_thumbnail", "created_at"]
         read_only_fields = ["id", "created_at"]
 
+    def get_detail_url(self, obj):
+        return obj.variants.get("detail") or obj.image_url
+
+    def validate_image_url(self, value):
+        # 크기/형식은 업로드 정책과 업로드 후 검증(posts/tasks.py)이 맡는다
+        if not is_upload_url(value, POST_IMAGE_PREFIX):
+            raise serializers.ValidationError("업로드된 이미지 URL이 아닙니다.")
+        return value
+
 
 class PostSerializer(serializers.ModelSerializer):
-    store_categories = serializers.PrimaryKeyRelatedField(
-        queryset=PartnershipCategory.objects.all(), many=True
-    )
-    partnership_categories = serializers.PrimaryKeyRelatedField(
-        queryset=PartnershipCategory.objects.all(), many=True
-    )
+    store_categories = CategoryPrimaryKeyField(many=True)
+    partnership_categories = CategoryPrimaryKeyField(many=True)
     images = PostImageSerializer(many=True, write_only=True)
 
     class Meta:
@@ -53,19 +69,37 @@ class PostSerializer(serializers.ModelSerializer):
 
         return value
 
+    @transaction.atomic
     def create(self, validated_data):
-        store_categories = validated_data.pop("store_categories")
-        partnership_categories = validated_data.pop("partnership_categories")
+        # 중복 id 가 들어와도 through 테이블 unique 제약에 걸리지 않도록 정리
+        store_categories = {c.pk: c for c in validated_data.pop("store_categories")}
+        partnership_categories = {
+            c.pk: c for c in validated_data.pop("partnership_categories")
+        }
         images_data = validated_data.pop("images")
 
         post = Post.objects.create(
-            author=self.context["request"].user, **validated_data
+            author=self.context["request"].user,
+            store_category_ids=sorted(store_categories),
+            partnership_category_ids=sorted(partnership_categories),
+            thumbnail_url=pick_thumbnail_url(images_data),
+            **validated_data,
         )
-        post.store_categories.set(store_categories)
-        post.partnership_categories.set(partnership_categories)
 
-        for image_data in images_data:
-            PostImage.objects.create(post=post, **image_data)
+        # M2M 과 이미지는 bulk insert 로 넣어 이미지 수와 상관없이 쿼리 수가 일정하다
+        for field, categories in (
+            (Post.store_categories, store_categories),
+            (Post.partnership_categories, partnership_categories),
+        ):
+            field.through.objects.bulk_create(
+                field.through(post=post, partnershipcategory=category)
+                for category in categories.values()
+            )
+
+        images = PostImage.objects.bulk_create(
+            PostImage(post=post, **image_data) for image_data in images_data
+        )
+        run_on_commit(process_post_images, [image.pk for image in images])
 
         return post
 
@@ -97,7 +131,53 @@ class PostDetailSerializer(serializers.ModelSerializer):
         read_only_fields = ["id", "created_at", "is_active", "author"]
 
 
-class PostListSerializer(serializers.ModelSerializer):
-    class Meta:
-        model = Post
-        fields = ["id", "title", "created_at"]
+class UploadFileSerializer(serializers.Serializer):
+    filename = serializers.CharField()
+    content_type = serializers.CharField()
+    size = serializers.IntegerField(min_value=1)
+
+    def validate_content_type(self, value):
+        if value not in settings.ALLOWED_IMAGE_CONTENT_TYPES:
+            raise serializers.ValidationError("허용되지 않은 이미지 형식입니다.")
+        return value
+
+    def validate_size(self, value):
+        if value > settings.POST_IMAGE_MAX_SIZE or part_count(value) > S3_MAX_PARTS:
+            raise serializers.ValidationError("파일 크기가 너무 큽니다.")
+        return value
+
+
+class UploadBatchSerializer(serializers.Serializer):
+    files = UploadFileSerializer(many=True)
+
+    def validate_files(self, value):
+        if not value:
+            raise serializers.ValidationError("파일 리스트는 비워둘 수 없습니다.")
+        if len(value) > settings.MAX_UPLOAD_BATCH_SIZE:
+            raise serializers.ValidationError(
+                f"한 번에 최대 {settings.MAX_UPLOAD_BATCH_SIZE}개까지 업로드할 수 있습니다."
+            )
+        return value
+
+
+class MultipartUploadSerializer(serializers.Serializer):
+    key = serializers.CharField()
+    upload_id = serializers.CharField()
+
+    def validate_key(self, value):
+        if not value.startswith(POST_IMAGE_PREFIX):
+            raise serializers.ValidationError("잘못된 업로드 key 입니다.")
+        return value
+
+
+class MultipartPartSerializer(serializers.Serializer):
+    part_number = serializers.IntegerField(min_value=1, max_value=S3_MAX_PARTS)
+    etag = serializers.CharField()
+
+
+class MultipartCompleteSerializer(MultipartUploadSerializer):
+    parts = MultipartPartSerializer(many=True, allow_empty=False)
+
+
+class MultipartResumeSerializer(MultipartUploadSerializer):
+    size = serializers.IntegerField(min_value=1)
@@ -0,0 +1,173 @@
+from functools import partial
+
+from django.db import transaction
+from django.db.models import F, Func, Q, Value
+from django.db.models.functions import Now
+from django.db.models.signals import m2m_changed, post_delete, post_save, pre_save
+from django.dispatch import receiver
+
+from .cache import schedule_content_version_bump
+from .categories import category_registry
+from .events import posts_bulk_updated, row_signals_muted
+from .models import Post, PostImage, PartnershipCategory
+from .matching import matching_index
+from .search import SEARCH_WEIGHTS, update_search_vector
+from .thumbnails import refresh_thumbnail_urls
+from utils.geocoding import geocode_after_save, geocode_on_address_change
+
+# M2M 필드 이름 → Post 에 비정규화된 배열 필드 이름
+CATEGORY_ID_FIELDS = {
+    "store_categories": "store_category_ids",
+    "partnership_categories": "partnership_category_ids",
+}
+
+
+def refresh_category_ids(post_ids):
+    """post_id → {배열 필드: 카테고리 id 목록} 을 돌려준다."""
+    post_ids = list(post_ids)
+    refreshed = {post_id: {} for post_id in post_ids}
+    if not post_ids:
+        return refreshed
+
+    for m2m_field, array_field in CATEGORY_ID_FIELDS.items():
+        through = getattr(Post, m2m_field).through
+        category_ids = {post_id: [] for post_id in post_ids}
+        rows = (
+            through.objects.filter(post_id__in=post_ids)
+            .order_by("partnershipcategory_id")
+            .values_list("post_id", "partnershipcategory_id")
+        )
+        for post_id, category_id in rows:
+            category_ids[post_id].append(category_id)
+
+        for post_id, ids in category_ids.items():
+            Post.objects.filter(pk=post_id).update(
+                **{array_field: ids}, updated_at=Now()
+            )
+            refreshed[post_id][array_field] = ids
+
+    # 롤백된 변경이 인덱스에 남지 않도록 커밋 뒤에 반영한다
+    transaction.on_commit(partial(matching_index.refresh_posts, post_ids))
+    posts_bulk_updated.send(sender=Post, post_ids=post_ids)
+    return refreshed
+
+
+def _on_category_m2m_changed(sender, instance, action, reverse, pk_set, **kwargs):
+    if action == "pre_clear" and reverse:
+        # 역방향 clear 는 post_clear 시점에 pk_set 이 없어서 미리 대상 게시글을 기억해 둔다
+        instance._cleared_post_ids = list(
+            sender.objects.filter(partnershipcategory_id=instance.pk).values_list(
+                "post_id", flat=True
+            )
+        )
+        return
+
+    if action not in ("post_add", "post_remove", "post_clear"):
+        return
+
+    if not reverse:
+        # 이후 instance.save() 가 예전 배열로 덮어쓰지 않도록 인스턴스에도 반영
+        for array_field, ids in refresh_category_ids([instance.pk])[
+            instance.pk
+        ].items():
+            setattr(instance, array_field, ids)
+    elif action == "post_clear":
+        refresh_category_ids(getattr(instance, "_cleared_post_ids", []))
+    else:
+        refresh_category_ids(pk_set or [])
+
+
+for _m2m_field in CATEGORY_ID_FIELDS:
+    m2m_changed.connect(
+        _on_category_m2m_changed,
+        sender=getattr(Post, _m2m_field).through,
+        dispatch_uid=f"posts.sync_{_m2m_field}_ids",
+    )
+
+
+@receiver(post_delete, sender=PartnershipCategory)
+def remove_deleted_category_id(sender, instance, **kwargs):
+    for array_field in CATEGORY_ID_FIELDS.values():
+        Post.objects.filter(**{f"{array_field}__contains": [instance.pk]}).update(
+            **{
+                array_field: Func(
+                    F(array_field), Value(instance.pk), function="array_remove"
+                )
+            },
+            updated_at=Now(),
+        )
+
+
+@receiver(post_save, sender=PartnershipCategory)
+@receiver(post_delete, sender=PartnershipCategory)
+def invalidate_category_registry(sender, **kwargs):
+    transaction.on_commit(category_registry.invalidate)
+
+
+@receiver(post_save, sender=PartnershipCategory)
+def touch_posts_on_category_rename(sender, instance, created, **kwargs):
+    # 상세 응답에 카테고리 이름이 들어가서 해당 게시글들의 ETag 를 바꿔야 한다
+    if created:
+        return
+    Post.objects.filter(
+        Q(store_category_ids__contains=[instance.pk])
+        | Q(partnership_category_ids__contains=[instance.pk])
+    ).update(updated_at=Now())
+
+
+@receiver(post_save, sender=Post)
+def refresh_search_vector(sender, instance, update_fields=None, **kwargs):
+    if update_fields is not None and not set(update_fields) & set(SEARCH_WEIGHTS):
+        return
+    update_search_vector(instance)
+
+
+@receiver(post_save, sender=Post)
+def refresh_matching_index(sender, instance, **kwargs):
+    transaction.on_commit(partial(matching_index.refresh_posts, [instance.pk]))
+
+
+@receiver(post_delete, sender=Post)
+def remove_from_matching_index(sender, instance, **kwargs):
+    transaction.on_commit(partial(matching_index.remove_post, instance.pk))
+
+
+pre_save.connect(
+    geocode_on_address_change, sender=Post, dispatch_uid="posts.geocode_post"
+)
+post_save.connect(
+    geocode_after_save, sender=Post, dispatch_uid="posts.geocode_post_after_save"
+)
+
+
+@receiver(post_save, sender=PostImage)
+@receiver(post_delete, sender=PostImage)
+def sync_thumbnail_url(sender, instance, **kwargs):
+    if row_signals_muted():
+        return
+    refresh_thumbnail_urls([instance.post_id])
+
+
+@receiver(post_save, sender=Post)
+@receiver(post_delete, sender=Post)
+@receiver(post_save, sender=PostImage)
+@receiver(post_delete, sender=PostImage)
+@receiver(post_save, sender=PartnershipCategory)
+@receiver(post_delete, sender=PartnershipCategory)
+def bump_content_version_on_save(sender, **kwargs):
+    if row_signals_muted():
+        return
+    schedule_content_version_bump()
+
+
+def bump_content_version_on_m2m_changed(sender, action, **kwargs):
+    if action in ("post_add", "post_remove", "post_clear"):
+        schedule_content_version_bump()
+
+
+for _m2m_field in CATEGORY_ID_FIELDS:
+    m2m_changed.connect(
+        bump_content_version_on_m2m_changed,
+        sender=getattr(Post, _m2m_field).through,
+        dispatch_uid=f"posts.bump_version_{_m2m_field}",
+    )
@@ -0,0 +1,56 @@
+import logging
+
+from botocore.exceptions import BotoCoreError, ClientError
+from django.conf import settings
+from PIL import Image
+
+from .cache import bump_content_version
+from .models import PostImage
+from .thumbnails import refresh_thumbnail_urls
+from utils.images import (
+    UploadRejected,
+    generate_variants,
+    quarantine_upload,
+    verify_upload,
+)
+from utils.storage import storage
+
+logger = logging.getLogger(__name__)
+
+
+def process_post_images(image_ids):
+    post_ids = set()
+
+    for image in PostImage.objects.filter(pk__in=image_ids).only(
+        "id", "post_id", "image_url"
+    ):
+        key = storage.key_from_url(image.image_url)
+        try:
+            body = verify_upload(key, settings.POST_IMAGE_MAX_SIZE)
+        except UploadRejected as e:
+            logger.warning("게시글 이미지 격리: PostImage %s (%s)", image.pk, e)
+            quarantine_upload(key)
+            PostImage.objects.filter(pk=image.pk).update(
+                status="quarantined", variants={}
+            )
+            post_ids.add(image.post_id)
+            continue
+        except (BotoCoreError, ClientError):
+            logger.exception("게시글 이미지 검증 실패: PostImage %s", image.pk)
+            continue
+
+        try:
+            variants = generate_variants(image.image_url, body)
+        except (BotoCoreError, ClientError, OSError, Image.DecompressionBombError):
+            logger.exception("게시글 이미지 변환 실패: PostImage %s", image.pk)
+            variants = {}
+
+        PostImage.objects.filter(pk=image.pk).update(
+            status="verified", variants=variants
+        )
+        post_ids.add(image.post_id)
+
+    if post_ids:
+        # 썸네일을 카드용 변형으로 바꾸고 캐시된 응답을 무효화
+        refresh_thumbnail_urls(post_ids)
+        bump_content_version()
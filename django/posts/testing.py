@@ -0,0 +1,33 @@
+"""posts, notifications 테스트가 같이 쓰는 데이터 생성 도우미."""
+
+import base64
+import json
+
+from posts.models import Post
+from users.models import User
+
+
+def make_user(username):
+    return User.objects.create_user(
+        username, username, f"{username}@example.com", "010-0000-0000"
+    )
+
+
+def make_post(author, **kwargs):
+    data = {
+        "title": "제휴 구해요",
+        "store_name": "가게",
+        "description": "설명",
+        "address": "",
+        "phone_number": "010-0000-0000",
+        "available_time": "10:00-20:00",
+        "author": author,
+    }
+    data.update(kwargs)
+    return Post.objects.create(**data)
+
+
+def raw_cursor(values):
+    """서명 없이 인코딩한 cursor. 조작된 cursor 를 흉내 낼 때 쓴다."""
+    raw = json.dumps(values).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
@@ -1 +1,901 @@
-# Create your tests here.
+import base64
+import json
+import math
+from datetime import timedelta
+from io import BytesIO, StringIO
+from unittest import mock
+
+from botocore.response import StreamingBody
+from botocore.stub import ANY, Stubber
+from django.core.cache import cache
+from django.conf import settings
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from PIL import Image
+from rest_framework.test import APIClient
+
+from notifications.models import Notification, NotificationCounter
+from posts.cache import response_cache_key
+from posts.categories import category_registry
+from posts.matching import matching_index
+from posts.models import ArchivedPost, PartnershipCategory, Post, PostImage, PostTrend
+from posts.popularity import flush_post_views
+from posts.serializers import PostSerializer
+from posts.tasks import process_post_images
+from posts.testing import make_post, make_user, raw_cursor
+from posts.trending import TREND_WINDOWS, record_partner_request
+from utils.decay import DECAY_EPOCH, decayed_amount, log_weight
+from utils.geocoding import KakaoGeocoder, get_geocoder
+from utils.pagination import (
+    InvalidCursor,
+    cursor_fields,
+    decode_cursor,
+    encode_cursor,
+)
+from utils.storage import storage
+
+
+def image_bytes(format):
+    buffer = BytesIO()
+    Image.new("RGB", (8, 8), "red").save(buffer, format=format)
+    return buffer.getvalue()
+
+
+class CursorPaginationTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = make_user("owner")
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def test_tampered_cursor_returns_400(self):
+        now = timezone.now().isoformat()
+        cursors = [
+            "not-base64!!",
+            raw_cursor({"a": 1}),
+            raw_cursor([now]),
+            raw_cursor(["abc", 1]),
+            raw_cursor([now, "x"]),
+            raw_cursor([1, 2]),
+            raw_cursor([now, None]),
+            raw_cursor([now, True]),
+            raw_cursor([now, [1]]),
+        ]
+        for cursor in cursors:
+            response = self.client.get("/api/v1/posts/", {"cursor": cursor})
+            self.assertEqual(response.status_code, 400, cursor)
+
+        response = self.client.get(
+            "/api/v1/posts/", {"sort": "popular", "cursor": raw_cursor(["x", 1])}
+        )
+        self.assertEqual(response.status_code, 400)
+
+    def test_decode_cursor_converts_values(self):
+        fields = cursor_fields(Post.objects.all(), ("-created_at", "-id"))
+        created_at = timezone.now()
+        values = decode_cursor(encode_cursor([created_at, 3]), fields)
+        self.assertEqual(values, [created_at, 3])
+
+        with self.assertRaises(InvalidCursor):
+            decode_cursor(raw_cursor([created_at.isoformat(), "3x"]), fields)
+
+    def test_ties_on_sort_key_are_not_skipped(self):
+        posts = [make_post(self.user, title=f"post {i}") for i in range(7)]
+        # 같은 created_at 이 페이지 경계에 걸쳐도 id 로 이어져야 한다
+        Post.objects.update(created_at=timezone.now())
+
+        seen = []
+        cursor = None
+        while True:
+            params = {"page_size": 3}
+            if cursor:
+                params["cursor"] = cursor
+            data = self.client.get("/api/v1/posts/", params).json()["data"]
+            seen += [card["id"] for card in data["results"]]
+            cursor = data["next"]
+            if cursor is None:
+                break
+
+        self.assertEqual(seen, sorted((post.pk for post in posts), reverse=True))
+
+
+class CategoryIdsTests(TestCase):
+    def test_save_after_m2m_change_keeps_category_ids(self):
+        post = make_post(make_user("author"))
+        cafe = PartnershipCategory.objects.create(name="카페")
+        bakery = PartnershipCategory.objects.create(name="빵집")
+
+        post.store_categories.set([cafe])
+        post.partnership_categories.set([bakery])
+        # 같은 인스턴스를 다시 저장해도 예전 배열로 덮어쓰지 않아야 한다
+        post.title = "새 제목"
+        post.save()
+
+        post.refresh_from_db()
+        self.assertEqual(post.store_category_ids, [cafe.pk])
+        self.assertEqual(post.partnership_category_ids, [bakery.pk])
+
+
+class CategoryFilterTests(TestCase):
+    def test_rejects_ids_outside_integer_range(self):
+        client = APIClient()
+        client.force_authenticate(make_user("owner"))
+        for value in ("0", "-1", "2147483648", "1,99999999999999999999", "abc"):
+            with self.subTest(value=value):
+                response = client.get("/api/v1/posts/", {"store_category": value})
+                self.assertEqual(response.status_code, 400)
+
+        response = client.get("/api/v1/posts/", {"store_category": "2147483647"})
+        self.assertEqual(response.status_code, 200)
+
+
+@override_settings(POST_CACHE_ENABLED=False)
+class CardQueryCountTests(TestCase):
+    def setUp(self):
+        category_registry.invalidate()
+        self.addCleanup(category_registry.invalidate)
+        self.user = make_user("owner")
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def add_posts(self, post_count, category_count):
+        start = PartnershipCategory.objects.count()
+        categories = [
+            PartnershipCategory.objects.create(name=f"카테고리 {i}")
+            for i in range(start, start + category_count)
+        ]
+        for _ in range(post_count):
+            post = make_post(self.user, thumbnail_url="https://example.com/t.jpg")
+            post.store_categories.set(categories)
+            post.partnership_categories.set(categories)
+
+    def count_queries(self, url):
+        # 새 카테고리로 레지스트리를 다시 읽는 첫 요청은 빼고 센다
+        self.client.get(url)
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        return len(queries)
+
+    def test_card_pages_do_not_grow_with_posts_and_categories(self):
+        urls = ["/api/v1/posts/", "/api/v1/posts/myposts/"]
+        self.add_posts(2, 1)
+        few = [self.count_queries(url) for url in urls]
+
+        self.add_posts(30, 12)
+        many = [self.count_queries(url) for url in urls]
+
+        self.assertEqual(few, many)
+        results = self.client.get(urls[0]).json()["data"]["results"]
+        self.assertEqual(len(results), 20)
+        self.assertEqual(len(results[0]["partnership_categories"]), 12)
+
+    def test_category_fields_validate_in_one_query(self):
+        categories = [
+            PartnershipCategory.objects.create(name=f"카테고리 {i}") for i in range(12)
+        ]
+        ids = [category.pk for category in categories]
+        serializer = PostSerializer(
+            data={
+                "title": "제목",
+                "store_name": "가게",
+                "description": "소개",
+                "address": "서울시 마포구",
+                "phone_number": "010-0000-0000",
+                "available_time": "10:00-20:00",
+                "store_categories": ids,
+                "partnership_categories": ids,
+                "images": [
+                    {
+                        "image_url": storage.public_url("posts/photo.png"),
+                        "is_thumbnail": True,
+                    }
+                ],
+            }
+        )
+
+        # 레지스트리가 비어 있으면 카테고리 전체를 한 번 읽고, 그 뒤로는 읽지 않는다
+        with self.assertNumQueries(1):
+            self.assertTrue(serializer.is_valid(), serializer.errors)
+        self.assertEqual(serializer.validated_data["store_categories"], categories)
+
+
+class SearchTests(TestCase):
+    def setUp(self):
+        self.user = make_user("owner")
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def search(self, q, **params):
+        response = self.client.get("/api/v1/posts/search/", {"q": q, **params})
+        self.assertEqual(response.status_code, 200)
+        return response.json()["data"]
+
+    def test_title_matches_rank_above_description_matches(self):
+        in_description = make_post(self.user, description="수제 케이크를 굽습니다")
+        in_title = make_post(self.user, title="케이크 전문점")
+        make_post(self.user, title="케이크 가게", is_active=False)
+        make_post(self.user, title="빵집")
+
+        ids = [card["id"] for card in self.search("케이크")["results"]]
+        self.assertEqual(ids, [in_title.pk, in_description.pk])
+
+        # 다음 페이지도 같은 순위를 이어간다
+        first = self.search("케이크", page_size=1)
+        second = self.search("케이크", page_size=1, cursor=first["next"])
+        self.assertEqual([first["results"][0]["id"], second["results"][0]["id"]], ids)
+        self.assertIsNone(second["next"])
+
+    def test_edits_are_searchable(self):
+        post = make_post(self.user, description="커피")
+        self.assertEqual(self.search("라떼")["results"], [])
+
+        post.description = "카페라떼"
+        post.save()
+
+        self.assertEqual(
+            [card["id"] for card in self.search("라떼")["results"]], [post.pk]
+        )
+
+
+class CategoryRegistryTests(TestCase):
+    def setUp(self):
+        category_registry.invalidate()
+        self.addCleanup(category_registry.invalidate)
+        self.cafe = PartnershipCategory.objects.create(name="카페")
+
+    def names(self, ids):
+        return {pk: c.name for pk, c in category_registry.get_many(ids).items()}
+
+    def test_changes_invalidate_after_commit(self):
+        self.assertEqual(self.names([self.cafe.pk]), {self.cafe.pk: "카페"})
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.cafe.name = "디저트 카페"
+            self.cafe.save()
+            # 커밋 전에는 예전 값을 그대로 쓴다
+            with self.assertNumQueries(0):
+                self.assertEqual(self.names([self.cafe.pk]), {self.cafe.pk: "카페"})
+        self.assertEqual(self.names([self.cafe.pk]), {self.cafe.pk: "디저트 카페"})
+
+        pk = self.cafe.pk
+        with self.captureOnCommitCallbacks(execute=True):
+            self.cafe.delete()
+        self.assertEqual(self.names([pk]), {})
+
+    def test_unknown_id_reloads_once(self):
+        self.names([self.cafe.pk])
+        # 커밋 콜백을 돌리지 않아 다른 워커가 추가한 카테고리처럼 invalidate 가 없다
+        bakery = PartnershipCategory.objects.create(name="빵집")
+
+        with self.assertNumQueries(1):
+            self.assertEqual(self.names([bakery.pk]), {bakery.pk: "빵집"})
+        with self.assertNumQueries(0):
+            self.names([self.cafe.pk, bakery.pk])
+
+    def test_category_list_answers_304_until_categories_change(self):
+        client = APIClient()
+        etag = client.get("/api/v1/posts/categories/")["ETag"]
+
+        response = client.get("/api/v1/posts/categories/", HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+
+        PartnershipCategory.objects.create(name="빵집")
+        response = client.get("/api/v1/posts/categories/", HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.json()["data"]), 2)
+
+
+@override_settings(POST_CACHE_ENABLED=True)
+class ResponseCacheTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = make_user("owner")
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def feed(self, sort):
+        response = self.client.get("/api/v1/posts/", {"sort": sort})
+        return [card["id"] for card in response.json()["data"]["results"]]
+
+    @override_settings(POST_CACHE_ENABLED=False)
+    def test_disabled_without_shared_cache(self):
+        post = make_post(self.user)
+        response = self.client.get("/api/v1/posts/")
+        self.assertIsNone(response_cache_key(response.wsgi_request))
+
+        # 다른 프로세스의 변경처럼 신호 없이 바꿔도 바로 보인다
+        Post.objects.filter(pk=post.pk).update(title="바뀐 제목")
+        response = self.client.get("/api/v1/posts/")
+        self.assertEqual(response.json()["data"]["results"][0]["title"], "바뀐 제목")
+
+    def test_view_flush_invalidates_popular_feed_only(self):
+        first = make_post(self.user)
+        second = make_post(self.user)
+        self.assertEqual(self.feed("popular"), [second.pk, first.pk])
+        self.assertEqual(self.feed("latest"), [second.pk, first.pk])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            flush_post_views({first.pk: 3})
+        # 최신순 캐시는 그대로 두고, 인기순만 새로 계산한다
+        Post.objects.filter(pk=second.pk).update(title="캐시 확인")
+        self.assertEqual(self.feed("popular"), [first.pk, second.pk])
+        latest = self.client.get("/api/v1/posts/", {"sort": "latest"}).json()
+        self.assertNotIn("캐시 확인", str(latest))
+
+
+@override_settings(POST_CACHE_ENABLED=False)
+class PostDetailConditionalTests(TestCase):
+    def setUp(self):
+        self.user = make_user("owner")
+        self.post = make_post(self.user)
+        self.url = f"/api/v1/posts/{self.post.pk}/"
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def test_matching_etag_returns_304_without_serializing(self):
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, 200)
+        etag = response["ETag"]
+
+        # 행 버전만 읽고 게시글/이미지 조회와 직렬화는 건너뛴다 (조회수 반영은 따로 센다)
+        with mock.patch("posts.views.post_view_counter"), mock.patch(
+            "posts.views.PostDetailSerializer.to_representation"
+        ) as serialize, self.assertNumQueries(1):
+            response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+        serialize.assert_not_called()
+
+        self.post.title = "바뀐 제목"
+        self.post.save()
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response["ETag"], etag)
+
+    def test_thumbnail_follows_image_changes(self):
+        first = PostImage.objects.create(
+            post=self.post, image_url="https://example.com/1.jpg"
+        )
+        self.post.refresh_from_db()
+        self.assertEqual(self.post.thumbnail_url, first.image_url)
+        etag = self.client.get(self.url)["ETag"]
+
+        thumbnail = PostImage.objects.create(
+            post=self.post, image_url="https://example.com/2.jpg", is_thumbnail=True
+        )
+        self.post.refresh_from_db()
+        self.assertEqual(self.post.thumbnail_url, thumbnail.image_url)
+        # 썸네일이 바뀌면 상세 ETag 도 바뀐다
+        self.assertEqual(
+            self.client.get(self.url, HTTP_IF_NONE_MATCH=etag).status_code, 200
+        )
+
+        thumbnail.delete()
+        self.post.refresh_from_db()
+        self.assertEqual(self.post.thumbnail_url, first.image_url)
+
+        first.delete()
+        self.post.refresh_from_db()
+        self.assertEqual(self.post.thumbnail_url, "")
+
+
+class MatchingIndexTests(TestCase):
+    CAFE, BAKERY, FLOWER = 1, 2, 3
+
+    def setUp(self):
+        self.me = make_user("me")
+        self.other = make_user("other")
+
+    def test_recommend_scores_only_matching_candidates(self):
+        match = make_post(
+            self.other,
+            store_category_ids=[self.BAKERY],
+            partnership_category_ids=[self.CAFE],
+        )
+        make_post(self.other, partnership_category_ids=[self.FLOWER])
+        make_post(self.me, partnership_category_ids=[self.CAFE, self.BAKERY])
+        matching_index.rebuild()
+
+        # 내 게시글은 후보가 아니고, 내가 찾는 업종(BAKERY)이 겹치면 1점 더 받는다
+        self.assertEqual(
+            matching_index.recommend(self.me.pk, [self.CAFE], 10), [(match.pk, 2)]
+        )
+        self.assertEqual(matching_index.recommend(self.me.pk, [99], 10), [])
+
+    def test_refreshes_after_commit(self):
+        matching_index.rebuild()
+        with self.captureOnCommitCallbacks() as callbacks:
+            post = make_post(self.other, partnership_category_ids=[self.CAFE])
+        self.assertEqual(matching_index.recommend(self.me.pk, [self.CAFE], 10), [])
+
+        for callback in callbacks:
+            callback()
+        self.assertEqual(
+            matching_index.recommend(self.me.pk, [self.CAFE], 10), [(post.pk, 1)]
+        )
+
+        with self.captureOnCommitCallbacks(execute=True):
+            Post.objects.get(pk=post.pk).delete()
+        self.assertEqual(matching_index.recommend(self.me.pk, [self.CAFE], 10), [])
+
+
+class DecayTests(TestCase):
+    def test_log_weight_grows_by_ln2_per_half_life(self):
+        at = DECAY_EPOCH + timedelta(days=10)
+        later = at + timedelta(hours=1)
+        self.assertAlmostEqual(
+            log_weight(1, later, 3600) - log_weight(1, at, 3600), math.log(2)
+        )
+        self.assertAlmostEqual(
+            log_weight(4, at, 3600) - log_weight(1, at, 3600), math.log(4)
+        )
+
+    def test_decayed_amount_halves_after_half_life(self):
+        at = DECAY_EPOCH + timedelta(days=3)
+        score = log_weight(6, at, 600)
+        self.assertAlmostEqual(decayed_amount(score, at, 600), 6)
+        self.assertAlmostEqual(
+            decayed_amount(score, at + timedelta(seconds=600), 600), 3
+        )
+
+    def test_log_add_sums_in_log_space(self):
+        post = make_post(make_user("author"))
+        now = timezone.now()
+        flush_post_views({post.pk: 2})
+        flush_post_views({post.pk: 3})
+        post.refresh_from_db()
+
+        expected = math.log(
+            math.exp(0) + 5 * math.exp(log_weight(1, now, 2 * 24 * 60 * 60))
+        )
+        self.assertAlmostEqual(post.popularity_score, expected, places=3)
+        self.assertEqual(post.view_count, 5)
+
+    @override_settings(POST_POPULARITY_HALF_LIFE=60)
+    def test_log_add_does_not_underflow_on_large_gap(self):
+        # 기본 점수 0 과 새 가중치의 차이가 수천 이상이면 EXP 가 underflow 나던 경우
+        post = make_post(make_user("author"))
+        now = timezone.now()
+        flush_post_views({post.pk: 1})
+        post.refresh_from_db()
+
+        self.assertGreater(log_weight(1, now, 60), 745)
+        self.assertAlmostEqual(
+            post.popularity_score, log_weight(1, now, 60), delta=1e-3
+        )
+
+
+class TrendingTests(TestCase):
+    def test_partner_request_after_long_gap(self):
+        author = make_user("author")
+        sender = make_user("sender")
+        post = make_post(author)
+        # 1h 구간은 45일쯤 지나면 이전 점수와의 차이가 EXP underflow 범위를 넘는다
+        record_partner_request(post.pk, at=timezone.now() - timedelta(days=60))
+
+        client = APIClient()
+        client.force_authenticate(sender)
+        response = client.post(
+            "/api/v1/notifications/partner-request/",
+            {"post": post.pk, "message": "제휴해요"},
+            format="json",
+        )
+
+        self.assertEqual(response.status_code, 201)
+        trend = PostTrend.objects.get(post=post)
+        now = timezone.now()
+        for field, half_life in TREND_WINDOWS.values():
+            # 60일 전 요청은 7d 구간에서도 0.003 미만만 남는다
+            amount = decayed_amount(getattr(trend, field), now, half_life)
+            self.assertAlmostEqual(amount, 1, delta=0.01)
+
+
+class ArchivePostsTests(TestCase):
+    def make_archivable(self, author, image_count):
+        post = make_post(author)
+        PostImage.objects.bulk_create(
+            PostImage(
+                post=post,
+                image_url=f"https://example.com/{post.pk}/{i}.jpg",
+                is_thumbnail=i == 0,
+            )
+            for i in range(image_count)
+        )
+        Post.objects.filter(pk=post.pk).update(
+            is_active=False, updated_at=timezone.now() - timedelta(days=365)
+        )
+        return post
+
+    def archive(self):
+        with CaptureQueriesContext(connection) as queries:
+            call_command("archive_posts", stdout=StringIO())
+        return len(queries)
+
+    def test_query_count_does_not_grow_with_images(self):
+        author = make_user("author")
+        for _ in range(10):
+            self.make_archivable(author, 1)
+        few_images = self.archive()
+
+        for _ in range(10):
+            self.make_archivable(author, 10)
+        many_images = self.archive()
+
+        self.assertEqual(few_images, many_images)
+        self.assertLess(many_images, 20)
+        self.assertFalse(Post.objects.exists())
+        self.assertFalse(PostImage.objects.exists())
+        self.assertEqual(ArchivedPost.objects.count(), 20)
+
+    def test_category_match_notifications_do_not_block_archiving(self):
+        author = make_user("author")
+        owner = make_user("owner")
+        post = self.make_archivable(author, 1)
+        for is_read in (False, False, True):
+            Notification.objects.create(
+                user=owner,
+                sender=author,
+                post=post,
+                kind="category_match",
+                message="관심 카테고리 알림",
+                is_read=is_read,
+            )
+        self.assertEqual(NotificationCounter.objects.get(pk=owner.pk).unread_count, 2)
+
+        self.archive()
+
+        self.assertFalse(Post.objects.filter(pk=post.pk).exists())
+        self.assertTrue(ArchivedPost.objects.filter(pk=post.pk).exists())
+        self.assertFalse(Notification.objects.exists())
+        self.assertEqual(NotificationCounter.objects.get(pk=owner.pk).unread_count, 0)
+
+    def test_keeps_posts_with_partner_request_notifications(self):
+        author = make_user("author")
+        owner = make_user("owner")
+        post = self.make_archivable(author, 1)
+        Notification.objects.create(
+            user=author,
+            sender=owner,
+            post=post,
+            kind="partner_request",
+            message="제휴 요청",
+        )
+
+        self.archive()
+
+        self.assertTrue(Post.objects.filter(pk=post.pk).exists())
+        self.assertFalse(ArchivedPost.objects.exists())
+
+
+OFFLINE_ADDRESSES = {"합정": (37.5495, 126.9139), "망원": (37.5556, 126.9104)}
+
+
+@override_settings(
+    GEOCODER_BACKEND="utils.geocoding.OfflineGeocoder",
+    GEOCODER_OFFLINE_ADDRESSES=OFFLINE_ADDRESSES,
+)
+class GeocodingTests(TestCase):
+    def setUp(self):
+        get_geocoder.cache_clear()
+        self.addCleanup(get_geocoder.cache_clear)
+        self.user = make_user("owner")
+
+    def test_geocodes_after_commit(self):
+        with mock.patch.object(
+            get_geocoder(), "geocode", wraps=get_geocoder().geocode
+        ) as geocode:
+            with self.captureOnCommitCallbacks(execute=True):
+                post = make_post(self.user, address="합정")
+                # 요청 트랜잭션 안에서는 외부 API 를 부르지 않는다
+                geocode.assert_not_called()
+
+        post.refresh_from_db()
+        self.assertEqual((post.latitude, post.longitude), OFFLINE_ADDRESSES["합정"])
+        self.assertTrue(post.geohash)
+
+    def test_address_change_clears_and_regeocodes(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            post = make_post(self.user, address="합정")
+        post.refresh_from_db()
+
+        post.address = "모르는 주소"
+        with self.captureOnCommitCallbacks(execute=True):
+            post.save()
+        post.refresh_from_db()
+        self.assertIsNone(post.latitude)
+        self.assertEqual(post.geohash, "")
+
+        post.address = "망원"
+        with self.captureOnCommitCallbacks(execute=True):
+            post.save()
+        post.refresh_from_db()
+        self.assertEqual(post.latitude, OFFLINE_ADDRESSES["망원"][0])
+
+    def test_unchanged_address_is_not_geocoded_again(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            post = make_post(self.user, address="모르는 주소")
+        post.refresh_from_db()
+        self.assertIsNone(post.latitude)
+
+        with mock.patch.object(get_geocoder(), "geocode") as geocode:
+            with self.captureOnCommitCallbacks(execute=True):
+                post.title = "제목만 바꿈"
+                post.save()
+        geocode.assert_not_called()
+
+
+@override_settings(KAKAO_REST_API_KEY="test-key")
+class KakaoGeocoderTests(TestCase):
+    def geocode(self, payload):
+        response = BytesIO(json.dumps(payload).encode())
+        with mock.patch("utils.geocoding.urlopen", return_value=response):
+            return KakaoGeocoder().geocode("합정")
+
+    def test_parses_first_document(self):
+        payload = {"documents": [{"x": "126.9139", "y": "37.5495"}]}
+        self.assertEqual(self.geocode(payload), (37.5495, 126.9139))
+
+    def test_malformed_documents_return_none(self):
+        for payload in (
+            {"documents": []},
+            {"documents": [{"x": "126.9"}]},
+            {"documents": [{"x": "경도", "y": "위도"}]},
+            {"documents": [None]},
+            {"documents": "x"},
+            ["documents"],
+        ):
+            self.assertIsNone(self.geocode(payload), payload)
+
+
+@override_settings(S3_MULTIPART_THRESHOLD=10, S3_MULTIPART_PART_SIZE=10)
+class MultipartUploadTests(TestCase):
+    key = "posts/big.png"
+
+    def setUp(self):
+        self.client = APIClient()
+        self.client.force_authenticate(make_user("owner"))
+        self.stubber = Stubber(storage.client)
+        self.stubber.activate()
+        self.addCleanup(self.stubber.deactivate)
+
+    def post(self, path, data):
+        return self.client.post(
+            f"/api/v1/posts/image-upload/{path}", data, format="json"
+        )
+
+    def test_batch_opens_multipart_upload_for_large_files(self):
+        self.stubber.add_response(
+            "create_multipart_upload",
+            {"UploadId": "upload-1"},
+            {"Bucket": storage.bucket, "Key": ANY, "ContentType": "image/png"},
+        )
+        response = self.post(
+            "batch/",
+            {
+                "files": [
+                    {"filename": "small.png", "content_type": "image/png", "size": 5},
+                    {"filename": "big.png", "content_type": "image/png", "size": 25},
+                ]
+            },
+        )
+
+        self.assertEqual(response.status_code, 200)
+        small, big = response.json()["data"]["files"]
+        self.assertEqual(small["type"], "single")
+        self.assertEqual(small["fields"]["Content-Type"], "image/png")
+        self.assertEqual(big["type"], "multipart")
+        self.assertEqual(big["upload_id"], "upload-1")
+        self.assertEqual([part["part_number"] for part in big["parts"]], [1, 2, 3])
+        self.assertIn("uploadId=upload-1", big["parts"][2]["upload_url"])
+        self.assertIn("partNumber=3", big["parts"][2]["upload_url"])
+        self.stubber.assert_no_pending_responses()
+
+    def test_complete_sends_parts_in_order(self):
+        self.stubber.add_response(
+            "complete_multipart_upload",
+            {},
+            {
+                "Bucket": storage.bucket,
+                "Key": self.key,
+                "UploadId": "upload-1",
+                "MultipartUpload": {
+                    "Parts": [
+                        {"PartNumber": 1, "ETag": '"e1"'},
+                        {"PartNumber": 2, "ETag": '"e2"'},
+                    ]
+                },
+            },
+        )
+        response = self.post(
+            "multipart/complete/",
+            {
+                "key": self.key,
+                "upload_id": "upload-1",
+                "parts": [
+                    {"part_number": 2, "etag": '"e2"'},
+                    {"part_number": 1, "etag": '"e1"'},
+                ],
+            },
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            response.json()["data"]["image_url"], storage.public_url(self.key)
+        )
+        self.stubber.assert_no_pending_responses()
+
+    def test_complete_with_unknown_upload_returns_400(self):
+        self.stubber.add_client_error("complete_multipart_upload", "NoSuchUpload")
+        response = self.post(
+            "multipart/complete/",
+            {
+                "key": self.key,
+                "upload_id": "gone",
+                "parts": [{"part_number": 1, "etag": '"e1"'}],
+            },
+        )
+        self.assertEqual(response.status_code, 400)
+
+    def test_key_outside_post_prefix_is_rejected(self):
+        response = self.post(
+            "multipart/complete/",
+            {
+                "key": "users/other.png",
+                "upload_id": "upload-1",
+                "parts": [{"part_number": 1, "etag": '"e1"'}],
+            },
+        )
+        self.assertEqual(response.status_code, 400)
+        self.stubber.assert_no_pending_responses()
+
+    def test_resume_presigns_only_missing_parts(self):
+        self.stubber.add_response(
+            "list_parts",
+            {"Parts": [{"PartNumber": 2, "ETag": '"e2"'}], "IsTruncated": False},
+            {"Bucket": storage.bucket, "Key": self.key, "UploadId": "upload-1"},
+        )
+        response = self.post(
+            "multipart/resume/",
+            {"key": self.key, "upload_id": "upload-1", "size": 25},
+        )
+
+        self.assertEqual(response.status_code, 200)
+        data = response.json()["data"]
+        self.assertEqual(data["uploaded_parts"], [{"part_number": 2, "etag": '"e2"'}])
+        self.assertEqual([part["part_number"] for part in data["parts"]], [1, 3])
+        self.stubber.assert_no_pending_responses()
+
+
+class PostImageUploadTests(TestCase):
+    key = "posts/photo.png"
+
+    def setUp(self):
+        self.stubber = Stubber(storage.client)
+        self.stubber.activate()
+        self.addCleanup(self.stubber.deactivate)
+
+    def make_image(self):
+        post = make_post(make_user("author"))
+        return PostImage.objects.create(
+            post=post, image_url=storage.public_url(self.key), is_thumbnail=True
+        )
+
+    def stub_upload(self, body, content_type="image/png"):
+        params = {"Bucket": storage.bucket, "Key": self.key}
+        self.stubber.add_response(
+            "head_object",
+            {"ContentType": content_type, "ContentLength": len(body)},
+            params,
+        )
+        self.stubber.add_response(
+            "get_object",
+            {"Body": StreamingBody(BytesIO(body), len(body))},
+            params,
+        )
+
+    def stub_quarantine(self):
+        self.stubber.add_response(
+            "copy_object",
+            {},
+            {
+                "Bucket": storage.bucket,
+                "Key": f"quarantine/{self.key}",
+                "CopySource": {"Bucket": storage.bucket, "Key": self.key},
+            },
+        )
+        self.stubber.add_response(
+            "delete_object", {}, {"Bucket": storage.bucket, "Key": self.key}
+        )
+
+    def test_presigned_post_limits_size_and_content_type(self):
+        client = APIClient()
+        client.force_authenticate(make_user("owner"))
+        response = client.post(
+            "/api/v1/posts/image-upload/",
+            {"filename": "photo.png", "content_type": "image/png"},
+            format="json",
+        )
+
+        self.assertEqual(response.status_code, 200)
+        data = response.json()["data"]
+        self.assertEqual(data["fields"]["Content-Type"], "image/png")
+        self.assertTrue(data["fields"]["key"].startswith("posts/"))
+        policy = json.loads(base64.b64decode(data["fields"]["policy"]))
+        self.assertIn({"Content-Type": "image/png"}, policy["conditions"])
+        self.assertIn(
+            ["content-length-range", 1, settings.POST_IMAGE_MAX_SIZE],
+            policy["conditions"],
+        )
+
+    def create_post(self, client, image_url):
+        category = PartnershipCategory.objects.get_or_create(name="카페")[0]
+        return client.post(
+            "/api/v1/posts/",
+            {
+                "title": "제목",
+                "store_name": "가게",
+                "description": "소개",
+                "address": "서울시 마포구",
+                "phone_number": "010-0000-0000",
+                "available_time": "10:00-20:00",
+                "store_categories": [category.pk],
+                "partnership_categories": [category.pk],
+                "images": [{"image_url": image_url, "is_thumbnail": True}],
+            },
+            format="json",
+        )
+
+    def test_image_url_must_point_to_upload_prefix(self):
+        client = APIClient()
+        client.force_authenticate(make_user("owner"))
+        for image_url in (
+            "https://example.com/posts/photo.png",
+            storage.public_url("users/photo.png"),
+        ):
+            with self.subTest(image_url=image_url):
+                response = self.create_post(client, image_url)
+                self.assertEqual(response.status_code, 400)
+                self.assertIn("images", response.json()["data"])
+        self.assertFalse(Post.objects.exists())
+
+        response = self.create_post(client, storage.public_url(self.key))
+        self.assertEqual(response.status_code, 201)
+
+    def test_valid_upload_is_verified(self):
+        image = self.make_image()
+        self.stub_upload(image_bytes("PNG"))
+        for _ in range(4):
+            # card/detail 크기별 WebP/JPEG 변형
+            self.stubber.add_response("put_object", {})
+
+        process_post_images([image.pk])
+
+        image.refresh_from_db()
+        self.assertEqual(image.status, "verified")
+        self.assertEqual(image.variants["original"], image.image_url)
+        self.stubber.assert_no_pending_responses()
+
+    def test_spoofed_content_type_is_quarantined(self):
+        image = self.make_image()
+        self.stub_upload(image_bytes("JPEG"), content_type="image/png")
+        self.stub_quarantine()
+
+        process_post_images([image.pk])
+
+        image.refresh_from_db()
+        self.assertEqual(image.status, "quarantined")
+        self.stubber.assert_no_pending_responses()
+
+    def test_missing_upload_is_quarantined(self):
+        image = self.make_image()
+        self.stubber.add_client_error("head_object", "404", http_status_code=404)
+        self.stubber.add_client_error("copy_object", "NoSuchKey", http_status_code=404)
+
+        process_post_images([image.pk])
+
+        image.refresh_from_db()
+        self.assertEqual(image.status, "quarantined")
+        self.stubber.assert_no_pending_responses()
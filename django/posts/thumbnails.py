@@ -0,0 +1,41 @@
+from django.db.models import OuterRef, Subquery, URLField, Value
+from django.db.models.fields.json import KT
+from django.db.models.functions import Coalesce, Now, NullIf
+
+from .events import posts_bulk_updated
+from .models import Post, PostImage
+
+
+def thumbnail_subquery():
+    """
+    is_thumbnail 이미지, 없으면 가장 먼저 올린 이미지의 URL. 격리된 이미지는 건너뛴다.
+    카드용 변형이 만들어져 있으면 그 URL 을 쓴다.
+    """
+    return Subquery(
+        PostImage.objects.filter(post=OuterRef("pk"))
+        .exclude(status="quarantined")
+        .order_by("-is_thumbnail", "id")
+        .annotate(
+            url=Coalesce(
+                NullIf(KT("variants__card"), Value("")),
+                "image_url",
+                output_field=URLField(),
+            )
+        )
+        .values("url")[:1]
+    )
+
+
+def pick_thumbnail_url(images_data):
+    for image_data in images_data:
+        if image_data.get("is_thumbnail"):
+            return image_data["image_url"]
+    return images_data[0]["image_url"] if images_data else ""
+
+
+def refresh_thumbnail_urls(post_ids):
+    post_ids = list(post_ids)
+    Post.objects.filter(pk__in=post_ids).update(
+        thumbnail_url=Coalesce(thumbnail_subquery(), Value("")), updated_at=Now()
+    )
+    posts_bulk_updated.send(sender=Post, post_ids=post_ids)
@@ -0,0 +1,47 @@
+from django.db import IntegrityError, transaction
+from django.db.models.functions import Now
+from django.utils import timezone
+
+from .models import Post, PostTrend
+from utils.decay import log_add, log_weight
+
+# 구간 이름 → (PostTrend 컬럼, 반감기 초)
+TREND_WINDOWS = {
+    "1h": ("score_1h", 60 * 60),
+    "24h": ("score_24h", 24 * 60 * 60),
+    "7d": ("score_7d", 7 * 24 * 60 * 60),
+}
+
+
+def _weights(at, amount=1):
+    return {
+        field: log_weight(amount, at, half_life)
+        for field, half_life in TREND_WINDOWS.values()
+    }
+
+
+def record_partner_request(post_id, at=None):
+    """제휴 요청 하나를 게시글의 모든 구간 점수에 더한다. GROUP BY 없이 행 하나만 갱신한다."""
+    weights = _weights(at or timezone.now())
+    updates = {field: log_add(field, weight) for field, weight in weights.items()}
+    updates["updated_at"] = Now()
+
+    if PostTrend.objects.filter(post_id=post_id).update(**updates):
+        return
+    try:
+        with transaction.atomic():
+            PostTrend.objects.create(post_id=post_id, **weights)
+    except IntegrityError:
+        # 동시에 다른 요청이 먼저 행을 만들었다
+        PostTrend.objects.filter(post_id=post_id).update(**updates)
+
+
+def trending_posts(window):
+    """
+    window 구간 점수 순 활성 게시글 queryset.
+    점수 컬럼 인덱스를 순서대로 읽으므로 [:k] 로 자르면 k 개만큼만 읽는다.
+    """
+    field, _ = TREND_WINDOWS[window]
+    return Post.objects.filter(is_active=True, trend__isnull=False).order_by(
+        f"-trend__{field}", "-id"
+    )
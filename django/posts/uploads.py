@@ -0,0 +1,82 @@
+import math
+import uuid
+
+from django.conf import settings
+
+from utils.storage import storage
+
+POST_IMAGE_PREFIX = "posts/"
+PRESIGNED_URL_EXPIRES = 300
+# 멀티파트 part URL 은 업로드가 길어질 수 있어 더 길게 준다
+MULTIPART_URL_EXPIRES = 3600
+S3_MAX_PARTS = 10000
+
+
+def new_post_image_key(filename):
+    ext = filename.split(".")[-1]
+    return f"{POST_IMAGE_PREFIX}{uuid.uuid4()}.{ext}"
+
+
+def part_count(size):
+    return max(1, math.ceil(size / settings.S3_MULTIPART_PART_SIZE))
+
+
+def presign_parts(key, upload_id, part_numbers):
+    return [
+        {
+            "part_number": part_number,
+            "upload_url": storage.presign_upload_part(
+                key, upload_id, part_number, MULTIPART_URL_EXPIRES
+            ),
+        }
+        for part_number in part_numbers
+    ]
+
+
+def build_upload_target(filename, content_type, size):
+    """
+    파일 하나의 업로드 대상을 만든다.
+    S3_MULTIPART_THRESHOLD 보다 크면 멀티파트 업로드를 열고 part 별 presigned URL 을 준다.
+    멀티파트는 정책 조건을 걸 수 없어 업로드 후 검증(posts/tasks.py)에만 의존한다.
+    """
+    key = new_post_image_key(filename)
+    target = {"key": key, "image_url": storage.public_url(key)}
+
+    if size <= settings.S3_MULTIPART_THRESHOLD:
+        # 선언한 크기와 Content-Type 을 넘는 업로드는 S3 가 정책 조건으로 거부한다
+        presigned_post = storage.presign_post(
+            key, content_type, size, PRESIGNED_URL_EXPIRES
+        )
+        target["type"] = "single"
+        target["upload_url"] = presigned_post["url"]
+        target["fields"] = presigned_post["fields"]
+        return target
+
+    upload_id = storage.create_multipart_upload(key, content_type)
+    target.update(
+        {
+            "type": "multipart",
+            "upload_id": upload_id,
+            "part_size": settings.S3_MULTIPART_PART_SIZE,
+            "parts": presign_parts(key, upload_id, range(1, part_count(size) + 1)),
+        }
+    )
+    return target
+
+
+def uploaded_parts(key, upload_id):
+    return [
+        {"part_number": part["PartNumber"], "etag": part["ETag"]}
+        for part in storage.list_parts(key, upload_id)
+    ]
+
+
+def complete_multipart_upload(key, upload_id, parts):
+    storage.complete_multipart_upload(
+        key,
+        upload_id,
+        [
+            {"PartNumber": part["part_number"], "ETag": part["etag"]}
+            for part in sorted(parts, key=lambda part: part["part_number"])
+        ],
+    )
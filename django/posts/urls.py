@@ -2,17 +2,41 @@ from django.urls import path
 from .views import (
     PostListCreateView,
     PostDetailView,
+    PostSearchView,
+    RecommendedPostListView,
+    TrendingPostListView,
     PartnershipCategoryListView,
     PostImageUploadPresignedURLView,
+    PostImageBatchUploadView,
+    PostImageMultipartCompleteView,
+    PostImageMultipartResumeView,
     MyPostListView,
 )
 
 urlpatterns = [
     path("", PostListCreateView.as_view(), name="post-list-create"),
     path("<int:pk>/", PostDetailView.as_view(), name="post-detail"),
+    path("search/", PostSearchView.as_view(), name="post-search"),
+    path("recommended/", RecommendedPostListView.as_view(), name="post-recommended"),
+    path("trending/", TrendingPostListView.as_view(), name="post-trending"),
     path("categories/", PartnershipCategoryListView.as_view(), name="categories"),
     path(
         "image-upload/", PostImageUploadPresignedURLView.as_view(), name="image-upload"
     ),
+    path(
+        "image-upload/batch/",
+        PostImageBatchUploadView.as_view(),
+        name="image-upload-batch",
+    ),
+    path(
+        "image-upload/multipart/complete/",
+        PostImageMultipartCompleteView.as_view(),
+        name="image-upload-multipart-complete",
+    ),
+    path(
+        "image-upload/multipart/resume/",
+        PostImageMultipartResumeView.as_view(),
+        name="image-upload-multipart-resume",
+    ),
     path("myposts/", MyPostListView.as_view(), name="my-posts"),
 ]
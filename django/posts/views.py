@@ -2,28 +2,110 @@ from rest_framework import status
 from rest_framework.views import APIView
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.generics import RetrieveAPIView, ListAPIView
-from .models import Post, PartnershipCategory
+from .models import Post, PostImage, PartnershipCategory
 from .serializers import (
     PostSerializer,
-    PostListSerializer,
     PostDetailSerializer,
     PartnershipCategorySerializer,
+    UploadBatchSerializer,
+    MultipartCompleteSerializer,
+    MultipartResumeSerializer,
+)
+from .cache import response_cache_key, get_cached_response, set_cached_response
+from .cards import card_queryset, build_cards
+from .filters import filter_posts_by_categories, filter_posts_near
+from .matching import matching_index
+from .popularity import post_view_counter
+from .trending import TREND_WINDOWS, trending_posts
+from .search import search_posts
+from .uploads import (
+    PRESIGNED_URL_EXPIRES,
+    build_upload_target,
+    complete_multipart_upload,
+    new_post_image_key,
+    part_count,
+    presign_parts,
+    uploaded_parts,
 )
 from utils.response import success_response, error_response
+from utils.conditional import conditional_get
+from utils.decay import decayed_amount
+from utils.pagination import paginate_by_cursor, InvalidCursor
+from utils.storage import storage
+from stores.models import Store
 
 from django.conf import settings
-import boto3
-import uuid
-from botocore.exceptions import ClientError
+from django.utils import timezone
+from django.db.models import Count, Max, Prefetch
+from botocore.exceptions import BotoCoreError, ClientError
+
+# near=store 반경 (m)
+DEFAULT_NEAR_RADIUS = 1000
+MAX_NEAR_RADIUS = 20000
+
+# ?sort= 값 → 커서 정렬 키
+FEED_ORDERINGS = {
+    "latest": ("-created_at", "-id"),
+    "popular": ("-popularity_score", "-id"),
+}
+
+DEFAULT_RECOMMEND_LIMIT = 20
+MAX_RECOMMEND_LIMIT = 100
+
+DEFAULT_TRENDING_LIMIT = 20
+MAX_TRENDING_LIMIT = 100
 
 
 class PostListCreateView(APIView):
     permission_classes = [IsAuthenticated]
 
     def get(self, request):
-        posts = Post.objects.filter(is_active=True).order_by("-created_at")
-        serializer = PostDetailSerializer(posts, many=True)
-        return success_response("게시글 목록 조회 성공", serializer.data)
+        near_store = request.query_params.get("near") == "store"
+        popular = request.query_params.get("sort") == "popular"
+        # near=store 는 사용자 가게 위치에 따라 결과가 달라서 캐시하지 않는다
+        cache_key = None if near_store else response_cache_key(request, popular)
+        data = get_cached_response(cache_key)
+        if data is not None:
+            return success_response("게시글 목록 조회 성공", data)
+
+        ordering = FEED_ORDERINGS.get(request.query_params.get("sort", "latest"))
+        if ordering is None:
+            return error_response("sort 값은 latest 또는 popular 만 가능합니다.")
+
+        posts = Post.objects.filter(is_active=True)
+        try:
+            posts = filter_posts_by_categories(posts, request.query_params)
+        except ValueError:
+            return error_response("카테고리 필터 값이 올바르지 않습니다.")
+
+        if near_store:
+            try:
+                store = request.user.store
+            except Store.DoesNotExist:
+                return error_response(
+                    "가게 정보가 등록되어 있지 않습니다.", status_code=404
+                )
+            if store.latitude is None:
+                return error_response("가게 주소의 위치 정보를 찾을 수 없습니다.")
+
+            try:
+                radius = float(request.query_params.get("radius", DEFAULT_NEAR_RADIUS))
+            except ValueError:
+                return error_response("radius 값이 올바르지 않습니다.")
+            radius = max(1.0, min(radius, MAX_NEAR_RADIUS))
+
+            posts = filter_posts_near(posts, store.latitude, store.longitude, radius)
+
+        try:
+            page, next_cursor = paginate_by_cursor(
+                card_queryset(posts, "popularity_score"), request, ordering
+            )
+        except InvalidCursor:
+            return error_response("유효하지 않은 cursor 값입니다.")
+
+        data = {"results": build_cards(page), "next": next_cursor}
+        set_cached_response(cache_key, data)
+        return success_response("게시글 목록 조회 성공", data)
 
     def post(self, request):
         serializer = PostSerializer(data=request.data, context={"request": request})
@@ -37,22 +119,146 @@ class PostListCreateView(APIView):
         return error_response("입력값 오류", serializer.errors)
 
 
+class PostSearchView(APIView):
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request):
+        q = request.query_params.get("q", "").strip()
+        if not q:
+            return error_response("검색어를 입력해주세요.")
+
+        posts = search_posts(Post.objects.filter(is_active=True), q)
+        try:
+            page, next_cursor = paginate_by_cursor(
+                card_queryset(posts, "rank"), request, ordering=("-rank", "-id")
+            )
+        except InvalidCursor:
+            return error_response("유효하지 않은 cursor 값입니다.")
+
+        return success_response(
+            "게시글 검색 성공", {"results": build_cards(page), "next": next_cursor}
+        )
+
+
+class RecommendedPostListView(APIView):
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request):
+        try:
+            store = request.user.store
+        except Store.DoesNotExist:
+            return error_response(
+                "가게 정보가 등록되어 있지 않습니다.", status_code=404
+            )
+
+        try:
+            limit = int(request.query_params.get("limit", DEFAULT_RECOMMEND_LIMIT))
+        except ValueError:
+            return error_response("limit 값이 올바르지 않습니다.")
+        limit = max(1, min(limit, MAX_RECOMMEND_LIMIT))
+
+        matches = matching_index.recommend(request.user.id, store.category_ids, limit)
+        scores = dict(matches)
+        rows = card_queryset(Post.objects.filter(is_active=True, pk__in=list(scores)))
+        cards = {card["id"]: card for card in build_cards(rows)}
+
+        results = []
+        for post_id, score in matches:
+            if post_id in cards:
+                results.append({**cards[post_id], "match_score": score})
+
+        return success_response("추천 게시글 조회 성공", {"results": results})
+
+
+class TrendingPostListView(APIView):
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request):
+        window = request.query_params.get("window", "24h")
+        if window not in TREND_WINDOWS:
+            return error_response("window 값은 1h, 24h, 7d 중 하나여야 합니다.")
+
+        try:
+            limit = int(request.query_params.get("limit", DEFAULT_TRENDING_LIMIT))
+        except ValueError:
+            return error_response("limit 값이 올바르지 않습니다.")
+        limit = max(1, min(limit, MAX_TRENDING_LIMIT))
+
+        field, half_life = TREND_WINDOWS[window]
+        rows = list(card_queryset(trending_posts(window), f"trend__{field}")[:limit])
+        now = timezone.now()
+        results = [
+            {
+                **card,
+                # 반감기 감쇠를 적용한 최근 제휴 요청 수
+                "trend_score": round(
+                    decayed_amount(row[f"trend__{field}"], now, half_life), 2
+                ),
+            }
+            for card, row in zip(build_cards(rows), rows)
+        ]
+        return success_response("인기 게시글 조회 성공", {"results": results})
+
+
+def post_detail_version(request, pk):
+    # 응답 캐시와 같은 버전 키에 묶어 두어 캐시 적중 시에는 DB 조회도 하지 않는다
+    cache_key = response_cache_key(request)
+    if cache_key is not None:
+        cache_key = f"{cache_key}:etag"
+    version = get_cached_response(cache_key)
+    if version is None:
+        updated_at = (
+            Post.objects.filter(pk=pk, is_active=True)
+            .values_list("updated_at", flat=True)
+            .first()
+        )
+        if updated_at is None:
+            return None, None
+        version = (f"post-{pk}-{updated_at.timestamp():.6f}", updated_at)
+        set_cached_response(cache_key, version)
+    return version
+
+
+def category_list_version(request):
+    # 삭제는 Max(updated_at) 에 드러나지 않아 개수를 같이 넣는다
+    version = PartnershipCategory.objects.aggregate(
+        count=Count("id"), updated_at=Max("updated_at")
+    )
+    updated_at = version["updated_at"]
+    timestamp = f"{updated_at.timestamp():.6f}" if updated_at else "0"
+    return f"categories-{version['count']}-{timestamp}", None
+
+
 class PostDetailView(RetrieveAPIView):
-    queryset = Post.objects.filter(is_active=True)
+    queryset = Post.objects.filter(is_active=True).prefetch_related(
+        Prefetch("images", queryset=PostImage.objects.exclude(status="quarantined"))
+    )
     serializer_class = PostDetailSerializer
     permission_classes = [IsAuthenticated]
     lookup_field = "pk"
 
+    @conditional_get(post_detail_version)
     def get(self, request, *args, **kwargs):
-        post = self.get_object()
-        serializer = self.get_serializer(post)
-        return success_response("게시글 상세 조회 성공", serializer.data)
+        cache_key = response_cache_key(request)
+        data = get_cached_response(cache_key)
+        if data is None:
+            post = self.get_object()
+            data = self.get_serializer(post).data
+            set_cached_response(cache_key, data)
+        return success_response("게시글 상세 조회 성공", data)
+
+    def finalize_response(self, request, response, *args, **kwargs):
+        # 304 재방문도 조회로 센다. DB 에는 post_view_counter 가 모아서 반영한다
+        if request.method == "GET" and response.status_code in (200, 304):
+            post_view_counter.incr(int(kwargs["pk"]))
+        return super().finalize_response(request, response, *args, **kwargs)
 
 
 class PartnershipCategoryListView(ListAPIView):
     queryset = PartnershipCategory.objects.all()
     serializer_class = PartnershipCategorySerializer
 
+    @conditional_get(category_list_version, use_last_modified=False)
     def list(self, request, *args, **kwargs):
         queryset = self.get_queryset()
         serializer = self.get_serializer(queryset, many=True)
@@ -68,40 +274,117 @@ class PostImageUploadPresignedURLView(APIView):
 
         if not filename or not content_type:
             return error_response("filename과 content_type은 필수입니다.")
+        if content_type not in settings.ALLOWED_IMAGE_CONTENT_TYPES:
+            return error_response("허용되지 않은 이미지 형식입니다.")
 
-        ext = filename.split(".")[-1]
-        unique_filename = f"{uuid.uuid4()}.{ext}"
-        s3_key = f"posts/{unique_filename}"
+        s3_key = new_post_image_key(filename)
+
+        try:
+            presigned_post = storage.presign_post(
+                s3_key,
+                content_type,
+                settings.POST_IMAGE_MAX_SIZE,
+                PRESIGNED_URL_EXPIRES,
+            )
+        except (BotoCoreError, ClientError) as e:
+            return error_response(
+                "S3 URL 생성 중 오류 발생",
+                str(e),
+                status.HTTP_500_INTERNAL_SERVER_ERROR,
+            )
+
+        final_image_url = storage.public_url(s3_key)
+
+        return success_response(
+            "게시글 이미지 업로드 presigned URL 생성 성공",
+            {
+                "upload_url": presigned_post["url"],
+                "fields": presigned_post["fields"],
+                "image_url": final_image_url,
+            },
+        )
+
+
+class PostImageBatchUploadView(APIView):
+    permission_classes = [IsAuthenticated]
+
+    def post(self, request):
+        serializer = UploadBatchSerializer(data=request.data)
+        if not serializer.is_valid():
+            return error_response("입력값 오류", serializer.errors)
+
+        try:
+            targets = [
+                build_upload_target(**file)
+                for file in serializer.validated_data["files"]
+            ]
+        except (BotoCoreError, ClientError) as e:
+            return error_response(
+                "S3 URL 생성 중 오류 발생",
+                str(e),
+                status.HTTP_500_INTERNAL_SERVER_ERROR,
+            )
 
-        s3_client = boto3.client(
-            "s3",
-            aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
-            aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
-            region_name=settings.AWS_S3_REGION_NAME,
+        return success_response(
+            "게시글 이미지 일괄 업로드 URL 생성 성공", {"files": targets}
         )
 
+
+class PostImageMultipartCompleteView(APIView):
+    permission_classes = [IsAuthenticated]
+
+    def post(self, request):
+        serializer = MultipartCompleteSerializer(data=request.data)
+        if not serializer.is_valid():
+            return error_response("입력값 오류", serializer.errors)
+
+        data = serializer.validated_data
         try:
-            presigned_url = s3_client.generate_presigned_url(
-                "put_object",
-                Params={
-                    "Bucket": settings.AWS_STORAGE_BUCKET_NAME,
-                    "Key": s3_key,
-                    "ContentType": content_type,
-                },
-                ExpiresIn=300,
+            complete_multipart_upload(data["key"], data["upload_id"], data["parts"])
+        except ClientError as e:
+            return error_response("멀티파트 업로드 완료 처리 실패", str(e))
+        except BotoCoreError as e:
+            return error_response(
+                "멀티파트 업로드 완료 처리 실패",
+                str(e),
+                status.HTTP_500_INTERNAL_SERVER_ERROR,
             )
+
+        return success_response(
+            "멀티파트 업로드 완료", {"image_url": storage.public_url(data["key"])}
+        )
+
+
+class PostImageMultipartResumeView(APIView):
+    permission_classes = [IsAuthenticated]
+
+    def post(self, request):
+        serializer = MultipartResumeSerializer(data=request.data)
+        if not serializer.is_valid():
+            return error_response("입력값 오류", serializer.errors)
+
+        data = serializer.validated_data
+        try:
+            parts = uploaded_parts(data["key"], data["upload_id"])
+            done = {part["part_number"] for part in parts}
+            missing = [
+                number
+                for number in range(1, part_count(data["size"]) + 1)
+                if number not in done
+            ]
+            pending = presign_parts(data["key"], data["upload_id"], missing)
         except ClientError as e:
+            return error_response("멀티파트 업로드 정보를 찾을 수 없습니다.", str(e))
+        except BotoCoreError as e:
             return error_response(
                 "S3 URL 생성 중 오류 발생",
                 str(e),
                 status.HTTP_500_INTERNAL_SERVER_ERROR,
             )
 
-        final_image_url = f"https://{settings.AWS_STORAGE_BUCKET_NAME}.s3.{settings.AWS_S3_REGION_NAME}.amazonaws.com/{s3_key}"
-
         return success_response(
-            "게시글 이미지 업로드 presigned URL 생성 성공",
-            {"upload_url": presigned_url, "image_url": final_image_url},
+            "멀티파트 업로드 이어하기 정보 조회 성공",
+            {"uploaded_parts": parts, "parts": pending},
         )
 
 
@@ -110,8 +393,9 @@ class MyPostListView(APIView):
 
     def get(self, request):
         user = request.user
-        posts = Post.objects.filter(author=user).order_by("-created_at")
-        serializer = PostListSerializer(posts, many=True)
+        posts = card_queryset(Post.objects.filter(author=user)).order_by(
+            "-created_at", "-id"
+        )
         return success_response(
-            message="게시글 목록을 성공적으로 불러왔습니다.", data=serializer.data
+            message="게시글 목록을 성공적으로 불러왔습니다.", data=build_cards(posts)
         )
@@ -0,0 +1,146 @@
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+from rest_framework import serializers
+
+from .models import DashboardSnapshot, Store
+from notifications.models import PartnerRequest
+from posts.cards import build_cards, card_queryset
+from posts.categories import category_registry
+from posts.models import Post
+
+STORE_FIELDS = ("name", "description", "address", "phone_number", "available_time")
+
+_datetime_field = serializers.DateTimeField()
+
+
+def build_store_section(user_id):
+    return (
+        Store.objects.filter(owner_id=user_id)
+        .values(*STORE_FIELDS, "category_ids")
+        .first()
+    )
+
+
+def build_my_posts_section(user_id):
+    rows = card_queryset(Post.objects.filter(author_id=user_id), "is_active")
+    return [
+        {**row, "created_at": _datetime_field.to_representation(row["created_at"])}
+        for row in rows.order_by("-created_at", "-id")
+    ]
+
+
+def build_sent_requests_section(user_id):
+    rows = (
+        PartnerRequest.objects.filter(sender_id=user_id)
+        .order_by("-created_at", "-id")
+        .values(
+            "id",
+            "post_id",
+            "post__title",
+            "post__thumbnail_url",
+            "message",
+            "created_at",
+        )
+    )
+    return [
+        {
+            "id": row["id"],
+            "post": row["post_id"],
+            "post_title": row["post__title"],
+            "post_thumbnail": row["post__thumbnail_url"] or None,
+            "message": row["message"],
+            "created_at": _datetime_field.to_representation(row["created_at"]),
+        }
+        for row in rows
+    ]
+
+
+SECTION_BUILDERS = {
+    "store": build_store_section,
+    "my_posts": build_my_posts_section,
+    "sent_requests": build_sent_requests_section,
+}
+
+
+def refresh_dashboards(user_ids, sections):
+    """
+    이미 스냅샷이 있는 사용자만 sections 를 다시 만든다.
+    스냅샷이 없는 사용자는 처음 조회할 때 만들어진다.
+    """
+    for user_id in set(user_ids):
+        with transaction.atomic():
+            # 동시에 들어온 갱신이 서로 덮어쓰지 않도록 행을 잠그고 읽는다
+            snapshot = (
+                DashboardSnapshot.objects.select_for_update()
+                .filter(user_id=user_id)
+                .first()
+            )
+            if snapshot is None:
+                continue
+            for section in sections:
+                snapshot.data[section] = SECTION_BUILDERS[section](user_id)
+            snapshot.save(update_fields=["data", "updated_at"])
+
+
+def schedule_dashboard_refresh(user_ids, sections):
+    """커밋된 데이터로 만들도록 트랜잭션이 끝난 뒤 갱신한다."""
+    user_ids = [user_id for user_id in user_ids if user_id is not None]
+    if user_ids:
+        transaction.on_commit(lambda: refresh_dashboards(user_ids, sections))
+
+
+def _build_snapshot(user_id):
+    with transaction.atomic():
+        snapshot, _ = DashboardSnapshot.objects.select_for_update().get_or_create(
+            user_id=user_id
+        )
+        snapshot.data = {
+            section: builder(user_id) for section, builder in SECTION_BUILDERS.items()
+        }
+        snapshot.save()
+    return snapshot.data
+
+
+def get_dashboard(user):
+    """
+    스냅샷 한 행만 읽어서 마이페이지 응답을 만든다.
+    없거나 DASHBOARD_SNAPSHOT_MAX_AGE 초보다 오래됐으면(놓친 갱신 대비) 새로 만든다.
+    가게가 없으면 None.
+    """
+    row = (
+        DashboardSnapshot.objects.filter(user=user)
+        .values_list("data", "updated_at")
+        .first()
+    )
+    if row is None or timezone.now() - row[1] > timedelta(
+        seconds=settings.DASHBOARD_SNAPSHOT_MAX_AGE
+    ):
+        data = _build_snapshot(user.pk)
+    else:
+        data = row[0]
+
+    store = data["store"]
+    if store is None:
+        return None
+
+    # 카테고리 이름은 바뀔 수 있어 스냅샷에는 id 만 두고 읽을 때 붙인다
+    store_categories = category_registry.get_many(store["category_ids"])
+    posts = data["my_posts"]
+    return {
+        "store": {
+            **{field: store[field] for field in STORE_FIELDS},
+            "categories": [
+                {"id": pk, "name": store_categories[pk].name}
+                for pk in store["category_ids"]
+                if pk in store_categories
+            ],
+        },
+        "my_posts": [
+            {**card, "is_active": post["is_active"]}
+            for card, post in zip(build_cards(posts), posts)
+        ],
+        "sent_requests": data["sent_requests"],
+    }
@@ -0,0 +1,28 @@
+# Generated by Django 5.2.1 on 2025-06-16 15:42
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("stores", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="store",
+            name="geohash",
+            field=models.CharField(blank=True, db_index=True, max_length=12),
+        ),
+        migrations.AddField(
+            model_name="store",
+            name="latitude",
+            field=models.FloatField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name="store",
+            name="longitude",
+            field=models.FloatField(blank=True, null=True),
+        ),
+    ]
@@ -0,0 +1,46 @@
+# Generated by Django 5.2.1 on 2025-06-18 10:03
+
+import django.contrib.postgres.fields
+import django.contrib.postgres.indexes
+from django.conf import settings
+from django.db import migrations, models
+
+
+def backfill_category_ids(apps, schema_editor):
+    Store = apps.get_model("stores", "Store")
+
+    category_ids = {}
+    rows = Store.categories.through.objects.order_by(
+        "partnershipcategory_id"
+    ).values_list("store_id", "partnershipcategory_id")
+    for store_id, category_id in rows.iterator():
+        category_ids.setdefault(store_id, []).append(category_id)
+
+    for store_id, ids in category_ids.items():
+        Store.objects.filter(pk=store_id).update(category_ids=ids)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("posts", "0005_post_geohash_post_latitude_post_longitude"),
+        ("stores", "0002_store_geohash_store_latitude_store_longitude"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="store",
+            name="category_ids",
+            field=django.contrib.postgres.fields.ArrayField(
+                base_field=models.BigIntegerField(), blank=True, default=list, size=None
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="store",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["category_ids"], name="store_category_ids_gin"
+            ),
+        ),
+        migrations.RunPython(backfill_category_ids, migrations.RunPython.noop),
+    ]
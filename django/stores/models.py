@@ -1,4 +1,6 @@
 from django.db import models
+from django.contrib.postgres.fields import ArrayField
+from django.contrib.postgres.indexes import GinIndex
 from users.models import User
 from posts.models import PartnershipCategory
 
@@ -12,8 +14,37 @@ class Store(models.Model):
     address = models.CharField(max_length=255)
     phone_number = models.CharField(max_length=20)
     available_time = models.CharField(max_length=100)
+    latitude = models.FloatField(null=True, blank=True)
+    longitude = models.FloatField(null=True, blank=True)
+    geohash = models.CharField(max_length=12, blank=True, db_index=True)
     categories = models.ManyToManyField(PartnershipCategory)
+    # 매칭용으로 비정규화한 categories id 목록 (signals 에서 동기화)
+    category_ids = ArrayField(models.BigIntegerField(), default=list, blank=True)
     created_at = models.DateTimeField(auto_now_add=True)
 
+    class Meta:
+        indexes = [
+            GinIndex(fields=["category_ids"], name="store_category_ids_gin"),
+        ]
+
     def __str__(self):
         return self.name
+
+
+class DashboardSnapshot(models.Model):
+    """
+    마이페이지 응답 재료를 미리 만들어 둔 사용자별 스냅샷 (stores/dashboard.py).
+    가게/게시글/제휴 요청이 바뀔 때 해당 사용자의 해당 섹션만 다시 만든다.
+    """
+
+    user = models.OneToOneField(
+        User,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name="dashboard_snapshot",
+    )
+    data = models.JSONField(default=dict)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"Dashboard of {self.user_id}"
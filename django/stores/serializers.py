@@ -1,8 +1,11 @@
 from rest_framework import serializers
 from .models import Store
+from posts.fields import CategoryPrimaryKeyField
 
 
 class StoreCreateSerializer(serializers.ModelSerializer):
+    categories = CategoryPrimaryKeyField(many=True)
+
     class Meta:
         model = Store
         fields = [
@@ -0,0 +1,117 @@
+from django.db.models import F, Func, Value
+from django.db.models.signals import m2m_changed, post_delete, post_save, pre_save
+from django.dispatch import receiver
+
+from .dashboard import schedule_dashboard_refresh
+from .models import Store
+from notifications.models import PartnerRequest
+from posts.events import posts_bulk_updated, row_signals_muted
+from posts.models import PartnershipCategory, Post
+from utils.geocoding import geocode_after_save, geocode_on_address_change
+
+
+def refresh_category_ids(store_ids):
+    category_ids = {store_id: [] for store_id in store_ids}
+    rows = (
+        Store.categories.through.objects.filter(store_id__in=list(store_ids))
+        .order_by("partnershipcategory_id")
+        .values_list("store_id", "partnershipcategory_id")
+    )
+    for store_id, category_id in rows:
+        category_ids[store_id].append(category_id)
+
+    for store_id, ids in category_ids.items():
+        Store.objects.filter(pk=store_id).update(category_ids=ids)
+
+    schedule_dashboard_refresh(
+        Store.objects.filter(pk__in=list(store_ids)).values_list("owner_id", flat=True),
+        ["store"],
+    )
+    return category_ids
+
+
+@receiver(m2m_changed, sender=Store.categories.through)
+def sync_category_ids(sender, instance, action, reverse, pk_set, **kwargs):
+    if action == "pre_clear" and reverse:
+        instance._cleared_store_ids = list(
+            sender.objects.filter(partnershipcategory_id=instance.pk).values_list(
+                "store_id", flat=True
+            )
+        )
+        return
+
+    if action not in ("post_add", "post_remove", "post_clear"):
+        return
+
+    if not reverse:
+        # 이후 instance.save() 가 예전 배열로 덮어쓰지 않도록 인스턴스에도 반영
+        instance.category_ids = refresh_category_ids([instance.pk])[instance.pk]
+    elif action == "post_clear":
+        refresh_category_ids(getattr(instance, "_cleared_store_ids", []))
+    else:
+        refresh_category_ids(pk_set or [])
+
+
+@receiver(post_delete, sender=PartnershipCategory)
+def remove_deleted_category_id(sender, instance, **kwargs):
+    Store.objects.filter(category_ids__contains=[instance.pk]).update(
+        category_ids=Func(
+            F("category_ids"), Value(instance.pk), function="array_remove"
+        )
+    )
+
+
+pre_save.connect(
+    geocode_on_address_change, sender=Store, dispatch_uid="stores.geocode_store"
+)
+post_save.connect(
+    geocode_after_save, sender=Store, dispatch_uid="stores.geocode_store_after_save"
+)
+
+
+# 마이페이지 스냅샷 갱신 (stores/dashboard.py)
+
+
+@receiver(post_save, sender=Store)
+@receiver(post_delete, sender=Store)
+def refresh_dashboard_store(sender, instance, **kwargs):
+    schedule_dashboard_refresh([instance.owner_id], ["store"])
+
+
+def _refresh_dashboard_posts(post_ids):
+    author_ids = Post.objects.filter(pk__in=post_ids).values_list(
+        "author_id", flat=True
+    )
+    schedule_dashboard_refresh(author_ids, ["my_posts"])
+    # 보낸 제휴 요청에 게시글 제목/썸네일이 들어간다
+    sender_ids = PartnerRequest.objects.filter(post_id__in=post_ids).values_list(
+        "sender_id", flat=True
+    )
+    schedule_dashboard_refresh(sender_ids, ["sent_requests"])
+
+
+@receiver(post_save, sender=Post)
+def refresh_dashboard_post_saved(sender, instance, created, **kwargs):
+    if created:
+        schedule_dashboard_refresh([instance.author_id], ["my_posts"])
+    else:
+        _refresh_dashboard_posts([instance.pk])
+
+
+@receiver(post_delete, sender=Post)
+def refresh_dashboard_post_deleted(sender, instance, **kwargs):
+    if row_signals_muted():
+        return
+    # 이 게시글에 달린 제휴 요청은 CASCADE 로 지워지면서 각자 갱신된다
+    schedule_dashboard_refresh([instance.author_id], ["my_posts"])
+
+
+@receiver(posts_bulk_updated)
+def refresh_dashboard_posts_bulk_updated(sender, post_ids, **kwargs):
+    _refresh_dashboard_posts(post_ids)
+
+
+@receiver(post_save, sender=PartnerRequest)
+@receiver(post_delete, sender=PartnerRequest)
+def refresh_dashboard_sent_requests(sender, instance, **kwargs):
+    schedule_dashboard_refresh([instance.sender_id], ["sent_requests"])
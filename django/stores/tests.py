@@ -1 +1,95 @@
-# Create your tests here.
+from django.test import TestCase
+from rest_framework.test import APIClient
+
+from notifications.models import PartnerRequest
+from posts.categories import category_registry
+from posts.models import PartnershipCategory
+from posts.testing import make_post, make_user
+from stores.models import Store
+from users.models import User
+
+
+class StoreCategoryIdsTests(TestCase):
+    def test_save_after_m2m_change_keeps_category_ids(self):
+        owner = User.objects.create_user(
+            "owner", "owner", "owner@example.com", "010-0000-0000"
+        )
+        cafe = PartnershipCategory.objects.create(name="카페")
+        store = Store.objects.create(
+            owner=owner,
+            name="가게",
+            address="",
+            phone_number="010-0000-0000",
+            available_time="10:00-20:00",
+        )
+
+        store.categories.set([cafe])
+        # 같은 인스턴스를 다시 저장해도 예전 category_ids 로 덮어쓰지 않아야 한다
+        store.name = "새 이름"
+        store.save()
+
+        store.refresh_from_db()
+        self.assertEqual(store.category_ids, [cafe.pk])
+
+
+class DashboardTests(TestCase):
+    def setUp(self):
+        category_registry.invalidate()
+        self.addCleanup(category_registry.invalidate)
+        self.owner = make_user("owner")
+        self.cafe = PartnershipCategory.objects.create(name="카페")
+        self.store = Store.objects.create(
+            owner=self.owner,
+            name="가게",
+            address="",
+            phone_number="010-0000-0000",
+            available_time="10:00-20:00",
+        )
+        self.store.categories.set([self.cafe])
+        self.client = APIClient()
+        self.client.force_authenticate(self.owner)
+
+    def dashboard(self):
+        response = self.client.get("/api/v1/stores/mypage/")
+        self.assertEqual(response.status_code, 200)
+        return response.json()["data"]
+
+    def test_reads_a_single_snapshot_row(self):
+        make_post(self.owner)
+        self.dashboard()
+
+        with self.assertNumQueries(1):
+            data = self.dashboard()
+        self.assertEqual(
+            data["store"]["categories"], [{"id": self.cafe.pk, "name": "카페"}]
+        )
+        self.assertEqual(len(data["my_posts"]), 1)
+
+    def test_snapshot_is_refreshed_after_commit(self):
+        self.dashboard()
+        other_post = make_post(make_user("other"), title="브런치 같이 해요")
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.store.name = "새 가게"
+            self.store.save()
+            post = make_post(self.owner, title="제휴 구해요")
+            PartnerRequest.objects.create(
+                sender=self.owner, post=other_post, message="함께해요"
+            )
+
+        data = self.dashboard()
+        self.assertEqual(data["store"]["name"], "새 가게")
+        self.assertEqual([card["id"] for card in data["my_posts"]], [post.pk])
+        self.assertEqual(data["sent_requests"][0]["post_title"], "브런치 같이 해요")
+
+        # 요청을 보낸 게시글의 제목이 바뀌면 보낸 요청 목록도 갱신된다
+        with self.captureOnCommitCallbacks(execute=True):
+            other_post.title = "브런치 제휴"
+            other_post.save()
+        self.assertEqual(
+            self.dashboard()["sent_requests"][0]["post_title"], "브런치 제휴"
+        )
+
+        with self.captureOnCommitCallbacks(execute=True):
+            post.delete()
+        self.assertEqual(self.dashboard()["my_posts"], [])
@@ -1,8 +1,8 @@
 from django.urls import path
-from .views import StoreCreateView, MyStoreView, MyPageView
+from .views import StoreCreateView, MyStoreView, DashboardView
 
 urlpatterns = [
     path("", StoreCreateView.as_view(), name="store-create"),
     path("me/", MyStoreView.as_view(), name="my-store"),
-    path("mypage/", MyPageView.as_view(), name="my-page"),
+    path("mypage/", DashboardView.as_view(), name="my-page"),
 ]
@@ -2,10 +2,9 @@ from rest_framework import generics, permissions
 from rest_framework.views import APIView
 from rest_framework.permissions import IsAuthenticated
 from utils.response import success_response, error_response
+from .dashboard import get_dashboard
 from .models import Store
 from .serializers import StoreCreateSerializer
-from posts.models import Post
-from posts.serializers import PartnershipCategorySerializer
 
 
 class StoreCreateView(generics.CreateAPIView):
@@ -36,52 +35,15 @@ class MyStoreView(APIView):
             )
 
 
-class MyPageView(APIView):
+class DashboardView(APIView):
+    """가게 정보, 내 게시글, 보낸 제휴 요청을 사용자별 스냅샷 한 행에서 읽어 준다."""
+
     permission_classes = [IsAuthenticated]
 
     def get(self, request):
-        try:
-            store = request.user.store
-        except Store.DoesNotExist:
+        data = get_dashboard(request.user)
+        if data is None:
             return error_response(
                 "가게 정보가 등록되어 있지 않습니다.", status_code=404
             )
-
-        # 가게 정보 직렬화
-        store_data = {
-            "name": store.name,
-            "description": store.description,
-            "address": store.address,
-            "phone_number": store.phone_number,
-            "available_time": store.available_time,
-            "categories": PartnershipCategorySerializer(
-                store.categories.all(), many=True
-            ).data,
-        }
-
-        # 내가 작성한 게시글
-        posts = (
-            Post.objects.filter(author=request.user)
-            .prefetch_related("images")
-            .order_by("-created_at")
-        )
-
-        my_posts = []
-        for post in posts:
-            thumbnail = post.images.filter(is_thumbnail=True).first()
-            my_posts.append(
-                {
-                    "id": post.id,
-                    "title": post.title,
-                    "thumbnail_url": thumbnail.image_url if thumbnail else None,
-                    "created_at": post.created_at,
-                }
-            )
-
-        # 제휴 요청 내역 → 아직 구현 전이므로 빈 배열
-        sent_requests = []  # TODO: PartnershipRequest 모델 생성 후 연결
-
-        return success_response(
-            "마이페이지 데이터를 불러왔습니다.",
-            {"store": store_data, "my_posts": my_posts, "sent_requests": sent_requests},
-        )
+        return success_response("마이페이지 데이터를 불러왔습니다.", data)
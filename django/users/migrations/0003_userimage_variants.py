@@ -0,0 +1,18 @@
+# Generated by Django 5.2.1 on 2025-06-27 13:14
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("users", "0002_emailverification"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="userimage",
+            name="variants",
+            field=models.JSONField(blank=True, default=dict),
+        ),
+    ]
@@ -0,0 +1,40 @@
+# Generated by Django 5.2.1 on 2025-06-28 11:02
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("users", "0003_userimage_variants"),
+    ]
+
+    operations = [
+        # 기존 이미지는 가입/작성 시점에 이미 검증을 거쳤다
+        migrations.AddField(
+            model_name="userimage",
+            name="status",
+            field=models.CharField(
+                choices=[
+                    ("pending", "Pending"),
+                    ("verified", "Verified"),
+                    ("quarantined", "Quarantined"),
+                ],
+                default="verified",
+                max_length=20,
+            ),
+        ),
+        migrations.AlterField(
+            model_name="userimage",
+            name="status",
+            field=models.CharField(
+                choices=[
+                    ("pending", "Pending"),
+                    ("verified", "Verified"),
+                    ("quarantined", "Quarantined"),
+                ],
+                default="pending",
+                max_length=20,
+            ),
+        ),
+    ]
@@ -65,8 +65,17 @@ class User(AbstractBaseUser, PermissionsMixin):
 
 
 class UserImage(models.Model):
+    STATUS_CHOICES = (
+        ("pending", "Pending"),
+        ("verified", "Verified"),
+        ("quarantined", "Quarantined"),
+    )
+
     user = models.ForeignKey(User, on_delete=models.CASCADE, related_name="images")
     image_url = models.URLField()
+    variants = models.JSONField(default=dict, blank=True)
+    # 업로드 후 비동기 검증 결과 (tasks.py). quarantined 는 응답에서 제외한다
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default="pending")
     created_at = models.DateTimeField(auto_now_add=True)
 
     def __str__(self):
@@ -3,6 +3,9 @@ from rest_framework.exceptions import AuthenticationFailed
 from rest_framework_simplejwt.serializers import TokenObtainPairSerializer
 
 from users.models import UserImage, EmailVerification
+from users.tasks import process_user_images
+from utils.images import is_upload_url
+from utils.tasks import run_on_commit
 from django.contrib.auth.tokens import default_token_generator
 from django.contrib.auth import get_user_model
 from django.utils import timezone
@@ -12,11 +15,8 @@ from django.core.mail import send_mail
 from django.conf import settings
 
 import random
-import boto3
-from botocore.exceptions import ClientError
 from datetime import timedelta
 from decouple import config
-from urllib.parse import urlparse
 
 User = get_user_model()
 
@@ -54,47 +54,16 @@ class SignupSerializer(serializers.ModelSerializer):
         return value
 
     def validate_image_url(self, value):
-        s3_key = self._extract_s3_key(value)
-
-        s3 = boto3.client(
-            "s3",
-            aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
-            aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
-            region_name=settings.AWS_S3_REGION_NAME,
-        )
-
-        try:
-            response = s3.head_object(
-                Bucket=settings.AWS_STORAGE_BUCKET_NAME, Key=s3_key
-            )
-        except ClientError as e:
-            if e.response["Error"]["Code"] == "404":
-                raise serializers.ValidationError(
-                    "S3에 해당 이미지가 존재하지 않습니다."
-                )
-            raise serializers.ValidationError("S3 검증 중 오류가 발생했습니다.")
-
-        size = response.get("ContentLength", 0)
-        content_type = response.get("ContentType", "")
-
-        if content_type not in ["image/jpeg", "image/png"]:
-            raise serializers.ValidationError(
-                "이미지 형식은 JPEG 또는 PNG만 허용됩니다."
-            )
-
-        if size > 5 * 1024 * 1024:
-            raise serializers.ValidationError("이미지 크기는 5MB를 초과할 수 없습니다.")
-
+        # 크기/형식은 presigned POST 정책과 업로드 후 검증(users/tasks.py)이 맡는다
+        if not is_upload_url(value, settings.AWS_S3_IMAGE_FOLDER):
+            raise serializers.ValidationError("업로드된 이미지 URL이 아닙니다.")
         return value
 
-    def _extract_s3_key(self, url):
-        parsed = urlparse(url)
-        return parsed.path.lstrip("/")
-
     def create(self, validated_data):
         image_url = validated_data.pop("image_url")
         user = User.objects.create_user(**validated_data)
-        UserImage.objects.create(user=user, image_url=image_url)
+        image = UserImage.objects.create(user=user, image_url=image_url)
+        run_on_commit(process_user_images, [image.pk])
         EmailVerification.objects.filter(email=user.email).delete()
         return user
 
@@ -311,8 +280,17 @@ class PresignedURLRequestSerializer(serializers.Serializer):
     filename = serializers.CharField()
     content_type = serializers.CharField()
 
+    def validate_content_type(self, value):
+        if value not in settings.ALLOWED_IMAGE_CONTENT_TYPES:
+            raise serializers.ValidationError(
+                "이미지 형식은 JPEG 또는 PNG만 허용됩니다."
+            )
+        return value
+
 
 class UserMeSerializer(serializers.ModelSerializer):
+    image_url = serializers.SerializerMethodField()
+
     class Meta:
         model = User
         fields = [
@@ -322,4 +300,11 @@ class UserMeSerializer(serializers.ModelSerializer):
             "email",
             "role",
             "is_verified",
+            "image_url",
         ]
+
+    def get_image_url(self, obj):
+        image = obj.images.exclude(status="quarantined").order_by("-created_at").first()
+        if image is None:
+            return None
+        return image.variants.get("card") or image.image_url
@@ -0,0 +1,43 @@
+import logging
+
+from botocore.exceptions import BotoCoreError, ClientError
+from django.conf import settings
+from PIL import Image
+
+from users.models import UserImage
+from utils.images import (
+    UploadRejected,
+    generate_variants,
+    quarantine_upload,
+    verify_upload,
+)
+from utils.storage import storage
+
+logger = logging.getLogger(__name__)
+
+
+def process_user_images(image_ids):
+    for image in UserImage.objects.filter(pk__in=image_ids).only("id", "image_url"):
+        key = storage.key_from_url(image.image_url)
+        try:
+            body = verify_upload(key, settings.PROFILE_IMAGE_MAX_SIZE)
+        except UploadRejected as e:
+            logger.warning("프로필 이미지 격리: UserImage %s (%s)", image.pk, e)
+            quarantine_upload(key)
+            UserImage.objects.filter(pk=image.pk).update(
+                status="quarantined", variants={}
+            )
+            continue
+        except (BotoCoreError, ClientError):
+            logger.exception("프로필 이미지 검증 실패: UserImage %s", image.pk)
+            continue
+
+        try:
+            variants = generate_variants(image.image_url, body)
+        except (BotoCoreError, ClientError, OSError, Image.DecompressionBombError):
+            logger.exception("프로필 이미지 변환 실패: UserImage %s", image.pk)
+            variants = {}
+
+        UserImage.objects.filter(pk=image.pk).update(
+            status="verified", variants=variants
+        )
@@ -1 +1,21 @@
-# Create your tests here.
+from unittest import mock
+
+from botocore.exceptions import ClientError
+from django.test import TestCase
+from rest_framework.test import APIClient
+
+from utils.storage import storage
+
+
+class ProfileImageUploadTests(TestCase):
+    def test_storage_error_returns_500_response(self):
+        error = ClientError({"Error": {"Code": "AccessDenied"}}, "PostObject")
+        with mock.patch.object(storage, "presign_post", side_effect=error):
+            response = APIClient().post(
+                "/api/v1/auth/image-upload/",
+                {"filename": "me.png", "content_type": "image/png"},
+                format="json",
+            )
+
+        self.assertEqual(response.status_code, 500)
+        self.assertFalse(response.json()["success"])
@@ -18,11 +18,11 @@ from users.serializers import (
     UserMeSerializer,
 )
 from utils.response import success_response, error_response
+from utils.storage import storage
 
 from django.conf import settings
-import boto3
 import uuid
-from botocore.exceptions import ClientError
+from botocore.exceptions import BotoCoreError, ClientError
 
 
 class SignupView(APIView):
@@ -116,35 +116,26 @@ class ImageUploadPresignedURLView(APIView):
         unique_filename = f"{uuid.uuid4()}.{ext}"
         s3_key = f"{settings.AWS_S3_IMAGE_FOLDER}/{unique_filename}"
 
-        s3_client = boto3.client(
-            "s3",
-            aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
-            aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
-            region_name=settings.AWS_S3_REGION_NAME,
-        )
-
         try:
-            presigned_url = s3_client.generate_presigned_url(
-                "put_object",
-                Params={
-                    "Bucket": settings.AWS_STORAGE_BUCKET_NAME,
-                    "Key": s3_key,
-                    "ContentType": content_type,
-                },
-                ExpiresIn=300,
+            presigned_post = storage.presign_post(
+                s3_key, content_type, settings.PROFILE_IMAGE_MAX_SIZE, 300
             )
-        except ClientError as e:
+        except (BotoCoreError, ClientError) as e:
             return error_response(
                 "S3 URL 생성 중 오류 발생",
                 str(e),
-                status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             )
 
-        final_image_url = f"https://{settings.AWS_STORAGE_BUCKET_NAME}.s3.{settings.AWS_S3_REGION_NAME}.amazonaws.com/{s3_key}"
+        final_image_url = storage.public_url(s3_key)
 
         return success_response(
             "Presigned URL 생성 성공",
-            {"upload_url": presigned_url, "image_url": final_image_url},
+            {
+                "upload_url": presigned_post["url"],
+                "fields": presigned_post["fields"],
+                "image_url": final_image_url,
+            },
         )
 
 
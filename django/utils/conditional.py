@@ -0,0 +1,41 @@
+from django.utils.cache import patch_cache_control
+from django.utils.decorators import method_decorator
+from django.views.decorators.http import condition
+
+
+def conditional_get(version_func, use_last_modified=True):
+    """
+    version_func(request, *args, **kwargs) 가 돌려주는 (etag, last_modified) 로 조건부 GET 을 처리하는
+    메서드 데코레이터. If-None-Match / If-Modified-Since 가 맞으면 뷰 본문(조회, 직렬화)을 건너뛰고 304 를 준다.
+    version_func 는 직렬화 없이 행 버전만 읽어야 한다. 대상이 없으면 (None, None).
+    """
+
+    def get_version(request, *args, **kwargs):
+        # condition 이 etag/last_modified 함수를 따로 불러도 조회는 한 번만 한다
+        if not hasattr(request, "_resource_version"):
+            request._resource_version = version_func(request, *args, **kwargs)
+        return request._resource_version
+
+    def etag_func(request, *args, **kwargs):
+        return get_version(request, *args, **kwargs)[0]
+
+    def last_modified_func(request, *args, **kwargs):
+        return get_version(request, *args, **kwargs)[1]
+
+    conditional = condition(
+        etag_func=etag_func,
+        last_modified_func=last_modified_func if use_last_modified else None,
+    )
+
+    def decorator(view_func):
+        view_func = conditional(view_func)
+
+        def wrapper(request, *args, **kwargs):
+            response = view_func(request, *args, **kwargs)
+            # 브라우저가 휴리스틱으로 캐시하지 않고 매번 ETag 로 재검증하게 한다
+            patch_cache_control(response, private=True, no_cache=True)
+            return response
+
+        return wrapper
+
+    return method_decorator(decorator)
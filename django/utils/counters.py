@@ -0,0 +1,89 @@
+import atexit
+import logging
+import os
+import threading
+import time
+from collections import Counter
+
+from django.conf import settings
+from django.db import connections
+
+from utils.tasks import run_in_background
+
+logger = logging.getLogger(__name__)
+
+
+class BufferedCounter:
+    """
+    키별 증가량을 프로세스 메모리에 모았다가 flush_func({key: 증가량}) 로 한 번에 내보내는
+    write-behind 카운터. flush_interval 초마다, 또는 쌓인 증가량이 flush_threshold 를 넘으면 내보낸다.
+    요청 수와 상관없이 DB 쓰기는 flush 횟수만큼만 생긴다.
+
+    BACKGROUND_TASKS_ASYNC=False 면 (테스트 등) incr 할 때 바로 내보낸다.
+    """
+
+    def __init__(self, flush_func, flush_interval, flush_threshold):
+        self._flush_func = flush_func
+        self._flush_interval = flush_interval
+        self._flush_threshold = flush_threshold
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._pending = Counter()
+        self._pending_total = 0
+        self._timer_pid = None
+        atexit.register(self.flush)
+
+    def incr(self, key, amount=1):
+        if not settings.BACKGROUND_TASKS_ASYNC:
+            self._flush_func({key: amount})
+            return
+
+        with self._lock:
+            self._pending[key] += amount
+            self._pending_total += amount
+            should_flush = self._pending_total >= self._flush_threshold
+        self._ensure_timer()
+        if should_flush:
+            run_in_background(self.flush)
+
+    def flush(self):
+        # 주기 flush 와 임계치 flush 가 겹치면 하나만 돈다
+        if not self._flush_lock.acquire(blocking=False):
+            return
+        try:
+            with self._lock:
+                pending, self._pending = self._pending, Counter()
+                self._pending_total = 0
+            if not pending:
+                return
+            try:
+                self._flush_func(dict(pending))
+            except Exception:
+                logger.exception("카운터 flush 실패: %d개 키", len(pending))
+                # 다음 flush 때 다시 시도한다
+                with self._lock:
+                    self._pending.update(pending)
+                    self._pending_total += sum(pending.values())
+        finally:
+            self._flush_lock.release()
+
+    def _ensure_timer(self):
+        # fork 된 워커에는 부모의 타이머 스레드가 없어서 프로세스마다 띄운다
+        pid = os.getpid()
+        if self._timer_pid == pid:
+            return
+        with self._lock:
+            if self._timer_pid == pid:
+                return
+            self._timer_pid = pid
+        threading.Thread(
+            target=self._run_timer, name="buffered-counter", daemon=True
+        ).start()
+
+    def _run_timer(self):
+        while True:
+            time.sleep(self._flush_interval)
+            try:
+                self.flush()
+            finally:
+                connections.close_all()
@@ -0,0 +1,45 @@
+import math
+from datetime import datetime, timezone
+
+from django.db.models import F, FloatField, Value
+from django.db.models.functions import Abs, Exp, Greatest, Ln
+
+# 점수 시간축 기준점. λt 가 너무 커지지 않도록 서비스 시작 무렵으로 잡는다
+DECAY_EPOCH = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+# EXP 인자 하한. Postgres 는 e^-745 부근에서 underflow 에러를 내고,
+# e^-700 은 1 에 더해도 이미 반올림으로 사라지는 크기라 결과가 바뀌지 않는다
+MIN_EXPONENT = -700.0
+
+
+def log_weight(amount, at, half_life):
+    """
+    at 시점에 생긴 amount 를 로그 영역 감쇠 점수로 바꾼다: ln(amount) + λ·(at - epoch).
+    점수를 ln(Σ amount·e^{λt}) 로 누적하면 모든 행이 같은 비율로 감쇠하므로
+    주기적으로 점수를 깎지 않아도 점수 순서가 곧 현재 시점의 감쇠 합 순서다.
+    """
+    rate = math.log(2) / half_life
+    return math.log(amount) + rate * (at - DECAY_EPOCH).total_seconds()
+
+
+def decayed_amount(score, at, half_life):
+    """로그 영역 점수를 at 시점의 감쇠 합 Σ amount·2^{-(at - t)/half_life} 으로 되돌린다."""
+    return math.exp(score - log_weight(1, at, half_life))
+
+
+def log_add(field, value):
+    """
+    ln(e^field + e^value) 를 넘침 없이 계산하는 식.
+    GREATEST(a, b) + LN(1 + EXP(GREATEST(-ABS(a - b), MIN_EXPONENT)))
+    두 값 차이가 아주 크면 (마지막 요청 뒤 오래 지난 경우) 작은 쪽은 사실상 0 이 된다.
+    """
+    if not hasattr(value, "resolve_expression"):
+        value = Value(value, output_field=FloatField())
+    exponent = Greatest(
+        -Abs(F(field) - value),
+        Value(MIN_EXPONENT),
+        output_field=FloatField(),
+    )
+    return Greatest(F(field), value) + Ln(
+        Value(1.0) + Exp(exponent), output_field=FloatField()
+    )
@@ -0,0 +1,129 @@
+import json
+import logging
+from functools import lru_cache
+from urllib.error import URLError
+from urllib.parse import urlencode
+from urllib.request import Request, urlopen
+
+from django.conf import settings
+from django.utils.module_loading import import_string
+
+from utils import geohash
+from utils.tasks import run_on_commit
+
+logger = logging.getLogger(__name__)
+
+
+class BaseGeocoder:
+    def geocode(self, address):
+        """주소를 (위도, 경도) 로 변환한다. 찾지 못하면 None."""
+        raise NotImplementedError
+
+
+class KakaoGeocoder(BaseGeocoder):
+    url = "https://dapi.kakao.com/v2/local/search/address.json"
+    timeout = 3
+
+    def __init__(self):
+        self.api_key = settings.KAKAO_REST_API_KEY
+
+    def geocode(self, address):
+        if not self.api_key or not address:
+            return None
+
+        request = Request(
+            f"{self.url}?{urlencode({'query': address})}",
+            headers={"Authorization": f"KakaoAK {self.api_key}"},
+        )
+        try:
+            with urlopen(request, timeout=self.timeout) as response:
+                payload = json.load(response)
+        except (URLError, TimeoutError, ValueError) as e:
+            logger.warning("주소 좌표 변환 실패 (%s): %s", address, e)
+            return None
+
+        try:
+            documents = payload.get("documents") or []
+            if not documents:
+                return None
+            return float(documents[0]["y"]), float(documents[0]["x"])
+        except (AttributeError, KeyError, TypeError, ValueError) as e:
+            logger.warning("주소 좌표 응답 형식 오류 (%s): %s", address, e)
+            return None
+
+
+class OfflineGeocoder(BaseGeocoder):
+    """
+    외부 API 없이 settings.GEOCODER_OFFLINE_ADDRESSES 의
+    {주소: (위도, 경도)} 만 사용하는 테스트/로컬용 geocoder.
+    """
+
+    def __init__(self):
+        self.addresses = getattr(settings, "GEOCODER_OFFLINE_ADDRESSES", {})
+
+    def geocode(self, address):
+        return self.addresses.get(address)
+
+
+@lru_cache(maxsize=None)
+def get_geocoder():
+    return import_string(settings.GEOCODER_BACKEND)()
+
+
+def apply_location(instance):
+    """address 를 좌표로 바꿔 latitude/longitude/geohash 를 채운다 (저장은 하지 않음)."""
+    location = get_geocoder().geocode(instance.address)
+    if location is None:
+        instance.latitude = instance.longitude = None
+        instance.geohash = ""
+        return
+
+    instance.latitude, instance.longitude = location
+    instance.geohash = geohash.encode(*location)
+
+
+def geocode_on_address_change(sender, instance, update_fields=None, **kwargs):
+    """
+    Post/Store pre_save 에 연결한다. 주소가 바뀐 경우에만 예전 좌표를 비우고
+    바뀐 주소를 기억해 두면, geocode_after_save 가 커밋 뒤에 변환한다.
+    """
+    if update_fields is not None and "address" not in update_fields:
+        return
+
+    if not instance._state.adding:
+        old_address = (
+            sender.objects.filter(pk=instance.pk)
+            .values_list("address", flat=True)
+            .first()
+        )
+        # 주소가 그대로면 좌표가 비어 있어도 다시 부르지 않는다.
+        # 실패한 변환은 geocode_addresses 커맨드로 재시도한다
+        if old_address == instance.address:
+            return
+
+    instance.latitude = instance.longitude = None
+    instance.geohash = ""
+    if instance.address:
+        instance._geocode_address = instance.address
+
+
+def geocode_after_save(sender, instance, **kwargs):
+    """
+    Post/Store post_save 에 연결한다.
+    외부 API 호출이 요청 트랜잭션을 붙잡지 않도록 커밋 뒤 백그라운드로 변환한다.
+    """
+    address = instance.__dict__.pop("_geocode_address", None)
+    if address:
+        run_on_commit(geocode_address, sender, instance.pk, address)
+
+
+def geocode_address(model, pk, address):
+    location = get_geocoder().geocode(address)
+    if location is None:
+        return
+    # 그 사이 주소가 또 바뀌었으면 새 주소의 변환 결과를 덮어쓰지 않는다
+    model.objects.filter(pk=pk, address=address).update(
+        latitude=location[0],
+        longitude=location[1],
+        geohash=geohash.encode(*location),
+    )
@@ -0,0 +1,70 @@
+import math
+
+_BASE32 = "0123456789bcdefghjkmnpqrstuvwxyz"
+_METERS_PER_DEGREE = 111_320
+MAX_PRECISION = 12
+
+
+def encode(latitude, longitude, precision=MAX_PRECISION):
+    lat_range = [-90.0, 90.0]
+    lng_range = [-180.0, 180.0]
+    chars = []
+    bits = 0
+    bit_count = 0
+    even = True
+
+    while len(chars) < precision:
+        value, value_range = (longitude, lng_range) if even else (latitude, lat_range)
+        mid = (value_range[0] + value_range[1]) / 2
+        if value >= mid:
+            bits = (bits << 1) | 1
+            value_range[0] = mid
+        else:
+            bits <<= 1
+            value_range[1] = mid
+        even = not even
+
+        bit_count += 1
+        if bit_count == 5:
+            chars.append(_BASE32[bits])
+            bits = 0
+            bit_count = 0
+
+    return "".join(chars)
+
+
+def cell_size(precision):
+    """precision 자리 geohash 셀의 (위도 방향 각도, 경도 방향 각도)."""
+    total_bits = precision * 5
+    lng_bits = (total_bits + 1) // 2
+    lat_bits = total_bits // 2
+    return 180.0 / (1 << lat_bits), 360.0 / (1 << lng_bits)
+
+
+def neighbors(latitude, longitude, precision):
+    """중심 셀을 포함한 주변 3x3 셀의 geohash 목록."""
+    lat_step, lng_step = cell_size(precision)
+    cells = []
+    for d_lat in (-1, 0, 1):
+        for d_lng in (-1, 0, 1):
+            lat = max(-90.0, min(90.0, latitude + d_lat * lat_step))
+            lng = (longitude + d_lng * lng_step + 180.0) % 360.0 - 180.0
+            cell = encode(lat, lng, precision)
+            if cell not in cells:
+                cells.append(cell)
+    return cells
+
+
+def precision_for_radius(radius, latitude):
+    """
+    반경 radius(m) 원이 주변 3x3 셀 안에 들어가는 가장 긴 precision.
+    셀의 짧은 변이 반경 이상이면 된다.
+    """
+    lng_scale = max(math.cos(math.radians(latitude)), 0.01)
+    for precision in range(MAX_PRECISION, 0, -1):
+        lat_step, lng_step = cell_size(precision)
+        height = lat_step * _METERS_PER_DEGREE
+        width = lng_step * _METERS_PER_DEGREE * lng_scale
+        if min(height, width) >= radius:
+            return precision
+    return 1
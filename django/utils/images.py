@@ -0,0 +1,120 @@
+import io
+import logging
+
+from botocore.exceptions import BotoCoreError, ClientError
+from django.conf import settings
+from PIL import Image, ImageOps
+
+from utils.storage import storage
+
+logger = logging.getLogger(__name__)
+
+# 변형 이름 → 긴 변 최대 픽셀
+IMAGE_VARIANT_SIZES = {
+    "card": 480,
+    "detail": 1280,
+}
+WEBP_QUALITY = 80
+JPEG_QUALITY = 85
+VARIANT_CACHE_CONTROL = "public, max-age=31536000, immutable"
+# 실제 파일 포맷 → 허용 Content-Type
+IMAGE_FORMAT_CONTENT_TYPES = {
+    "JPEG": "image/jpeg",
+    "PNG": "image/png",
+    "WEBP": "image/webp",
+}
+
+
+class UploadRejected(Exception):
+    pass
+
+
+def is_upload_url(image_url, prefix):
+    """우리 버킷의 prefix 아래 객체를 가리키는 URL 인지. S3 호출 없이 확인한다."""
+    key = storage.key_from_url(image_url)
+    return key.startswith(prefix) and storage.public_url(key) == image_url
+
+
+def verify_upload(key, max_size):
+    """
+    업로드된 원본의 크기, Content-Type, 실제 이미지 포맷을 확인하고 원본 bytes 를 돌려준다.
+    정책에 맞지 않으면 UploadRejected 를 던진다.
+    """
+    try:
+        head = storage.head(key)
+    except ClientError as e:
+        if e.response["Error"]["Code"] in ("404", "NoSuchKey"):
+            raise UploadRejected("업로드된 파일이 없습니다.")
+        raise
+
+    content_type = head.get("ContentType", "")
+    if content_type not in settings.ALLOWED_IMAGE_CONTENT_TYPES:
+        raise UploadRejected(f"허용되지 않은 Content-Type: {content_type}")
+    if head.get("ContentLength", 0) > max_size:
+        raise UploadRejected("파일 크기 제한 초과")
+
+    body = storage.get_bytes(key)
+    try:
+        with Image.open(io.BytesIO(body)) as image:
+            format = image.format
+            image.verify()
+    except (OSError, SyntaxError, Image.DecompressionBombError):
+        raise UploadRejected("이미지 파일이 아닙니다.")
+
+    # 확장자나 Content-Type 만 바꾼 파일을 걸러낸다
+    if IMAGE_FORMAT_CONTENT_TYPES.get(format) != content_type:
+        raise UploadRejected(f"Content-Type 과 실제 포맷 불일치: {format}")
+    return body
+
+
+def _encode(image, format, quality):
+    buffer = io.BytesIO()
+    image.save(buffer, format=format, quality=quality, optimize=True)
+    return buffer.getvalue()
+
+
+def quarantine_upload(key):
+    """검증에 실패한 원본을 격리한다. 실패해도 호출한 작업은 계속 진행한다."""
+    try:
+        storage.quarantine(key)
+    except ClientError as e:
+        # 객체가 아예 없으면 옮길 것도 없다
+        if e.response["Error"]["Code"] not in ("404", "NoSuchKey"):
+            logger.exception("업로드 격리 실패: %s", key)
+    except BotoCoreError:
+        logger.exception("업로드 격리 실패: %s", key)
+
+
+def generate_variants(image_url, body=None):
+    """
+    원본을 내려받아 IMAGE_VARIANT_SIZES 크기별 WebP/JPEG 를 올리고
+    {"card": ..., "card_jpeg": ..., "detail": ..., "detail_jpeg": ..., "original": ...} 를 돌려준다.
+    이미 받아 둔 원본 bytes 가 있으면 body 로 넘긴다.
+    """
+    key = storage.key_from_url(image_url)
+    if body is None:
+        body = storage.get_bytes(key)
+
+    with Image.open(io.BytesIO(body)) as original:
+        image = ImageOps.exif_transpose(original).convert("RGB")
+
+    stem = key.rsplit(".", 1)[0]
+    variants = {"original": image_url}
+    for name, max_size in IMAGE_VARIANT_SIZES.items():
+        resized = image.copy()
+        resized.thumbnail((max_size, max_size), Image.Resampling.LANCZOS)
+
+        for suffix, format, ext, content_type, quality in (
+            ("", "WEBP", "webp", "image/webp", WEBP_QUALITY),
+            ("_jpeg", "JPEG", "jpg", "image/jpeg", JPEG_QUALITY),
+        ):
+            variant_key = f"variants/{stem}/{name}.{ext}"
+            storage.put_bytes(
+                variant_key,
+                _encode(resized, format, quality),
+                content_type,
+                cache_control=VARIANT_CACHE_CONTROL,
+            )
+            variants[f"{name}{suffix}"] = storage.public_url(variant_key)
+
+    return variants
@@ -0,0 +1,126 @@
+import base64
+import binascii
+import json
+from datetime import timezone as dt_timezone
+
+from django.core.exceptions import FieldDoesNotExist, ValidationError
+from django.db.models import Q
+from django.utils import timezone
+
+DEFAULT_PAGE_SIZE = 20
+MAX_PAGE_SIZE = 50
+
+
+class InvalidCursor(Exception):
+    pass
+
+
+def encode_cursor(values):
+    payload = [v.isoformat() if hasattr(v, "isoformat") else v for v in values]
+    raw = json.dumps(payload, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def cursor_fields(queryset, ordering):
+    """ordering 각 컬럼의 모델 필드 (annotate 한 값이면 output_field)."""
+    fields = []
+    for name in ordering:
+        name = name.lstrip("-")
+        if name in queryset.query.annotations:
+            fields.append(queryset.query.annotations[name].output_field)
+            continue
+        try:
+            fields.append(queryset.model._meta.get_field(name))
+        except FieldDoesNotExist:
+            raise ValueError(f"cursor 로 쓸 수 없는 정렬 컬럼입니다: {name}")
+    return fields
+
+
+def _to_cursor_value(field, value):
+    # JSON 으로 올 수 있는 값만 받는다 (bool 은 int 의 하위 타입이라 따로 막는다)
+    if value is None or isinstance(value, (bool, list, dict)):
+        raise InvalidCursor()
+    try:
+        value = field.to_python(value)
+    except (ValidationError, TypeError, ValueError, OverflowError):
+        raise InvalidCursor()
+    if value is None:
+        raise InvalidCursor()
+    if field.get_internal_type() == "DateTimeField" and timezone.is_naive(value):
+        value = timezone.make_aware(value, dt_timezone.utc)
+    return value
+
+
+def decode_cursor(cursor, fields):
+    """
+    cursor 를 fields (cursor_fields 결과) 순서의 값 리스트로 되돌린다.
+    클라이언트가 조작한 cursor 는 형식이든 값의 타입이든 모두 InvalidCursor 로 바꾼다.
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode()))
+    except (ValueError, TypeError, binascii.Error):
+        raise InvalidCursor()
+
+    if not isinstance(values, list) or len(values) != len(fields):
+        raise InvalidCursor()
+    return [_to_cursor_value(field, value) for field, value in zip(fields, values)]
+
+
+def get_page_size(request):
+    try:
+        page_size = int(request.query_params.get("page_size", DEFAULT_PAGE_SIZE))
+    except (TypeError, ValueError):
+        return DEFAULT_PAGE_SIZE
+    return max(1, min(page_size, MAX_PAGE_SIZE))
+
+
+def keyset_filter(ordering, values):
+    """
+    ordering 기준으로 values 행 "다음"에 오는 행만 남기는 조건.
+    (a, b) 가 (v1, v2) 뒤에 오는 조건을 a <= v1 AND (a < v1 OR (a = v1 AND b < v2))
+    형태로 만들어 첫 컬럼이 인덱스 범위 조건으로 쓰이게 한다.
+    """
+    first = ordering[0]
+    bound = "lte" if first.startswith("-") else "gte"
+    q = Q(**{f"{first.lstrip('-')}__{bound}": values[0]})
+
+    after = Q()
+    for i, field in enumerate(ordering):
+        lookup = "lt" if field.startswith("-") else "gt"
+        condition = Q(**{f"{field.lstrip('-')}__{lookup}": values[i]})
+        for prev_field, prev_value in zip(ordering[:i], values[:i]):
+            condition &= Q(**{prev_field.lstrip("-"): prev_value})
+        after |= condition
+
+    return q & after
+
+
+def _get_value(item, field):
+    if isinstance(item, dict):
+        return item[field]
+    return getattr(item, field)
+
+
+def paginate_by_cursor(queryset, request, ordering=("-created_at", "-id")):
+    """
+    OFFSET 없이 (created_at, id) 같은 정렬 키 기준으로 페이지를 자른다.
+    반환값은 (현재 페이지 항목 리스트, 다음 페이지 cursor 또는 None).
+    """
+    page_size = get_page_size(request)
+    queryset = queryset.order_by(*ordering)
+
+    cursor = request.query_params.get("cursor")
+    if cursor:
+        values = decode_cursor(cursor, cursor_fields(queryset, ordering))
+        queryset = queryset.filter(keyset_filter(ordering, values))
+
+    items = list(queryset[: page_size + 1])
+    next_cursor = None
+    if len(items) > page_size:
+        items = items[:page_size]
+        next_cursor = encode_cursor(
+            [_get_value(items[-1], field.lstrip("-")) for field in ordering]
+        )
+
+    return items, next_cursor
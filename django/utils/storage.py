@@ -0,0 +1,182 @@
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from urllib.parse import urlparse
+
+import boto3
+from botocore.config import Config
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+
+class StorageService:
+    """
+    프로세스 전체에서 하나의 S3 클라이언트(커넥션 풀)를 재사용하는 스토리지 서비스.
+    boto3 클라이언트 생성만 잠금으로 보호하고, 생성된 클라이언트는 스레드 간 공유해도 안전하다.
+    """
+
+    def __init__(self):
+        self._client = None
+        self._client_lock = threading.Lock()
+        self._stats = {}
+        self._stats_lock = threading.Lock()
+
+    @property
+    def bucket(self):
+        return settings.AWS_STORAGE_BUCKET_NAME
+
+    @property
+    def client(self):
+        if self._client is None:
+            with self._client_lock:
+                if self._client is None:
+                    # 기본 세션은 스레드 안전하지 않아서 전용 세션으로 만든다
+                    session = boto3.session.Session(
+                        aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
+                        aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
+                        region_name=settings.AWS_S3_REGION_NAME,
+                    )
+                    self._client = session.client(
+                        "s3",
+                        endpoint_url=settings.AWS_S3_ENDPOINT_URL,
+                        config=Config(
+                            max_pool_connections=settings.AWS_S3_MAX_POOL_CONNECTIONS,
+                            retries={"max_attempts": 3, "mode": "standard"},
+                        ),
+                    )
+        return self._client
+
+    @contextmanager
+    def _timed(self, operation):
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed_ms = (time.perf_counter() - started) * 1000
+            with self._stats_lock:
+                count, total_ms, max_ms = self._stats.get(operation, (0, 0.0, 0.0))
+                self._stats[operation] = (
+                    count + 1,
+                    total_ms + elapsed_ms,
+                    max(max_ms, elapsed_ms),
+                )
+            if elapsed_ms >= settings.STORAGE_SLOW_OPERATION_MS:
+                logger.warning("느린 S3 작업 %s: %.1fms", operation, elapsed_ms)
+            else:
+                logger.debug("S3 %s: %.1fms", operation, elapsed_ms)
+
+    def stats(self):
+        """작업별 {count, avg_ms, max_ms} 누적 지연 시간."""
+        with self._stats_lock:
+            return {
+                operation: {
+                    "count": count,
+                    "avg_ms": round(total_ms / count, 2),
+                    "max_ms": round(max_ms, 2),
+                }
+                for operation, (count, total_ms, max_ms) in self._stats.items()
+            }
+
+    def public_url(self, key):
+        if settings.AWS_S3_ENDPOINT_URL:
+            return f"{settings.AWS_S3_ENDPOINT_URL.rstrip('/')}/{self.bucket}/{key}"
+        return f"https://{self.bucket}.s3.{settings.AWS_S3_REGION_NAME}.amazonaws.com/{key}"
+
+    def key_from_url(self, url):
+        path = urlparse(url).path.lstrip("/")
+        bucket_prefix = f"{self.bucket}/"
+        if settings.AWS_S3_ENDPOINT_URL and path.startswith(bucket_prefix):
+            path = path[len(bucket_prefix) :]
+        return path
+
+    def presign_post(self, key, content_type, max_size, expires_in):
+        """
+        브라우저 form 업로드용 presigned POST.
+        Content-Type 과 크기 제한을 정책 조건으로 걸어 S3 가 업로드 시점에 거부하게 한다.
+        """
+        with self._timed("presign_post"):
+            return self.client.generate_presigned_post(
+                self.bucket,
+                key,
+                Fields={"Content-Type": content_type},
+                Conditions=[
+                    {"Content-Type": content_type},
+                    ["content-length-range", 1, max_size],
+                ],
+                ExpiresIn=expires_in,
+            )
+
+    def presign_upload_part(self, key, upload_id, part_number, expires_in):
+        with self._timed("presign_upload_part"):
+            return self.client.generate_presigned_url(
+                "upload_part",
+                Params={
+                    "Bucket": self.bucket,
+                    "Key": key,
+                    "UploadId": upload_id,
+                    "PartNumber": part_number,
+                },
+                ExpiresIn=expires_in,
+            )
+
+    def create_multipart_upload(self, key, content_type):
+        with self._timed("create_multipart_upload"):
+            return self.client.create_multipart_upload(
+                Bucket=self.bucket, Key=key, ContentType=content_type
+            )["UploadId"]
+
+    def list_parts(self, key, upload_id):
+        parts = []
+        with self._timed("list_parts"):
+            paginator = self.client.get_paginator("list_parts")
+            for page in paginator.paginate(
+                Bucket=self.bucket, Key=key, UploadId=upload_id
+            ):
+                parts.extend(page.get("Parts", []))
+        return parts
+
+    def complete_multipart_upload(self, key, upload_id, parts):
+        with self._timed("complete_multipart_upload"):
+            self.client.complete_multipart_upload(
+                Bucket=self.bucket,
+                Key=key,
+                UploadId=upload_id,
+                MultipartUpload={"Parts": parts},
+            )
+
+    def head(self, key):
+        with self._timed("head_object"):
+            return self.client.head_object(Bucket=self.bucket, Key=key)
+
+    def get_bytes(self, key):
+        with self._timed("get_object"):
+            return self.client.get_object(Bucket=self.bucket, Key=key)["Body"].read()
+
+    def quarantine(self, key):
+        """객체를 QUARANTINE_PREFIX 아래로 옮겨 공개 URL 로 더 이상 서빙되지 않게 한다."""
+        quarantine_key = f"{settings.S3_QUARANTINE_PREFIX}{key}"
+        with self._timed("quarantine"):
+            self.client.copy_object(
+                Bucket=self.bucket,
+                Key=quarantine_key,
+                CopySource={"Bucket": self.bucket, "Key": key},
+            )
+            self.client.delete_object(Bucket=self.bucket, Key=key)
+        return quarantine_key
+
+    def put_bytes(self, key, body, content_type, cache_control=None):
+        params = {
+            "Bucket": self.bucket,
+            "Key": key,
+            "Body": body,
+            "ContentType": content_type,
+        }
+        if cache_control:
+            params["CacheControl"] = cache_control
+        with self._timed("put_object"):
+            self.client.put_object(**params)
+
+
+storage = StorageService()
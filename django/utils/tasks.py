@@ -0,0 +1,48 @@
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.db import connections, transaction
+
+logger = logging.getLogger(__name__)
+
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def _get_executor():
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=settings.BACKGROUND_TASK_WORKERS,
+                thread_name_prefix="background-task",
+            )
+        return _executor
+
+
+def _run(func, args, kwargs):
+    try:
+        func(*args, **kwargs)
+    except Exception:
+        logger.exception("백그라운드 작업 실패: %s", func.__name__)
+    finally:
+        # 작업 스레드가 연 DB 커넥션을 남겨두지 않는다
+        connections.close_all()
+
+
+def run_in_background(func, *args, **kwargs):
+    """
+    요청 처리와 분리해서 func 를 실행한다.
+    BACKGROUND_TASKS_ASYNC=False 면 (테스트 등) 그 자리에서 바로 실행한다.
+    """
+    if not settings.BACKGROUND_TASKS_ASYNC:
+        func(*args, **kwargs)
+        return
+    _get_executor().submit(_run, func, args, kwargs)
+
+
+def run_on_commit(func, *args, **kwargs):
+    """현재 트랜잭션이 커밋된 뒤 백그라운드로 실행한다."""
+    transaction.on_commit(lambda: run_in_background(func, *args, **kwargs))
@@ -326,6 +326,22 @@ const NotificationItem = styled.div`
   }
 `;
 
+const MoreNotificationsButton = styled.button`
+  width: 100%;
+  padding: 0.75rem;
+  background: white;
+  color: #3b82f6;
+  font-weight: 600;
+  font-size: 0.85rem;
+  border: none;
+  border-top: 1px solid #f1f5f9;
+
+  &:disabled {
+    color: #9ca3af;
+    cursor: default;
+  }
+`;
+
 const EmptyNotification = styled.div`
   padding: 2rem 1.5rem;
   text-align: center;
@@ -730,13 +746,42 @@ const StatLabel = styled.div`
   font-weight: 600;
 `;
 
+const LoadMoreButton = styled.button`
+  display: block;
+  margin: 1.5rem auto 0;
+  padding: 0.75rem 2rem;
+  background: rgba(255, 255, 255, 0.9);
+  color: #374151;
+  border: 1px solid #e5e7eb;
+  border-radius: 12px;
+  font-weight: 600;
+  font-size: 0.9rem;
+  transition: all 0.3s cubic-bezier(0.4, 0, 0.2, 1);
+
+  &:hover:not(:disabled) {
+    transform: translateY(-2px);
+    box-shadow: 0 8px 25px rgba(0, 0, 0, 0.1);
+  }
+
+  &:disabled {
+    opacity: 0.6;
+    cursor: default;
+  }
+`;
+
 function Main() {
   const [posts, setPosts] = useState([]);
+  const [nextCursor, setNextCursor] = useState(null);
+  const [loadingMore, setLoadingMore] = useState(false);
   const [categories, setCategories] = useState([]);
   const [selectedCategories, setSelectedCategories] = useState([]);
+  const [nearStore, setNearStore] = useState(false);
+  const [hasStore, setHasStore] = useState(false);
   const [loading, setLoading] = useState(true);
   const [categoriesLoading, setCategoriesLoading] = useState(true);
   const [notifications, setNotifications] = useState([]);
+  const [notificationsNext, setNotificationsNext] = useState(null);
+  const [loadingMoreNotifications, setLoadingMoreNotifications] = useState(false);
   const [unreadCount, setUnreadCount] = useState(0);
   const [showDropdown, setShowDropdown] = useState(false);
   const [error, setError] = useState('');
@@ -752,15 +797,24 @@ function Main() {
   const handleWrite = () => navigate('/post/create');
   const handleMyPage = () => navigate('/mypage');
 
-  const fetchNotifications = async () => {
+  // 알림도 cursor 로 나눠서 오므로 드롭다운을 열 때 첫 페이지만 받고 나머지는 더 보기로 받는다
+  const fetchNotifications = async (cursor = null) => {
     try {
-      const res = await api.get('/notifications/');
-      setNotifications(res.data.data);
+      const res = await api.get('/notifications/', { params: cursor ? { cursor } : {} });
+      const { results, next } = res.data.data;
+      setNotifications(prev => (cursor ? [...prev, ...results] : results));
+      setNotificationsNext(next);
     } catch (err) {
       setError(extractFirstError(err, '알림 목록을 불러오지 못했습니다.'));
     }
   };
 
+  const loadMoreNotifications = async () => {
+    setLoadingMoreNotifications(true);
+    await fetchNotifications(notificationsNext);
+    setLoadingMoreNotifications(false);
+  };
+
   const fetchUnreadCount = async () => {
     try {
       const res = await api.get('/notifications/unread-count/');
@@ -780,6 +834,30 @@ function Main() {
     }
   };
 
+  // 카테고리/주변 필터는 서버에서 걸고, 다음 페이지는 같은 조건에 cursor 만 붙인다
+  const postParams = (cursor) => {
+    const params = {};
+    if (selectedCategories.length > 0) {
+      params.partnership_category = selectedCategories.join(',');
+    }
+    if (nearStore) params.near = 'store';
+    if (cursor) params.cursor = cursor;
+    return params;
+  };
+
+  const loadMorePosts = async () => {
+    setLoadingMore(true);
+    try {
+      const res = await api.get('/posts/', { params: postParams(nextCursor) });
+      setPosts(prev => [...prev, ...res.data.data.results]);
+      setNextCursor(res.data.data.next);
+    } catch (err) {
+      setError(extractFirstError(err, '게시글을 불러오지 못했습니다.'));
+    } finally {
+      setLoadingMore(false);
+    }
+  };
+
   const handleClickOutside = (e) => {
     if (dropdownRef.current && !dropdownRef.current.contains(e.target)) {
       setShowDropdown(false);
@@ -800,14 +878,7 @@ function Main() {
         return;
       }
 
-      try {
-        const postRes = await api.get('/posts/');
-        setPosts(postRes.data.data);
-      } catch (err) {
-        setError(extractFirstError(err, '게시글을 불러오지 못했습니다.'));
-      } finally {
-        setLoading(false);
-      }
+      setHasStore(true);
 
       try {
         const catRes = await api.get('/posts/categories/');
@@ -817,26 +888,109 @@ function Main() {
       } finally {
         setCategoriesLoading(false);
       }
-
-      fetchUnreadCount();
     };
 
     init();
   }, [navigate]);
 
-  const toggleCategory = (categoryName) => {
+  // 안 읽은 알림 수와 새 알림은 스트림으로 받는다.
+  // 티켓을 못 받거나 EventSource 를 쓸 수 없으면 unread-count 조회로 대신한다
+  useEffect(() => {
+    if (!hasStore) return;
+    let source = null;
+    let retryTimer = null;
+    let closed = false;
+
+    const connect = async () => {
+      if (typeof EventSource === 'undefined') {
+        fetchUnreadCount();
+        return;
+      }
+
+      let ticket;
+      try {
+        const res = await api.post('/notifications/stream-ticket/');
+        ticket = res.data.data.ticket;
+      } catch {
+        if (!closed) fetchUnreadCount();
+        return;
+      }
+      if (closed) return;
+
+      source = new EventSource(
+        `${api.defaults.baseURL}/notifications/stream/?ticket=${encodeURIComponent(ticket)}`
+      );
+      source.addEventListener('unread_count', (e) => {
+        setUnreadCount(JSON.parse(e.data).unread_count);
+      });
+      source.addEventListener('notification', (e) => {
+        const notification = JSON.parse(e.data);
+        setNotifications(prev =>
+          prev.some(n => n.id === notification.id) ? prev : [notification, ...prev]
+        );
+      });
+      // 티켓은 1회용이라 브라우저의 자동 재연결은 401 로 끝난다. 닫고 새 티켓으로 다시 연결한다
+      source.onerror = () => {
+        source.close();
+        if (closed) return;
+        fetchUnreadCount();
+        retryTimer = setTimeout(connect, 5000);
+      };
+    };
+
+    connect();
+    return () => {
+      closed = true;
+      clearTimeout(retryTimer);
+      if (source) source.close();
+    };
+  }, [hasStore]);
+
+  useEffect(() => {
+    if (!hasStore) return;
+    let ignore = false;
+
+    const load = async () => {
+      setLoading(true);
+      try {
+        const res = await api.get('/posts/', { params: postParams() });
+        if (ignore) return;
+        setPosts(res.data.data.results);
+        setNextCursor(res.data.data.next);
+      } catch (err) {
+        if (ignore) return;
+        setPosts([]);
+        setNextCursor(null);
+        setError(extractFirstError(err, '게시글을 불러오지 못했습니다.'));
+      } finally {
+        if (!ignore) setLoading(false);
+      }
+    };
+
+    // 필터를 빠르게 바꿔도 마지막 조건의 응답만 반영한다
+    load();
+    return () => {
+      ignore = true;
+    };
+  }, [hasStore, selectedCategories, nearStore]);
+
+  const toggleCategory = (categoryId) => {
+    setError('');
     setSelectedCategories(prev =>
-      prev.includes(categoryName)
-        ? prev.filter(c => c !== categoryName)
-        : [...prev, categoryName]
+      prev.includes(categoryId)
+        ? prev.filter(id => id !== categoryId)
+        : [...prev, categoryId]
     );
   };
 
-  const filteredPosts = selectedCategories.length === 0
-    ? posts
-    : posts.filter(post =>
-        post.partnership_categories.some(cat => selectedCategories.includes(cat.name))
-      );
+  const toggleNearStore = () => {
+    setError('');
+    setNearStore(prev => !prev);
+  };
+
+  const selectedCategoryNames = categories
+    .filter(cat => selectedCategories.includes(cat.id))
+    .map(cat => cat.name);
 
   return (
     <>
@@ -870,12 +1024,24 @@ function Main() {
                           onMouseEnter={() => !n.is_read && markAsRead(n.id)}
                           onClick={() => navigate(`/post/${n.post}`)}
                         >
-                          <p>{n.sender_username}님의 제안: {n.message}</p>
+                          <p>
+                            {n.kind === 'category_match'
+                              ? n.message
+                              : `${n.sender_username}님의 제안: ${n.message}`}
+                          </p>
                           <small>{new Date(n.created_at).toLocaleString()}</small>
                         </NotificationItem>
                       ))
                     )}
                   </NotificationList>
+                  {notificationsNext && (
+                    <MoreNotificationsButton
+                      onClick={loadMoreNotifications}
+                      disabled={loadingMoreNotifications}
+                    >
+                      {loadingMoreNotifications ? '불러오는 중...' : '이전 알림 더 보기'}
+                    </MoreNotificationsButton>
+                  )}
                 </NotificationDropdown>
               )}
               <HeaderButton primary onClick={handleWrite}>제휴 글쓰기</HeaderButton>
@@ -894,15 +1060,15 @@ function Main() {
           <StatsBar>
             <StatCard>
               <StatNumber>{posts.length}</StatNumber>
-              <StatLabel>전체 제휴 제안서</StatLabel>
+              <StatLabel>불러온 제휴 제안서</StatLabel>
             </StatCard>
             <StatCard>
               <StatNumber>{categories.length}</StatNumber>
               <StatLabel>활성 카테고리</StatLabel>
             </StatCard>
             <StatCard>
-              <StatNumber>{filteredPosts.length}</StatNumber>
-              <StatLabel>필터링된 제안서</StatLabel>
+              <StatNumber>{selectedCategories.length}</StatNumber>
+              <StatLabel>선택한 카테고리</StatLabel>
             </StatCard>
           </StatsBar>
 
@@ -916,20 +1082,25 @@ function Main() {
                   {categories.map(cat => (
                     <CategoryButton
                       key={cat.id}
-                      selected={selectedCategories.includes(cat.name)}
-                      onClick={() => toggleCategory(cat.name)}
+                      selected={selectedCategories.includes(cat.id)}
+                      onClick={() => toggleCategory(cat.id)}
                     >
                       {cat.name}
                     </CategoryButton>
                   ))}
+                  <CategoryButton selected={nearStore} onClick={toggleNearStore}>
+                    📍 내 가게 주변
+                  </CategoryButton>
                                 </CategoryGrid>
               )}
             </CategoryContainer>
           </Section>
 
-          {selectedCategories.length > 0 && (
+          {(selectedCategoryNames.length > 0 || nearStore) && (
             <SelectedCategories>
-              <p>선택된 카테고리: {selectedCategories.join(', ')}</p>
+              <p>
+                선택된 조건: {[...selectedCategoryNames, ...(nearStore ? ['내 가게 주변'] : [])].join(', ')}
+              </p>
             </SelectedCategories>
           )}
 
@@ -938,7 +1109,7 @@ function Main() {
             <PostsContainer>
               {loading ? (
                 <LoadingSpinner>제안서를 불러오는 중...</LoadingSpinner>
-              ) : filteredPosts.length === 0 ? (
+              ) : posts.length === 0 ? (
                 <EmptyState>
                   <div className="emoji">📭</div>
                   <h4>등록된 제안서가 없습니다</h4>
@@ -950,10 +1121,10 @@ function Main() {
                 </EmptyState>
               ) : (
                 <PostsList>
-                  {filteredPosts.map((post) => (
+                  {posts.map((post) => (
                     <PostItem key={post.id} onClick={() => navigate(`/post/${post.id}`)}>
                       <PostImage
-                        src={post.images?.[0]?.image_url || defaultImage}
+                        src={post.thumbnail_url || defaultImage}
                         alt="썸네일"
                         onError={(e) => {
                           e.target.src = defaultImage;
@@ -967,6 +1138,11 @@ function Main() {
                   ))}
                 </PostsList>
               )}
+              {!loading && nextCursor && (
+                <LoadMoreButton onClick={loadMorePosts} disabled={loadingMore}>
+                  {loadingMore ? '불러오는 중...' : '더 보기'}
+                </LoadMoreButton>
+              )}
             </PostsContainer>
           </Section>
 
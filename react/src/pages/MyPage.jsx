@@ -653,7 +653,6 @@ function MyPage() {
   const navigate = useNavigate();
   const [store, setStore] = useState(null);
   const [posts, setPosts] = useState([]);
-  const [categories, setCategories] = useState([]);
   const [sentRequests, setSentRequests] = useState([]);
   const [error, setError] = useState('');
   const [loading, setLoading] = useState(true);
@@ -663,39 +662,25 @@ function MyPage() {
 
     const init = async () => {
       try {
-        await api.get('/stores/me/');
-      } catch (err) {
-        if (isMounted) {
-          const msg = extractFirstError(err, '가게 정보 확인 중 오류가 발생했습니다.');
-          setError(msg);
-          navigate('/store/create');
-        }
-        return;
-      }
-
-      try {
-        const [storeRes, postsRes, categoryRes, notiRes] = await Promise.all([
-          api.get('/stores/me/'),
-          api.get('/posts/myposts/'),
-          api.get('/posts/categories/'),
-          api.get('/notifications/mypage/'),
-        ]);
-
+        // 가게, 내 게시글, 보낸 제휴 요청을 한 번에 받는다
+        const res = await api.get('/stores/mypage/');
         if (!isMounted) return;
 
-        setStore(storeRes.data.data);
-        setPosts(Array.isArray(postsRes.data.data) ? postsRes.data.data : []);
-        setCategories(Array.isArray(categoryRes.data.data) ? categoryRes.data.data : []);
+        const dashboard = res.data.data || {};
+        setStore(dashboard.store || null);
+        setPosts(Array.isArray(dashboard.my_posts) ? dashboard.my_posts : []);
         setSentRequests(
-          Array.isArray(notiRes.data.data?.sent_requests)
-            ? notiRes.data.data.sent_requests
-            : []
+          Array.isArray(dashboard.sent_requests) ? dashboard.sent_requests : []
         );
       } catch (err) {
-        if (isMounted) {
-          const msg = extractFirstError(err, '마이페이지 정보를 불러오는 중 오류가 발생했습니다.');
-          setError(msg);
+        if (!isMounted) return;
+        // 가게가 없으면 404
+        if (err.response?.status === 404) {
+          navigate('/store/create');
+          return;
         }
+        const msg = extractFirstError(err, '마이페이지 정보를 불러오는 중 오류가 발생했습니다.');
+        setError(msg);
       } finally {
         if (isMounted) {
           setLoading(false);
@@ -710,11 +695,6 @@ function MyPage() {
     };
   }, [navigate]);
 
-  const getCategoryName = (id) => {
-    const match = categories.find(cat => cat.id === id);
-    return match ? match.name : null;
-  };
-
   if (error) {
     return (
       <>
@@ -787,12 +767,9 @@ function MyPage() {
                       <div className="value">
                         {Array.isArray(store.categories) && store.categories.length > 0 ? (
                           <CategoryTags>
-                            {store.categories.map(id => {
-                              const categoryName = getCategoryName(id);
-                              return categoryName ? (
-                                <CategoryTag key={id}>{categoryName}</CategoryTag>
-                              ) : null;
-                            })}
+                            {store.categories.map(category => (
+                              <CategoryTag key={category.id}>{category.name}</CategoryTag>
+                            ))}
                           </CategoryTags>
                         ) : (
                           '카테고리 없음'
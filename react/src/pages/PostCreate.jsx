@@ -3,6 +3,7 @@ import { useNavigate } from 'react-router-dom';
 import styled, { keyframes, createGlobalStyle } from 'styled-components';
 import api from '../lib/axios';
 import { extractFirstError } from '../utils/error';
+import { uploadMultipart, uploadToPresignedPost } from '../utils/upload';
 
 const GlobalStyle = createGlobalStyle`
   * {
@@ -724,28 +725,29 @@ function PostCreate() {
     setIsSubmitting(true);
 
     try {
-      const uploadUrls = await Promise.all(
-        images.map(file =>
-          api.post('/posts/image-upload/', {
-            filename: file.name,
-            content_type: file.type,
-          })
-        )
-      );
-      const uploadLinks = uploadUrls.map(res => res.data.data);
-
-      await Promise.all(
-        images.map((file, i) =>
-          fetch(uploadLinks[i].upload_url, {
-            method: 'PUT',
-            body: file,
-            headers: { 'Content-Type': file.type },
-          })
-        )
+      // 모든 파일의 업로드 대상을 한 번에 받는다 (큰 파일은 멀티파트)
+      const batchRes = await api.post('/posts/image-upload/batch/', {
+        files: images.map(file => ({
+          filename: file.name,
+          content_type: file.type,
+          size: file.size,
+        })),
+      });
+      const targets = batchRes.data.data.files;
+
+      const imageUrls = await Promise.all(
+        images.map(async (file, i) => {
+          const target = targets[i];
+          if (target.type === 'multipart') {
+            return uploadMultipart(target, file);
+          }
+          await uploadToPresignedPost(target, file);
+          return target.image_url;
+        })
       );
 
-      const imageData = uploadLinks.map((link, index) => ({
-        image_url: link.image_url,
+      const imageData = imageUrls.map((image_url, index) => ({
+        image_url,
         is_thumbnail: index === 0,
       }));
 
@@ -3,6 +3,7 @@ import { useNavigate, Link } from 'react-router-dom';
 import styled, { keyframes, createGlobalStyle } from 'styled-components';
 import api from '../lib/axios';
 import { extractFirstError } from '../utils/error';
+import { uploadToPresignedPost } from '../utils/upload';
 
 const GlobalStyle = createGlobalStyle`
   * {
@@ -897,15 +898,9 @@ function Signup() {
         content_type: file.type,
       });
 
-      const { upload_url, image_url } = res.data.data;
+      const { image_url } = res.data.data;
 
-      await fetch(upload_url, {
-        method: 'PUT',
-        headers: {
-          'Content-Type': file.type,
-        },
-        body: file,
-      });
+      await uploadToPresignedPost(res.data.data, file);
 
       setForm((prev) => ({ ...prev, image_url }));
       setPreviewUrl(image_url);
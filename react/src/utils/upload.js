@@ -0,0 +1,41 @@
+import api from '../lib/axios';
+
+// presigned POST 로 S3 에 바로 올린다. fields 는 정책 서명이라 file 보다 먼저 넣어야 한다
+export const uploadToPresignedPost = async ({ upload_url, fields }, file) => {
+  const formData = new FormData();
+  Object.entries(fields || {}).forEach(([key, value]) => {
+    formData.append(key, value);
+  });
+  formData.append('file', file);
+
+  const res = await fetch(upload_url, { method: 'POST', body: formData });
+  if (!res.ok) {
+    throw new Error('이미지 업로드에 실패했습니다.');
+  }
+};
+
+// 멀티파트 업로드: part_size 만큼 잘라 part 별 presigned URL 로 PUT 하고,
+// 응답의 ETag 를 모아 서버에 완료를 요청한다. 완료된 파일의 image_url 을 돌려준다
+export const uploadMultipart = async ({ key, upload_id, part_size, parts }, file) => {
+  const uploaded = await Promise.all(
+    parts.map(async ({ part_number, upload_url }) => {
+      const start = (part_number - 1) * part_size;
+      const res = await fetch(upload_url, {
+        method: 'PUT',
+        body: file.slice(start, start + part_size),
+      });
+      const etag = res.headers.get('ETag');
+      if (!res.ok || !etag) {
+        throw new Error('이미지 업로드에 실패했습니다.');
+      }
+      return { part_number, etag };
+    })
+  );
+
+  const res = await api.post('/posts/image-upload/multipart/complete/', {
+    key,
+    upload_id,
+    parts: uploaded,
+  });
+  return res.data.data.image_url;
+};